@@ -0,0 +1,103 @@
+# Benchmarks for BridgeConfigWidget against a local stand-in bridge.
+#
+# They need a sourced ROS 2 workspace with this package and fsw_ros2_bridge_msgs
+# built, plus pytest-benchmark. Qt runs offscreen. Run from the package root:
+#
+#     python3 -m pytest benchmark --benchmark-autosave
+#
+# Results are stored under .benchmarks/, compare runs with
+#
+#     python3 -m pytest benchmark --benchmark-compare --benchmark-compare-fail=mean:10%
+
+import importlib.util
+import os
+import threading
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+_required = ['rclpy', 'pytest_benchmark', 'fsw_ros2_bridge_msgs', 'python_qt_binding']
+if any(importlib.util.find_spec(m) is None for m in _required):
+    # nothing to benchmark against outside a ROS 2 workspace
+    collect_ignore_glob = ['test_*.py']
+
+
+@pytest.fixture(scope='session')
+def qt_app():
+    from python_qt_binding.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+@pytest.fixture(scope='session')
+def ros_context():
+    import rclpy
+    rclpy.init()
+    yield
+    rclpy.shutdown()
+
+
+@pytest.fixture(scope='session')
+def config_dir(tmp_path_factory):
+    path = tmp_path_factory.mktemp('configs')
+    return path
+
+
+def write_config(config_dir, num_keys, depth, node_name):
+    from rqt_fsw_bridge_config import yaml_backend
+    from synthetic_config import make_config
+
+    fname = os.path.join(str(config_dir), node_name + '_' + str(num_keys) + '_' + str(depth) +
+                         '.yaml')
+    if not os.path.exists(fname):
+        with open(fname, 'w') as outfile:
+            yaml_backend.dump(make_config(num_keys, depth, node_name=node_name), outfile)
+    return fname
+
+
+@pytest.fixture
+def bridge_setup(qt_app, ros_context, config_dir, request):
+    """
+    Spin a stand-in bridge and a GUI node the way rqt does, in a background executor.
+
+    Parametrize indirectly with (num_keys, depth), the stand-in advertises one file
+    of that size.
+    """
+    import rclpy
+    from rclpy.executors import MultiThreadedExecutor
+    from stand_in_bridge import StandInBridge
+
+    num_keys, depth = getattr(request, 'param', (1000, 3))
+    node_name = 'stand_in_bridge_plugin'
+    fname = write_config(config_dir, num_keys, depth, node_name)
+
+    bridge = StandInBridge([fname], node_name)
+    gui_node = rclpy.create_node('rqt_fsw_bridge_config_benchmark')
+    executor = MultiThreadedExecutor()
+    executor.add_node(bridge)
+    executor.add_node(gui_node)
+    thread = threading.Thread(target=executor.spin, daemon=True)
+    thread.start()
+
+    yield bridge, gui_node, fname
+
+    executor.shutdown()
+    bridge.destroy_node()
+    gui_node.destroy_node()
+    thread.join(timeout=5.0)
+
+
+@pytest.fixture
+def connected_widget(bridge_setup):
+    from helpers import process_events_until
+    from rqt_fsw_bridge_config.bridge_config_widget import BridgeConfigWidget
+
+    bridge, gui_node, fname = bridge_setup
+    widget = BridgeConfigWidget(gui_node, None)
+    widget.start()
+    process_events_until(lambda: widget._connected_to_bridge and
+                         widget._shown_config_path == fname)
+    yield widget
+    widget.shutdown_plugin()
+    widget.deleteLater()
@@ -0,0 +1,18 @@
+import time
+
+from python_qt_binding.QtWidgets import QApplication
+
+
+CONFIG_SIZES = [100, 1000, 10000, 100000]
+CONFIG_DEPTHS = [2, 5]
+
+
+def process_events_until(predicate, timeout_sec=30.0):
+    """Run the Qt event loop until predicate() holds, like the rqt main loop would."""
+    app = QApplication.instance()
+    deadline = time.perf_counter() + timeout_sec
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError('condition not met within ' + str(timeout_sec) + 's')
+        app.processEvents()
+        time.sleep(0.0005)
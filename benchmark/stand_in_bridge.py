@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+
+from fsw_ros2_bridge_msgs.srv import GetPluginInfo
+from rclpy.node import Node
+
+
+class StandInBridge(Node):
+    """
+    Local replacement for the FSW bridge.
+
+    Serves /fsw_ros2_bridge/get_plugin_info and, being a plain rclpy node that
+    accepts undeclared parameters, the standard get/set/list parameter services
+    the widget pushes to. Request counts are kept so benchmarks can check what
+    actually reached the node.
+    """
+
+    def __init__(self, config_files, node_name='stand_in_bridge_plugin'):
+        super(StandInBridge, self).__init__(node_name, allow_undeclared_parameters=True)
+        self.config_files = list(config_files)
+        self.plugin_info_requests = 0
+        self._info_service = self.create_service(
+            GetPluginInfo, '/fsw_ros2_bridge/get_plugin_info', self._get_plugin_info)
+
+    def _get_plugin_info(self, request, response):
+        self.plugin_info_requests += 1
+        response.node_name = self.get_name()
+        response.plugin_name = self.get_name() + '.StandInPlugin'
+        response.config_files = self.config_files
+        return response
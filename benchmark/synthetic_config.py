@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+
+import random
+
+
+def make_config(num_keys, depth=3, node_name='fsw_bridge_plugin', fanout=10, seed=0):
+    """Build a ros__parameters config with num_keys leaves nested depth levels deep."""
+    rng = random.Random(seed)
+    params = {}
+    for i in range(num_keys):
+        container = params
+        for level in range(depth - 1):
+            key = 'group_' + str((i // (fanout ** (depth - 1 - level))) % fanout)
+            container = container.setdefault(key, {})
+        container['param_' + str(i)] = _make_value(rng, i)
+    return {node_name: {'ros__parameters': params}}
+
+
+def _make_value(rng, i):
+    kind = i % 6
+    if kind == 0:
+        return rng.randint(-100000, 100000)
+    if kind == 1:
+        return round(rng.uniform(-1000.0, 1000.0), 6)
+    if kind == 2:
+        return rng.random() < 0.5
+    if kind == 3:
+        return 'value_' + str(rng.randint(0, 1 << 30))
+    if kind == 4:
+        return [rng.randint(0, 255) for _ in range(4)]
+    return '0x' + format(rng.randint(0, 0xffff), '04X')
@@ -0,0 +1,99 @@
+import itertools
+
+from helpers import CONFIG_DEPTHS, CONFIG_SIZES, process_events_until
+import pytest
+
+
+SIZES_AND_DEPTHS = list(itertools.product(CONFIG_SIZES, CONFIG_DEPTHS))
+
+
+def _ids(params):
+    return [str(n) + 'keys-depth' + str(d) for n, d in params]
+
+
+@pytest.mark.benchmark(group='connect')
+def test_connect_time(benchmark, bridge_setup):
+    from rqt_fsw_bridge_config.bridge_config_widget import BridgeConfigWidget
+
+    _, gui_node, fname = bridge_setup
+    widgets = []
+
+    def connect():
+        widget = BridgeConfigWidget(gui_node, None)
+        widgets.append(widget)
+        widget.start()
+        process_events_until(lambda: widget._connected_to_bridge)
+        return widget
+
+    benchmark.pedantic(connect, rounds=5, iterations=1)
+    for widget in widgets:
+        widget.shutdown_plugin()
+        widget.deleteLater()
+
+
+@pytest.mark.benchmark(group='load')
+@pytest.mark.parametrize('bridge_setup', SIZES_AND_DEPTHS, ids=_ids(SIZES_AND_DEPTHS),
+                         indirect=True)
+def test_load_and_build(benchmark, connected_widget):
+    config_file = str(connected_widget.config_file_combo_box.currentText())
+    benchmark.extra_info['keys'] = len(connected_widget.flatten(
+        connected_widget._config_dict[connected_widget._plugin_node_name]['ros__parameters']))
+    benchmark.pedantic(connected_widget.parse_config_file, args=(config_file, True),
+                       rounds=5, iterations=1)
+
+
+@pytest.mark.benchmark(group='convert')
+@pytest.mark.parametrize('bridge_setup', SIZES_AND_DEPTHS, ids=_ids(SIZES_AND_DEPTHS),
+                         indirect=True)
+def test_parameter_conversion(benchmark, connected_widget):
+    from rqt_fsw_bridge_config.parameter_conversion import to_parameters
+
+    flat = connected_widget.flatten(
+        connected_widget._config_dict[connected_widget._plugin_node_name]['ros__parameters'])
+    benchmark.extra_info['keys'] = len(flat)
+    benchmark(to_parameters, flat, connected_widget.parameter_types())
+
+
+@pytest.mark.benchmark(group='edit')
+def test_edit_to_ack_latency(benchmark, connected_widget):
+    widget = connected_widget
+    widget.batch_window_spin_box.setValue(0)
+    widget.update_param_checkbox.blockSignals(True)
+    widget.update_param_checkbox.setChecked(True)
+    widget.update_param_checkbox.blockSignals(False)
+
+    params = widget._config_dict[widget._plugin_node_name]['ros__parameters']
+    name, value = next((k, v) for k, v in widget.flatten(params).items()
+                       if type(v) is int)
+    path = [widget._plugin_node_name, 'ros__parameters'] + name.split('.')
+    index = widget._config_model.index_for_path(path)
+    index = index.sibling(index.row(), 1)
+    finished = []
+    widget._param_batcher.batch_finished.connect(finished.append)
+    counter = itertools.count(value + 1)
+
+    def edit_and_wait():
+        del finished[:]
+        widget._config_model.setData(index, str(next(counter)))
+        process_events_until(lambda: finished)
+        assert all(r.successful for r in finished[0])
+
+    benchmark.pedantic(edit_and_wait, rounds=50, iterations=1)
+
+
+@pytest.mark.benchmark(group='push')
+@pytest.mark.parametrize('bridge_setup', [(n, 3) for n in CONFIG_SIZES],
+                         ids=_ids([(n, 3) for n in CONFIG_SIZES]), indirect=True)
+def test_full_push_throughput(benchmark, connected_widget):
+    widget = connected_widget
+    keys = len(widget.flatten(widget._config_dict[widget._plugin_node_name]['ros__parameters']))
+    benchmark.extra_info['keys'] = keys
+
+    def push_and_wait():
+        # forget what the node holds so every key goes out
+        widget._param_shadow.clear()
+        widget.send_parameters_set_request()
+        process_events_until(lambda: widget._service_caller.in_flight() == 0, 120.0)
+
+    benchmark.pedantic(push_and_wait, rounds=3, iterations=1)
+    assert len(widget._param_shadow) == keys
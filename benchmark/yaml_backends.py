@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+"""
+Compare the yaml backends on synthetic configs of increasing size.
+
+    python3 benchmark/yaml_backends.py [--sizes 100 1000 10000] [--repeat 3]
+
+Every backend must load and dump the same data to byte-identical output, the
+script exits non-zero if it does not.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from rqt_fsw_bridge_config import yaml_backend  # noqa: E402
+from synthetic_config import make_config  # noqa: E402
+
+
+def best_of(repeat, fn, *args):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000, 100000])
+    parser.add_argument('--depth', type=int, default=4)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    backends = yaml_backend.available_backends()
+    print('backends: ' + ', '.join(backends))
+    header = ('keys', 'backend', 'bytes', 'load ms', 'dump ms')
+    print('{:>8} {:>10} {:>10} {:>12} {:>12}'.format(*header))
+    mismatches = 0
+    for size in args.sizes:
+        text = yaml_backend.dump(make_config(size, args.depth), backend='python')
+        reference = None
+        for backend in backends:
+            load_s, data = best_of(args.repeat, yaml_backend.load, text, backend)
+            dump_s, out = best_of(args.repeat, yaml_backend.dump, data, None, backend)
+            if reference is None:
+                reference = (data, out)
+            elif (data, out) != reference:
+                mismatches += 1
+                print('  output of ' + backend + ' differs from ' + backends[0])
+            print('{:>8} {:>10} {:>10} {:>12.1f} {:>12.1f}'.format(
+                size, backend, len(text), load_s * 1000.0, dump_s * 1000.0))
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
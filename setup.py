@@ -33,6 +33,7 @@ setup(
     entry_points={
         'console_scripts': [
             'rqt_fsw_bridge_config = ' + package_name + '.main:main',
+            'fsw_bridge_config = ' + package_name + '.cli:main',
         ],
     },
 )
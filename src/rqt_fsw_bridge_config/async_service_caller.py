@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+from python_qt_binding.QtCore import QObject, QTimer, Signal, Slot
+
+
+class PendingRequest:
+    def __init__(self, request_id, description, future, callback, errback):
+        self.request_id = request_id
+        self.description = description
+        self.future = future
+        self.callback = callback
+        self.errback = errback
+        self.timer = None
+        self.perf_token = None
+        self.counters = {}
+
+
+class AsyncServiceCaller(QObject):
+    """
+    Issue ROS service calls without blocking the Qt GUI thread.
+
+    The futures returned by ``call_async`` are completed by the executor that spins
+    the node (rqt spins the plugin node in its own thread). Completion is handed back
+    to the GUI thread through a queued signal, so callbacks and errbacks always run on
+    the GUI thread and may touch widgets directly.
+    """
+
+    in_flight_changed = Signal(int)
+    request_finished = Signal(int, object)
+    request_failed = Signal(int, str)
+
+    # emitted from the executor thread, delivered on the GUI thread
+    _future_done = Signal(int)
+
+    def __init__(self, parent=None, default_timeout_sec=5.0, perf=None):
+        super(AsyncServiceCaller, self).__init__(parent)
+        self._default_timeout_sec = default_timeout_sec
+        self._perf = perf
+        self._next_request_id = 1
+        self._pending = {}
+        self._future_done.connect(self._on_future_done)
+
+    def in_flight(self):
+        return len(self._pending)
+
+    def is_pending(self, request_id):
+        return request_id in self._pending
+
+    def pending_descriptions(self):
+        return [p.description for p in self._pending.values()]
+
+    def call(self, client, request, callback=None, errback=None, timeout_sec=None,
+             description='', metric=None, counters=None):
+        # metric names the round trip in the perf recorder, counters are added to it
+        request_id = self._next_request_id
+        self._next_request_id += 1
+
+        if client is None or not client.service_is_ready():
+            name = client.srv_name if client is not None else description
+            if self._perf is not None and metric is not None:
+                self._perf.finish(self._perf.start(metric), True, **(counters or {}))
+            # report asynchronously so callers see the same ordering as a real failure
+            QTimer.singleShot(0, lambda: self._report_failure(
+                request_id, errback, 'service ' + str(name) + ' is not available'))
+            return request_id
+
+        future = client.call_async(request)
+        pending = PendingRequest(request_id, description, future, callback, errback)
+        if self._perf is not None and metric is not None:
+            pending.perf_token = self._perf.start(metric)
+            pending.counters = counters or {}
+
+        if timeout_sec is None:
+            timeout_sec = self._default_timeout_sec
+        if timeout_sec > 0:
+            pending.timer = QTimer(self)
+            pending.timer.setSingleShot(True)
+            pending.timer.timeout.connect(
+                lambda: self.cancel(request_id, 'timed out after ' + str(timeout_sec) + 's'))
+            pending.timer.start(int(timeout_sec * 1000))
+
+        self._pending[request_id] = pending
+        self.in_flight_changed.emit(len(self._pending))
+        future.add_done_callback(lambda f: self._future_done.emit(request_id))
+        return request_id
+
+    def cancel(self, request_id, reason='cancelled'):
+        pending = self._pop_pending(request_id)
+        if pending is None:
+            return False
+        self._finish_metric(pending, True)
+        pending.future.cancel()
+        self._report_failure(request_id, pending.errback, reason)
+        return True
+
+    def cancel_all(self, reason='cancelled'):
+        for request_id in list(self._pending.keys()):
+            self.cancel(request_id, reason)
+
+    def _pop_pending(self, request_id):
+        pending = self._pending.pop(request_id, None)
+        if pending is None:
+            return None
+        if pending.timer is not None:
+            pending.timer.stop()
+            pending.timer.deleteLater()
+        self.in_flight_changed.emit(len(self._pending))
+        return pending
+
+    def _finish_metric(self, pending, failed):
+        if pending.perf_token is not None:
+            self._perf.finish(pending.perf_token, failed, **pending.counters)
+
+    def _report_failure(self, request_id, errback, reason):
+        self.request_failed.emit(request_id, reason)
+        if errback is not None:
+            errback(reason)
+
+    @Slot(int)
+    def _on_future_done(self, request_id):
+        # a cancelled or timed out request may still complete later, ignore it
+        pending = self._pop_pending(request_id)
+        if pending is None:
+            return
+
+        future = pending.future
+        if future.cancelled():
+            self._finish_metric(pending, True)
+            self._report_failure(request_id, pending.errback, 'cancelled')
+            return
+        if future.exception() is not None:
+            self._finish_metric(pending, True)
+            self._report_failure(request_id, pending.errback, str(future.exception()))
+            return
+
+        self._finish_metric(pending, False)
+        result = future.result()
+        self.request_finished.emit(request_id, result)
+        if pending.callback is not None:
+            pending.callback(result)
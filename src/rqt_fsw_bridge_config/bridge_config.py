@@ -30,9 +30,11 @@
 # ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import time
+
 from rqt_gui_py.plugin import Plugin
 
-from .bridge_config_widget import BridgeConfigWidget
+from . import startup_profile
 
 
 class BridgeConfig(Plugin):
@@ -41,9 +43,18 @@ class BridgeConfig(Plugin):
         super(BridgeConfig, self).__init__(context)
         self.setObjectName('BridgeConfig')
 
+        started = time.perf_counter()
+        # imported here rather than with this module so its cost shows up in the profile
+        from .bridge_config_widget import BridgeConfigWidget
+        imported = time.perf_counter()
         self._widget = BridgeConfigWidget(context.node, self)
-
+        built = time.perf_counter()
         self._widget.start()
+        if startup_profile.enabled():
+            context.node.get_logger().info(startup_profile.format_phases([
+                ('import widget', (imported - started) * 1000.0),
+                ('build widget', (built - imported) * 1000.0),
+                ('start', (time.perf_counter() - built) * 1000.0)]))
         if context.serial_number() > 1:
             self._widget.setWindowTitle(
                 self._widget.windowTitle() + (' (%d)' % context.serial_number()))
@@ -1,29 +1,66 @@
 #!/usr/bin/env python3
 
 from __future__ import division
-import os
-import ntpath
-import yaml
-import collections
 
-from python_qt_binding import loadUi
-from python_qt_binding.QtCore import QTimer, Slot, Qt
-from python_qt_binding.QtWidgets import QWidget, QTreeWidgetItem
-from PyQt5 import QtCore, QtWidgets
+import copy
+import ntpath
+import os
+import re
 
-import rclpy
 from ament_index_python import get_resource
-from rcl_interfaces.srv import SetParameters, SetParametersAtomically
-from rcl_interfaces.msg import Parameter, ParameterValue, ParameterType
-from fsw_ros2_bridge_msgs.srv import GetPluginInfo
+from PyQt5 import QtCore
+from python_qt_binding import loadUi
+from python_qt_binding.QtCore import Qt, QTimer, Slot
+from python_qt_binding.QtGui import QBrush, QColor
+from python_qt_binding.QtWidgets import QWidget
+from rcl_interfaces.msg import Parameter, ParameterType, ParameterValue
+from rcl_interfaces.srv import GetParameters, ListParameters, SetParameters
+from rcl_interfaces.srv import SetParametersAtomically
 
+from .async_service_caller import AsyncServiceCaller
+from .bridge_fleet import BridgeFleet
+from .bridge_monitor import BridgeMonitor
+from .config_cache import ConfigCache
+from .config_diff import ADDED, agrees, apply_change, CHANGED, count_changes, diff_configs
+from .config_diff import format_changes, path_conflicts, REMOVED, same_text
+from .config_diff import summarize_changes
 from .config_info import ConfigInfo
+from .config_preloader import ConfigPreloader
+from .config_search import ConfigSearchIndex, SEARCH_MODES
+from .config_tree_model import ConfigTreeModel
+from .config_utils import copy_config, flatten, node_parameters
+from .config_watcher import ConfigWatcher
+from .config_writer import ConfigWriter, SaveJob
 from .confirm_dialog import ConfirmDialog
+from .parameter_batcher import ParameterBatcher
+from .parameter_conversion import build_schema, from_parameter_value, parse_list_text
+from .parameter_conversion import parse_parameter_text, to_parameter_value, to_parameters
+from .parameter_conversion import without_nulls
+from .parameter_event_sync import ParameterEventSync
+from .parameter_reader import ParameterReader
+from .parameter_shadow import ParameterShadow
+from .parameter_transfer import ParameterTransfer
+from .perf import PerfRecorder
+from .plugin_info_snapshot import dump_snapshots, load_snapshots
+from .plugin_info_snapshot import snapshot_differences, snapshot_of
+from .request_scheduler import RequestScheduler
 
 
 class BridgeConfigWidget(QWidget):
 
-    _column_names = ['key', 'val']
+    _request_timeout_sec = 5.0
+    _edit_batch_atomic = True
+    _seed_shadow_from_node = True
+    _config_cache_size = 8
+    _max_requests_in_flight = 8
+    _push_chunk_size = 500
+    _push_window = 4
+    _push_max_retries = 2
+    _search_result_limit = 2000
+    _read_back_ttl_sec = 5.0
+    _read_back_batch_size = 1000
+    _change_list_limit = 500
+    _plugin_info_service = '/fsw_ros2_bridge/get_plugin_info'
 
     def __init__(self, node, plugin):
         super(BridgeConfigWidget, self).__init__()
@@ -38,152 +75,567 @@ class BridgeConfigWidget(QWidget):
         self._plugin_node_name = ""
         self._config_file_map = {}
         self._config_dict = {}
+        # timings of the hot paths, shown in the optional performance panel
+        self._perf = PerfRecorder()
+        self._config_cache = ConfigCache(self._config_cache_size)
+        # parameter types captured when the shown file was loaded, {node: {name: type}}
+        self._param_schema = {}
+        self._shown_config_path = None
+        self._seed_pending = False
+        # config path -> {key path: value in the file} for values the node changed since
+        self._live_overrides = {}
+
+        # every advertised config file is parsed in the background right after connecting
+        self._preloader = ConfigPreloader(self._perf, self)
+        # and written back on another thread, only when they have unsaved changes
+        self._writer = ConfigWriter(self._perf, self)
+        self._save_errors = []
+        # files changed by other tools are re-parsed in the background and merged in
+        self._config_watcher = ConfigWatcher(self._perf, self.config_baseline, self)
+        # config path -> {key path: value on disk} for unsaved edits the disk disagrees with
+        self._disk_conflicts = {}
+        # config path -> saves queued or running, disk changes wait for them
+        self._saves_pending = {}
+        # config path -> the newest ConfigCacheEntry seen on disk while a save was pending
+        self._deferred_disk_changes = {}
+
+        # service calls are completed in the background and reported back through signals
+        self._service_caller = AsyncServiceCaller(self, self._request_timeout_sec, self._perf)
+        self._plugin_info_request_id = None
+        # fan-out work (many bridges, many chunks) goes through here to bound what's in flight
+        self._scheduler = RequestScheduler(self._service_caller, self._max_requests_in_flight,
+                                           self)
+        self._transfers = []
+
+        # live edits are coalesced into one request per batch window
+        self._param_batcher = ParameterBatcher(self._service_caller, self.to_parameter_value,
+                                               self, atomic=self._edit_batch_atomic)
+
+        # what we believe the plugin node currently holds, so pushes only send the delta
+        self._param_shadow = ParameterShadow()
+        # and what it really holds, read back on request
+        self._param_reader = ParameterReader(self._scheduler, self, self._read_back_ttl_sec,
+                                             self._read_back_batch_size)
+
+        # changes made on the node by anyone else are applied to the tree as they happen
+        self._event_sync = ParameterEventSync(self._node, self)
+
+        # every bridge instance on the graph, for pushing one config to several of them
+        self._fleet = BridgeFleet(self._node, self._scheduler, self, self._push_chunk_size,
+                                  self._push_window, self._push_max_retries)
+
+        self._config_model = ConfigTreeModel(self)
+        # built for the shown file on its first search, then kept current on edits
+        self._search_index = ConfigSearchIndex()
+        self._search_index_stale = True
 
         # set up UI
-        _, package_path = get_resource('packages', 'rqt_fsw_bridge_config')
-        ui_file = os.path.join(package_path, 'share', 'rqt_fsw_bridge_config',
-                               'resource', 'BridgeConfigWidget.ui')
-        loadUi(ui_file, self)
+        with self._perf.span('startup_load_ui'):
+            _, package_path = get_resource('packages', 'rqt_fsw_bridge_config')
+            ui_file = os.path.join(package_path, 'share', 'rqt_fsw_bridge_config',
+                                   'resource', 'BridgeConfigWidget.ui')
+            loadUi(ui_file, self)
+        # hidden until their checkbox is ticked, so only built then
+        self.perf_panel = None
+        self.fleet_panel = None
         self.setup_ui_connections()
 
-        self._column_index = {}
-        for column_name in self._column_names:
-            self._column_index[column_name] = len(self._column_index)
-
         # bridge info
         self._plugin_info = None
+        # last plugin info of every bridge seen, persisted so startup can show it right away
+        self._plugin_info_snapshots = {}
+        self._shown_snapshot = None
         self._config_info = ConfigInfo(self._node)
 
-        # ros clients
-        self.plugin_info_client =\
-            self._node.create_client(GetPluginInfo, '/fsw_ros2_bridge/get_plugin_info')
+        # ros clients, created in start() so constructing the widget stays cheap
+        self.plugin_info_client = None
+        self._bridge_monitor = None
 
         # need to set these on connection when we know the name of the plugin
         self.plugin_params_client = None
         self.plugin_param_client = None
-
-        # connection timer
-        self._timer_wait_for_bridge = QTimer(self)
-        self._timer_wait_for_bridge.timeout.connect(self.wait_for_plugin)
+        self.plugin_get_params_client = None
+        self.plugin_list_params_client = None
 
     def start(self):
-        self._timer_wait_for_bridge.start(1000)
+        self._node.get_logger().info("Trying to connect to FSW bridge...")
+        with self._perf.span('startup_create_clients'):
+            from fsw_ros2_bridge_msgs.srv import GetPluginInfo
+
+            self.plugin_info_client =\
+                self._node.create_client(GetPluginInfo, self._plugin_info_service)
+            # connection is driven by graph changes, not a blocking poll
+            self._bridge_monitor = BridgeMonitor(self._node, self.plugin_info_client, self)
+            self._bridge_monitor.connected.connect(self.on_bridge_connected)
+            self._bridge_monitor.disconnected.connect(self.on_bridge_disconnected)
+            self._bridge_monitor.restarted.connect(self.on_bridge_restarted)
+        self._bridge_monitor.start()
+
+    def show_perf_panel(self, visible):
+        if self.perf_panel is None:
+            if not visible:
+                return
+            from .perf_panel import PerfPanel
+
+            self.perf_panel = PerfPanel(self._perf, self)
+            self.layout().addWidget(self.perf_panel, 4, 0, 1, 3)
+        self.perf_panel.setVisible(visible)
+
+    def show_fleet_panel(self, visible):
+        if self.fleet_panel is None:
+            if not visible:
+                return
+            from .fleet_panel import FleetPanel
+
+            self.fleet_panel = FleetPanel(self._fleet, self)
+            self.fleet_panel.send_requested.connect(self.send_fleet_pressed)
+            self.layout().addWidget(self.fleet_panel, 5, 0, 1, 3)
+        self.fleet_panel.setVisible(visible)
 
     def shutdown_plugin(self):
-        self._timer_wait_for_bridge.stop()
+        if self._bridge_monitor is not None:
+            self._bridge_monitor.stop()
+        self._event_sync.stop()
+        self._param_batcher.discard()
+        self._preloader.shutdown()
+        self._config_watcher.shutdown()
+        self._writer.shutdown()
+        self.cancel_all_requests('plugin shutting down')
+        self._fleet.shutdown()
 
     def save_settings(self, plugin_settings, instance_settings):
-        header_state = self.config_tree_widget.header().saveState()
+        header_state = self.config_tree_view.header().saveState()
         instance_settings.set_value('tree_widget_header_state', header_state)
+        instance_settings.set_value('batch_window_ms', self.batch_window_spin_box.value())
+        instance_settings.set_value('push_chunk_size', self.push_chunk_size_spin_box.value())
+        instance_settings.set_value('plugin_info_snapshots',
+                                    dump_snapshots(self._plugin_info_snapshots))
 
     def restore_settings(self, pluggin_settings, instance_settings):
         if instance_settings.contains('tree_widget_header_state'):
             header_state = instance_settings.value('tree_widget_header_state')
-            if not self.config_tree_widget.header().restoreState(header_state):
+            if not self.config_tree_view.header().restoreState(header_state):
                 self._logger.warn('rqt_fsw_bridge_config: Failed to restore header state.')
+        if instance_settings.contains('batch_window_ms'):
+            self.batch_window_spin_box.setValue(int(instance_settings.value('batch_window_ms')))
+        if instance_settings.contains('push_chunk_size'):
+            self.push_chunk_size_spin_box.setValue(int(instance_settings.value('push_chunk_size')))
+        if instance_settings.contains('plugin_info_snapshots'):
+            self._plugin_info_snapshots = load_snapshots(
+                instance_settings.value('plugin_info_snapshots'))
+            snapshot = self._plugin_info_snapshots.get(self._plugin_info_service)
+            # the live answer may already be here
+            if snapshot is not None and self._plugin_info is None:
+                self._node.get_logger().info("showing last known plugin info until the "
+                                             "bridge answers")
+                self.show_plugin_info(snapshot)
+                self.bridge_status_label.setText("waiting for bridge (showing last session)")
 
     def setup_ui_connections(self):
         self.save_config_button.clicked.connect(self.save_config_pressed)
+        self.save_all_button.clicked.connect(self.save_all_pressed)
+        self._writer.saved.connect(self.on_config_saved)
+        self._writer.failed.connect(self.on_config_save_failed)
+        self._writer.batch_finished.connect(self.on_save_batch_finished)
         self.reload_config_button.clicked.connect(self.reload_config_pressed)
         self.send_config_button.clicked.connect(self.send_config_pressed)
-        self.config_tree_widget.itemDoubleClicked.connect(self.on_config_item_clicked)
+        self.config_tree_view.setModel(self._config_model)
+        self._config_model.set_value_converter(self.convert_edited_value)
+        self._config_model.edit_rejected.connect(self.on_config_edit_rejected)
         self.config_file_combo_box.currentIndexChanged.connect(self.config_file_selected)
-        self.config_tree_widget.itemChanged.connect(self.on_config_item_changed)
+        self._config_model.value_edited.connect(self.on_config_value_edited)
         self.update_param_checkbox.stateChanged.connect(self.update_checkbox_changed)
+        self.show_perf_checkbox.toggled.connect(self.show_perf_panel)
+        self.show_fleet_checkbox.toggled.connect(self.show_fleet_panel)
+        self._fleet.push_finished.connect(self.on_fleet_push_finished)
+        self._event_sync.parameters_changed.connect(self.on_node_parameters_changed)
+        self.search_mode_combo_box.addItems(SEARCH_MODES)
+        self.search_line_edit.textChanged.connect(self.search_changed)
+        self.search_mode_combo_box.currentIndexChanged.connect(self.search_changed)
+        self.cancel_requests_button.clicked.connect(self.cancel_requests_pressed)
+        self._service_caller.in_flight_changed.connect(self.on_requests_in_flight_changed)
+        self.flush_edits_button.clicked.connect(self._param_batcher.flush)
+        self.batch_window_spin_box.valueChanged.connect(self.batch_window_changed)
+        self._param_batcher.pending_changed.connect(self.on_pending_edits_changed)
+        self._param_batcher.batch_finished.connect(self.on_edit_batch_finished)
+        self._param_batcher.set_window(self.batch_window_spin_box.value())
+        self.push_chunk_size_spin_box.setValue(self._push_chunk_size)
+        self.push_chunk_size_spin_box.valueChanged.connect(self.push_chunk_size_changed)
+        self._preloader.loaded.connect(self.on_config_preloaded)
+        self._preloader.failed.connect(self.on_config_preload_failed)
+        self._preloader.progress.connect(self.on_config_preload_progress)
+        self._config_watcher.changed.connect(self.on_config_file_changed)
+        self._config_watcher.failed.connect(self.on_config_watch_failed)
+        self.read_back_button.clicked.connect(self.read_back_pressed)
+        self._param_reader.progress.connect(self.on_read_back_progress)
+        self._param_reader.finished.connect(self.on_read_back_finished)
+        self._param_reader.failed.connect(self.on_read_back_failed)
 
     def send_plugin_info_request(self):
+        from fsw_ros2_bridge_msgs.srv import GetPluginInfo
+
         req = GetPluginInfo.Request()
-        future = self.plugin_info_client.call_async(req)
-        rclpy.spin_until_future_complete(self._node, future)
-        return future.result()
-
-    def send_parameter_set_request(self, pname, pvalue):
-        self._logger.warn('trying to set \'' + pname + '\' as: ' + str(pvalue))
-        req = SetParametersAtomically.Request()
-        param = Parameter()
-        param.name = pname
-        param.value = self.parse_param_val(pvalue)
-        req.parameters.append(param)
-        future = self.plugin_param_client.call_async(req)
-        rclpy.spin_until_future_complete(self._node, future)
-        return future.result()
-
-    def send_parameters_set_request(self):
-        req = SetParameters.Request()
-        flat_dict = self.flatten(self._config_dict[self._plugin_node_name]["ros__parameters"])
-        self._node.get_logger().info('flat_dict: ' + str(flat_dict))
-        for key, val in flat_dict.items():
+        self._plugin_info_request_id = self._service_caller.call(
+            self.plugin_info_client, req,
+            callback=self.on_plugin_info_received,
+            errback=self.on_plugin_info_failed,
+            description='get_plugin_info', metric='get_plugin_info')
+        return self._plugin_info_request_id
+
+    def parameter_changes(self):
+        # flattened parameters of the shown node and their changes from what it holds,
+        # None and None if the shown file has no section for the node
+        section = self._config_dict.get(self._plugin_node_name)
+        params = section.get("ros__parameters") if isinstance(section, dict) else None
+        if not isinstance(params, dict):
+            self.push_status_label.setText(
+                "nothing to send, no ros__parameters for " + self._plugin_node_name +
+                " in this file")
+            return None, None
+        flat_dict = self.flatten(params)
+        with self._perf.span('diff_parameters', params=len(flat_dict)):
+            changes = self._param_shadow.changes(flat_dict)
+        return flat_dict, changes
+
+    def send_parameters_set_request(self, flat_dict=None, changes=None):
+        if flat_dict is None:
+            flat_dict, changes = self.parameter_changes()
+            if flat_dict is None:
+                return None
+        self._node.get_logger().debug('flat_dict: ' + str(flat_dict))
+        delta = self._param_shadow.delta(flat_dict, changes)
+        if not delta.changed and not delta.removed:
+            self.push_status_label.setText(
+                "nothing to send, " + str(delta.skipped) + " unchanged")
+            return None
+
+        changed, nulls = without_nulls(delta.changed)
+        if nulls:
+            self._logger.warn('not sending ' + str(len(nulls)) + ' parameter(s) that are null '
+                              'in the file: ' + ', '.join(nulls[:10]))
+        with self._perf.span('to_parameters', params=len(changed)):
+            parameters = to_parameters(changed, self.parameter_types())
+        for key in delta.removed:
+            # a NOT_SET value undeclares the parameter on the node
             param = Parameter()
             param.name = key
-            param.value = self.parse_param_val(val)
-            req.parameters.append(param)
-        future = self.plugin_params_client.call_async(req)
-        rclpy.spin_until_future_complete(self._node, future)
-        return future.result()
-
-    def parse_param_val(self, value):
-        pval = ParameterValue()
-        try:
-            int_param = int(value)
-            self._logger.info("parse_param_val() -- could be an int: " + value)
-            pval.integer_value = int_param
-            pval.type = ParameterType.PARAMETER_INTEGER
-            return pval
-        except ValueError:
-            pass
+            param.value = ParameterValue(type=ParameterType.PARAMETER_NOT_SET)
+            parameters.append(param)
 
-        try:
-            float_param = float(value)
-            self._logger.info("parse_param_val() -- could be a float: " + value)
-            pval.double_value = float_param
-            pval.type = ParameterType.PARAMETER_DOUBLE
-            return pval
-        except ValueError:
-            pass
+        if not parameters:
+            self.push_status_label.setText("nothing to send, " + str(len(nulls)) + " null")
+            return None
+        values = dict(changed)
+        values.update((key, None) for key in delta.removed)
+        self.push_status_label.setText(
+            "sending " + str(len(changed)) + " changed, " + str(len(delta.removed)) +
+            " removed, " + str(delta.skipped) + " unchanged skipped" +
+            (", " + str(len(nulls)) + " null skipped" if nulls else ""))
+        # large pushes go out in chunks, failed parameters are retried on their own
+        transfer = ParameterTransfer(
+            self._scheduler, self.plugin_params_client, parameters, self,
+            chunk_size=self._push_chunk_size, window=self._push_window,
+            max_retries=self._push_max_retries, description='parameters',
+            metric='send_parameters_set_request')
+        transfer.progress.connect(self.on_parameter_transfer_progress)
+        transfer.finished.connect(lambda summary: self.on_parameter_transfer_finished(
+            transfer, values, delta.skipped, summary))
+        self._transfers.append(transfer)
+        transfer.start()
+        return transfer
 
-        try:
-            if value.lower() == "true":
-                self._logger.info("parse_param_val() -- could be a bool: " + value)
-                pval.bool_value = True
-                pval.type = ParameterType.PARAMETER_BOOL
-                return pval
-            elif value.lower() == "false":
-                pval.bool_value = False
-                self._logger.info("parse_param_val() -- could be a bool: " + value)
-                pval.type = ParameterType.PARAMETER_BOOL
-                return pval
-        except ValueError:
-            pass
-
-        str_param = value
-        self._logger.info("parse_param_val() -- probably a string: " + value)
-        pval.string_value = str_param
-        pval.type = ParameterType.PARAMETER_STRING
-        return pval
+    def fleet_parameters(self, node_names):
+        # a node's own section of the file if it has one, else the shown plugin node's
+        sections = {str(name).lstrip('/') for name in self._config_dict}
+        default = {}
+        if self._plugin_node_name in self._config_dict:
+            default = self.flatten(self._config_dict[self._plugin_node_name]["ros__parameters"])
+        values_by_node = {}
+        types_by_node = {}
+        for node_name in node_names:
+            if node_name.lstrip('/') in sections:
+                values_by_node[node_name] = node_parameters(
+                    self._config_dict, node_name).get(node_name, {})
+                types_by_node[node_name] = self._param_schema.get(node_name, {})
+            elif default:
+                values_by_node[node_name] = default
+                types_by_node[node_name] = self.parameter_types()
+            else:
+                self._logger.warn('no parameters in this file for ' + node_name)
+        return values_by_node, types_by_node
+
+    def send_fleet_parameters(self, node_names):
+        values_by_node, types_by_node = self.fleet_parameters(node_names)
+        if not self._fleet.push(values_by_node, types_by_node):
+            return False
+        self._logger.info('pushing to ' + str(len(values_by_node)) + ' bridge(s)')
+        return True
+
+    def on_fleet_push_finished(self, results, wall_ms):
+        for r in results.values():
+            if r.failed:
+                self._logger.error('push to ' + r.node_name + ': ' + str(r.failed) +
+                                   ' failed: ' + r.reason)
+        self._logger.info('pushed to ' + str(len(results)) + ' bridge(s) in ' +
+                          '%.0f' % wall_ms + ' ms')
+        if self.fleet_panel is not None:
+            self.fleet_panel.show_results(results, wall_ms)
+
+    def on_parameter_transfer_progress(self, done, total):
+        self.push_status_label.setText("sending: " + str(done) + "/" + str(total) + " answered")
+
+    def on_parameter_transfer_finished(self, transfer, values, skipped, summary):
+        if transfer in self._transfers:
+            self._transfers.remove(transfer)
+        transfer.deleteLater()
+        for name, value in values.items():
+            if name in summary.failures:
+                self._logger.error("failed to set '" + name + "': " + summary.failures[name])
+            elif value is None:
+                self._param_shadow.forget(name)
+            else:
+                self._param_shadow.commit(name, value)
+        self._logger.info('set ' + str(summary.succeeded) + '/' + str(summary.total) +
+                          ' parameters on ' + self._plugin_node_name + ' in ' +
+                          str(summary.chunks) + ' chunk(s), ' + str(summary.retried) +
+                          ' retried, ' + '%.0f' % summary.elapsed_ms + ' ms')
+        self.push_status_label.setText(
+            "sent " + str(summary.succeeded) + ", failed " + str(len(summary.failures)) +
+            ", retried " + str(summary.retried) + ", skipped " + str(skipped) + " unchanged")
+        self.push_status_label.setToolTip("\n".join(
+            name + ": " + reason for name, reason in sorted(summary.failures.items())))
+
+    def maybe_seed_parameter_shadow(self):
+        if self._seed_pending and self._plugin_node_name in self._config_dict:
+            self._seed_pending = False
+            self.seed_parameter_shadow()
+
+    def seed_parameter_shadow(self):
+        if self._plugin_node_name not in self._config_dict:
+            return None
+        names = list(self.flatten(
+            self._config_dict[self._plugin_node_name]["ros__parameters"]).keys())
+        req = GetParameters.Request()
+        req.names = names
+        return self._service_caller.call(
+            self.plugin_get_params_client, req,
+            callback=lambda result: self.on_shadow_seed_result(names, result),
+            errback=lambda reason: self._logger.warn(
+                'could not read parameters from node: ' + reason),
+            description='get ' + str(len(names)) + ' parameters',
+            metric='get_parameters', counters={'params': len(names)})
+
+    def on_shadow_seed_result(self, names, result):
+        self._param_shadow.seed(
+            {name: from_parameter_value(v) for name, v in zip(names, result.values)})
+        self._logger.info('read ' + str(len(self._param_shadow)) + ' parameters from ' +
+                          self._plugin_node_name)
+
+    def parameter_types(self):
+        return self._param_schema.get(self._plugin_node_name, {})
+
+    def to_parameter_value(self, name, value):
+        return to_parameter_value(value, self.parameter_types().get(name))
+
+    def find_parameter(self, name):
+        # yaml keys may be ints or bools, parameter names only carry their string form
+        path = [self._plugin_node_name, "ros__parameters"]
+        value = self._config_dict.get(self._plugin_node_name)
+        value = value.get("ros__parameters") if isinstance(value, dict) else None
+        for part in name.split('.'):
+            if not isinstance(value, dict):
+                return None, None
+            if part not in value:
+                part = next((k for k in value if str(k) == part), None)
+                if part is None:
+                    return None, None
+            path.append(part)
+            value = value[part]
+        return tuple(path), value
+
+    def on_node_parameters_changed(self, changes):
+        overrides = self._live_overrides.setdefault(self._shown_config_path, {})
+        updated = 0
+        for name, value in changes.items():
+            if value is None:
+                self._param_shadow.forget(name)
+                continue
+            path, current = self.find_parameter(name)
+            if path is None and name not in self._param_shadow:
+                # not in the file, like use_sim_time, so pushes never touch it
+                continue
+            # what the node holds now, not something pushed from the file
+            self._param_shadow.seed({name: value})
+            if path is None or isinstance(current, dict):
+                continue
+            if self._param_reader.cached() is not None:
+                self._config_model.set_live_value(path, value)
+            if self._param_batcher.is_pending(name) or str(current) == str(value):
+                # a pending local edit is about to overwrite it anyway
+                continue
+            file_value = overrides.setdefault(path, current)
+            if str(file_value) == str(value):
+                del overrides[path]
+                self._config_model.set_highlighted(path, None)
+            else:
+                self._config_model.set_highlighted(
+                    path, "changed on node, file has: " + str(file_value))
+            self._config_model.set_value_at(path, value)
+            self._search_index.update(path, value)
+            updated += 1
+        self._param_reader.update(changes)
+        if updated:
+            self._config_cache.mark_dirty(self._shown_config_path)
+            self._logger.debug('applied ' + str(updated) + ' parameter change(s) from ' +
+                               self._plugin_node_name)
+
+    def read_back_parameters(self, force=False):
+        section = self._config_dict.get(self._plugin_node_name)
+        params = section.get("ros__parameters") if isinstance(section, dict) else None
+        groups = [str(k) for k, v in params.items() if isinstance(v, dict)] \
+            if isinstance(params, dict) else []
+        if self._param_reader.is_reading():
+            return
+        # fresh cached values are reported right away, replacing this
+        self.read_back_status_label.setText("reading parameters from node...")
+        self._param_reader.read(groups, force)
+
+    def on_read_back_progress(self, done, total):
+        self.read_back_status_label.setText(
+            "reading parameters from node: " + str(done) + "/" + str(total))
+
+    def on_read_back_finished(self, values):
+        # the whole node is read, but only the file's parameters are compared on Send
+        section = self._config_dict.get(self._plugin_node_name)
+        params = section.get("ros__parameters") if isinstance(section, dict) else None
+        flat_dict = self.flatten(params) if isinstance(params, dict) else {}
+        self._param_shadow.seed({name: value for name, value in values.items()
+                                 if name in flat_dict or name in self._param_shadow})
+        changes = self.show_live_values(values)
+        counts = count_changes(changes)
+        age = self._param_reader.age_sec() or 0.0
+        self.read_back_status_label.setText(
+            "read " + str(len(values)) + " from node (" + '%.0f' % age + " s ago): " +
+            str(counts[CHANGED]) + " differ from file, " + str(counts[REMOVED]) +
+            " only on node, " + str(counts[ADDED]) + " only in file")
+        self.read_back_status_label.setToolTip(
+            "\n".join(format_changes(changes, self._change_list_limit)))
+
+    def on_read_back_failed(self, reason):
+        self._logger.error('reading parameters from node failed: ' + reason)
+        self.read_back_status_label.setText("read back failed: " + reason)
+
+    def show_live_values(self, values):
+        # config_diff changes from the node's values to the file's
+        section = self._config_dict.get(self._plugin_node_name)
+        params = section.get("ros__parameters") if isinstance(section, dict) else None
+        file_values = flatten(params) if isinstance(params, dict) else {}
+        live = {}
+        with self._perf.span('show_live_values', params=len(values)):
+            changes = diff_configs(values, file_values, same_text)
+            for name, value in values.items():
+                path, current = self.find_parameter(name)
+                if path is not None and not isinstance(current, dict):
+                    live[path] = value
+            self._config_model.set_live_values(live)
+        return changes
+
+    def convert_edited_value(self, path, text):
+        ptype = None
+        if len(path) > 2 and path[1] == "ros__parameters":
+            node_types = self._param_schema.get(str(path[0]), {})
+            ptype = node_types.get(".".join(str(k) for k in path[2:]))
+        if ptype == ParameterType.PARAMETER_STRING and \
+                isinstance(self.value_at(path), list):
+            # a list of mixed types, edited as a list like any other
+            return parse_list_text(text)
+        return parse_parameter_text(text, ptype)
+
+    def value_at(self, path):
+        value = self._config_model.config()
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        return value
 
     @Slot()
-    def wait_for_plugin(self):
-        if (not self._connected_to_bridge):
-            self._node.get_logger().info("Trying to connect to FSW bridge...")
-            if self.plugin_info_client.wait_for_service(timeout_sec=1.0):
-                if self._plugin_info is None:
-                    self._plugin_info = self.send_plugin_info_request()
-                    self._plugin_node_name = self._plugin_info.node_name
-                    self._plugin_name = self._plugin_info.plugin_name
-                    self._plugin_pkg_name = self._plugin_name.split('.')[0]
-                    self.parse_config_files(self._plugin_info.config_files)
-                    self.setup_parameter_clients()
+    def on_bridge_connected(self):
+        self.bridge_status_label.setText("connected")
+        self.bridge_status_label.setToolTip("")
+        if self._plugin_info is None and not (
+                self._plugin_info_request_id is not None and
+                self._service_caller.is_pending(self._plugin_info_request_id)):
+            self.send_plugin_info_request()
 
-                    if self._config_file_map:
-                        self.parse_config_file(str(self.config_file_combo_box.currentText()))
+    @Slot()
+    def on_bridge_disconnected(self):
+        self._node.get_logger().warn("lost connection to FSW bridge")
+        self.bridge_status_label.setText("disconnected, waiting for bridge")
+        self.reset_bridge_connection()
+
+    @Slot()
+    def on_bridge_restarted(self):
+        self._node.get_logger().warn("FSW bridge restarted, refreshing plugin info")
+        self.reset_bridge_connection()
+        self.on_bridge_connected()
+
+    def reset_bridge_connection(self):
+        self._param_batcher.discard()
+        self._event_sync.stop()
+        self.cancel_all_requests('bridge connection reset')
+        self._param_shadow.clear()
+        self._param_reader.invalidate()
+        self._config_model.set_live_values({})
+        self._plugin_info = None
+        self._connected_to_bridge = False
+
+    def on_plugin_info_received(self, plugin_info):
+        self._plugin_info_request_id = None
+        if self._connected_to_bridge:
+            return
+        self._plugin_info = plugin_info
+        snapshot = snapshot_of(plugin_info)
+        if self._shown_snapshot is not None and self._shown_snapshot != snapshot:
+            differences = snapshot_differences(self._shown_snapshot, snapshot)
+            self._node.get_logger().warn(
+                "plugin info changed since it was last seen: " + "; ".join(differences))
+            self.bridge_status_label.setText("connected, plugin info changed")
+            self.bridge_status_label.setToolTip("\n".join(differences))
+        self._plugin_info_snapshots[self._plugin_info_service] = snapshot
+        self._param_shadow.clear()
+        self._seed_pending = self._seed_shadow_from_node
+        self.show_plugin_info(snapshot)
+        # on a reconnect the current file may already be shown
+        self.maybe_seed_parameter_shadow()
 
-                    self._node.get_logger().info("setting plugin: " + self._plugin_name)
-                    self._node.get_logger().info("setting plugin pkg: " + self._plugin_pkg_name)
+        self._connected_to_bridge = True
+        self._bridge_monitor.watch_node(self._plugin_node_name)
+        self._event_sync.watch_node(self._plugin_node_name)
 
-                    self.plugin_pkg_label.setText(self._plugin_pkg_name)
-                    self.plugin_name_label.setText(self._plugin_name)
+    def show_plugin_info(self, snapshot):
+        if snapshot == self._shown_snapshot:
+            # same node and files as shown already (snapshot or reconnect), nothing to redo
+            return
+        if self._plugin_node_name != snapshot.node_name:
+            self.destroy_parameter_clients()
+        self._plugin_node_name = snapshot.node_name
+        self._plugin_name = snapshot.plugin_name
+        self._plugin_pkg_name = self._plugin_name.split('.')[0]
+        self.setup_parameter_clients()
+        self.parse_config_files(snapshot.config_files)
+
+        self._node.get_logger().info("setting plugin: " + self._plugin_name)
+        self._node.get_logger().info("setting plugin pkg: " + self._plugin_pkg_name)
 
-                    self._connected_to_bridge = True
+        self.plugin_pkg_label.setText(self._plugin_pkg_name)
+        self.plugin_name_label.setText(self._plugin_name)
+        self._shown_snapshot = snapshot
+
+    def on_plugin_info_failed(self, reason):
+        self._plugin_info_request_id = None
+        self._node.get_logger().warn("get_plugin_info request failed: " + reason)
+        if self._bridge_monitor is not None and self._bridge_monitor.is_connected():
+            # the service is there but did not answer, ask again after a while
+            QTimer.singleShot(int(self._request_timeout_sec * 1000), self.on_bridge_connected)
 
     def setup_parameter_clients(self):
         if self.plugin_params_client is None:
@@ -196,72 +648,203 @@ class BridgeConfigWidget(QWidget):
             self._node.get_logger().info("setting up param client: " + n)
             self.plugin_param_client = self._node.create_client(SetParametersAtomically, n)
 
-    def build_config_tree(self, item, value):
-        item.setExpanded(True)
-        if type(value) is dict:
-            for key, val in sorted(value.items()):
-                child = QTreeWidgetItem()
-                child.setText(self._column_index['key'], str(key))
-                item.addChild(child)
-                self.build_config_tree(child, val)
-        else:
-            item.setText(self._column_index['val'], str(value))
+        if self.plugin_get_params_client is None:
+            n = '/' + self._plugin_node_name + '/get_parameters'
+            self._node.get_logger().info("setting up get params client: " + n)
+            self.plugin_get_params_client = self._node.create_client(GetParameters, n)
+
+        if self.plugin_list_params_client is None:
+            n = '/' + self._plugin_node_name + '/list_parameters'
+            self._node.get_logger().info("setting up list params client: " + n)
+            self.plugin_list_params_client = self._node.create_client(ListParameters, n)
+
+        self._param_batcher.set_clients(self.plugin_params_client, self.plugin_param_client)
+        self._param_reader.set_clients(self.plugin_list_params_client,
+                                       self.plugin_get_params_client)
+
+    def destroy_parameter_clients(self):
+        for client in (self.plugin_params_client, self.plugin_param_client,
+                       self.plugin_get_params_client, self.plugin_list_params_client):
+            if client is not None:
+                self._node.destroy_client(client)
+        self.plugin_params_client = None
+        self.plugin_param_client = None
+        self.plugin_get_params_client = None
+        self.plugin_list_params_client = None
 
-    def parse_config_file(self, config_file):
+    def parse_config_file(self, config_file, force=False):
+        if config_file not in self._config_file_map:
+            return
         self._node.get_logger().info("parsing config file...")
         fname = self._config_file_map[config_file]
+        # loaded with the file by now, see yaml_backend
+        import yaml
+
         try:
-            with open(fname, "r") as infile:
-                self._config_dict = yaml.safe_load(infile)
+            with self._perf.span('parse_config_file'):
+                entry = self._config_cache.get(fname, force)
         except FileNotFoundError:
             self._node.get_logger().error("Couldnt open " + fname + " for editing")
             return
-        self.config_tree_widget.clear()
-        self.build_config_tree(self.config_tree_widget.invisibleRootItem(), self._config_dict)
+        except (yaml.YAMLError, ValueError) as e:
+            self._node.get_logger().error("Couldnt parse " + fname + ": " + str(e))
+            return
+        if entry.stale:
+            self._node.get_logger().warn(
+                fname + " changed on disk, keeping unsaved edits (reload to discard them)")
+        if entry.schema is None:
+            entry.schema = build_schema(entry.data)
+        if force:
+            self._live_overrides.pop(fname, None)
+            self._disk_conflicts.pop(fname, None)
+        self._config_dict = entry.data
+        self._param_schema = entry.schema
+        self._shown_config_path = fname
+        self._search_index_stale = True
+        with self._perf.span('build_config_tree'):
+            self._config_model.set_config(self._config_dict)
+            for path, file_value in self._live_overrides.get(fname, {}).items():
+                self._config_model.set_highlighted(
+                    path, "changed on node, file has: " + str(file_value))
+            for path, disk_value in self._disk_conflicts.get(fname, {}).items():
+                self._config_model.set_highlighted(path, self.conflict_tooltip(disk_value))
+            # node name and ros__parameters, deeper levels are fetched when expanded
+            self.config_tree_view.expandToDepth(1)
+
+        if self.search_line_edit.text():
+            self.search_changed()
+        if self._param_reader.cached() is not None:
+            self.show_live_values(self._param_reader.cached())
+        self.maybe_seed_parameter_shadow()
 
     def parse_config_files(self, config_files):
+        # files are shown once the preloader has them, not parsed here on the GUI thread
+        current = self.config_file_combo_box.currentText()
+        self.config_file_combo_box.blockSignals(True)
         self.config_file_combo_box.clear()
+        # only the files the plugin lists now, dropped ones are no longer watched either
+        self._config_file_map = {}
         for f in config_files:
             bn = ntpath.basename(f)
             self._config_file_map[bn] = f
             self.config_file_combo_box.addItem(bn)
+        if self.config_file_combo_box.findText(current) >= 0:
+            self.config_file_combo_box.setCurrentText(current)
+        self.config_file_combo_box.blockSignals(False)
+
+        self._config_cache.set_max_entries(max(self._config_cache_size, len(config_files)))
+        self._preloader.preload(list(config_files))
+        self._config_watcher.watch(self._config_file_map.values())
 
-    def roll_out_tree_as_list(self, it, tl):
-        tl.append(it.text(0))
-        if it.parent():
-            pit = self.roll_out_tree_as_list(it.parent(), tl)
-            return pit
+    def current_config_path(self):
+        return self._config_file_map.get(str(self.config_file_combo_box.currentText()))
+
+    def on_config_preloaded(self, path, entry):
+        self._config_cache.put(entry)
+        if path == self.current_config_path() and self._shown_config_path != path:
+            self.parse_config_file(str(self.config_file_combo_box.currentText()))
 
-    def set_config_data(self, tl, val):
-        if not tl:
+    def on_config_preload_failed(self, path, error):
+        self._node.get_logger().error("Couldnt load " + path + ": " + error)
+        idx = self.config_file_combo_box.findText(ntpath.basename(path))
+        if idx >= 0:
+            self.config_file_combo_box.setItemData(idx, QBrush(QColor('red')), Qt.ForegroundRole)
+            self.config_file_combo_box.setItemData(idx, error, Qt.ToolTipRole)
+
+    def on_config_preload_progress(self, done, total):
+        self.preload_progress_bar.setMaximum(total)
+        self.preload_progress_bar.setValue(done)
+        self.preload_progress_bar.setVisible(done < total)
+        if total and done == total:
+            self._node.get_logger().info("loaded " + str(total) + " config file(s)")
+
+    def config_baseline(self, path):
+        import yaml
+
+        entry = self._config_cache.peek(path)
+        try:
+            return entry.baseline() if entry is not None else None
+        except yaml.YAMLError:
+            return None
+
+    def conflict_tooltip(self, disk_value):
+        if disk_value is None:
+            return "removed on disk, keeping the unsaved edit"
+        return "changed on disk to " + str(disk_value) + ", keeping the unsaved edit"
+
+    def on_config_file_changed(self, path, new_entry, changes, baseline):
+        if self._saves_pending.get(path):
+            # merged once the save is done, which may well be what changed the file
+            self._deferred_disk_changes[path] = new_entry
             return
-        if len(tl) == 1:
-            self._config_dict[tl[0]] = val
-        elif len(tl) == 2:
-            self._config_dict[tl[0]][tl[1]] = val
-        elif len(tl) == 3:
-            self._config_dict[tl[0]][tl[1]][tl[2]] = val
-        elif len(tl) == 4:
-            self._config_dict[tl[0]][tl[1]][tl[2]][tl[3]] = val
-        elif len(tl) == 5:
-            self._config_dict[tl[0]][tl[1]][tl[2]][tl[3]][tl[4]] = val
-        elif len(tl) == 6:
-            self._config_dict[tl[0]][tl[1]][tl[2]][tl[3]][tl[4]][tl[5]] = val
-        elif len(tl) == 7:
-            self._config_dict[tl[0]][tl[1]][tl[2]][tl[3]][tl[4]][tl[5]][tl[6]] = val
-        else:
-            self._node.get_logger().error('can not set parameters at depth ' + len(tl))
-            self._node.get_logger().error('maybe cool it with the complexity')
+        entry = self._config_cache.peek(path)
+        if entry is None or entry.digest == new_entry.digest:
+            # read fresh when it is shown, or this is our own save
+            return
+        current = self.config_baseline(path)
+        if current is None:
+            if not entry.dirty:
+                self._config_cache.invalidate(path)
+                self._config_cache.put(new_entry)
+                if path == self._shown_config_path:
+                    self.parse_config_file(ntpath.basename(path))
+            return
+        if changes is None or baseline is not current:
+            # saved or merged since the parse started
+            changes = diff_configs(current, new_entry.data)
+        shown = path == self._shown_config_path
+
+        applied = []
+        conflicts = {}
+        with self._perf.span('merge_disk_changes', params=len(changes)):
+            # unsaved edits win, the disk's values for them are only flagged
+            local = [c.path for c in diff_configs(current, entry.data)] if entry.dirty else []
+            contested = {c.path for c in path_conflicts(changes, local)}
+            for change in changes:
+                if change.path in contested:
+                    if not agrees(entry.data, change):
+                        conflicts[change.path] = change.new
+                    continue
+                if shown and change.kind == REMOVED:
+                    self._config_model.remove_value(change.path)
+                elif shown:
+                    self._config_model.replace_value(change.path, copy.deepcopy(change.new))
+                else:
+                    apply_change(entry.data, change)
+                applied.append(change)
+        # new_entry.data is never edited, it stays the baseline
+        entry.set_content(new_entry.content, new_entry.data)
+        entry.mtime_ns = new_entry.mtime_ns
+        entry.size = new_entry.size
+        entry.schema = new_entry.schema
+        entry.stale = False
+        if entry.dirty:
+            entry.dirty = bool(diff_configs(new_entry.data, entry.data))
+        self._disk_conflicts.setdefault(path, {}).update(conflicts)
+
+        if shown:
+            self._param_schema = entry.schema
+            self._search_index_stale = True
+            for key_path, disk_value in conflicts.items():
+                self._config_model.set_highlighted(key_path, self.conflict_tooltip(disk_value))
+            if self.search_line_edit.text():
+                self.search_changed()
+        text = ntpath.basename(path) + " changed on disk: " + summarize_changes(applied)
+        if conflicts:
+            text += ", " + str(len(conflicts)) + " conflict(s) with unsaved edits"
+        self._node.get_logger().info(text)
+        self.save_status_label.setText(text)
+        self.save_status_label.setToolTip("\n".join(format_changes(
+            [c for c in changes if c.path in conflicts], self._change_list_limit)))
+
+    def on_config_watch_failed(self, path, error):
+        self._node.get_logger().warn("Couldnt reload " + path + " after it changed: " + error)
 
     def flatten(self, d, parent_key='', sep='.'):
-        items = []
-        for k, v in d.items():
-            new_key = parent_key + sep + k if parent_key else k
-            if isinstance(v, collections.MutableMapping):
-                items.extend(self.flatten(v, new_key, sep=sep).items())
-            else:
-                items.append((new_key, v))
-        return dict(items)
+        with self._perf.span('flatten') as counters:
+            flat = flatten(d, parent_key, sep)
+            counters['params'] = len(flat)
+        return flat
 
     def set_parameter(self, tl, val):
         if len(tl) < 3:
@@ -271,64 +854,255 @@ class BridgeConfigWidget(QWidget):
             self._node.get_logger().error('problem parsing ros_parameters from: -- ' + str(tl))
             return
 
-        pname = tl[2]
-        for idx in range(3, len(tl)):
-            pname = pname + "." + tl[idx]
-            self._node.get_logger().info('final param name: -- ' + pname)
-            self.send_parameter_set_request(pname, val)
+        pname = ".".join(tl[2:])
+        self._node.get_logger().debug('final param name: -- ' + pname)
+        self._param_batcher.queue(pname, val)
 
-    @QtCore.pyqtSlot(QtWidgets.QTreeWidgetItem, int)
-    def on_config_item_clicked(self, it, col):
-        if col == 0:
-            it.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-        else:
-            if str(it.text(1)):
-                it.setFlags(Qt.ItemIsEditable | Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-
-    @QtCore.pyqtSlot(QtWidgets.QTreeWidgetItem, int)
-    def on_config_item_changed(self, it, col):
-        if col == 1:
-            tl = []
-            self.roll_out_tree_as_list(it, tl)
-            tl.reverse()
-            self.set_config_data(tl, str(it.text(1)))
-            if self.update_param_checkbox.isChecked():
-                self.set_parameter(tl, it.text(1))
+    @QtCore.pyqtSlot(object, str)
+    def on_config_edit_rejected(self, path, reason):
+        self._node.get_logger().error(
+            "not setting " + ".".join(str(k) for k in path) + ": " + reason)
+
+    @QtCore.pyqtSlot(object, object)
+    def on_config_value_edited(self, path, value):
+        # the model has already written the value into self._config_dict
+        self._config_cache.mark_dirty(self._shown_config_path)
+        self._search_index.update(path, value)
+        if self.update_param_checkbox.isChecked():
+            self.set_parameter([str(k) for k in path], value)
+
+    @QtCore.pyqtSlot()
+    def search_changed(self):
+        query = self.search_line_edit.text()
+        if not query:
+            if self._config_model.is_filtered():
+                self._config_model.set_filter(None)
+                self.config_tree_view.expandToDepth(1)
+            self.search_status_label.setText("")
+            return
+        if self._search_index_stale:
+            with self._perf.span('build_search_index') as counters:
+                self._search_index.build(self._config_dict)
+                counters['params'] = len(self._search_index)
+            self._search_index_stale = False
+        try:
+            with self._perf.span('search_config') as counters:
+                paths, truncated = self._search_index.search(
+                    query, self.search_mode_combo_box.currentText(), self._search_result_limit)
+                counters['params'] = len(paths)
+        except re.error as e:
+            self.search_status_label.setText("bad regex: " + str(e))
+            return
+        with self._perf.span('filter_config_tree'):
+            self._config_model.set_filter(paths)
+            for path in paths:
+                self._config_model.index_for_path(path)
+            self.config_tree_view.expandAll()
+        self.search_status_label.setText(
+            ("first " if truncated else "") + str(len(paths)) + " match(es)")
 
     @QtCore.pyqtSlot(int)
     def config_file_selected(self, idx):
         self.parse_config_file(str(self.config_file_combo_box.currentText()))
 
+    def config_changes(self, path):
+        # config_diff changes from the file on disk to the edited config, None if unknown
+        entry = self._config_cache.peek(path)
+        if entry is None:
+            return None
+        import yaml
+
+        try:
+            with self._perf.span('diff_config'):
+                baseline = entry.baseline()
+                return None if baseline is None else diff_configs(baseline, entry.data)
+        except yaml.YAMLError:
+            return None
+
+    def save_config_files(self, paths, changes_by_path=None):
+        jobs = []
+        for path in paths:
+            entry = self._config_cache.peek(path)
+            if entry is None or not entry.dirty:
+                continue
+            self._node.get_logger().info('saving to: ' + path)
+            changes = (changes_by_path or {}).get(path)
+            if changes is None:
+                changes = self.config_changes(path)
+            # entry.data keeps changing on this thread (edits, node events, disk merges)
+            with self._perf.span('snapshot_config'):
+                data = copy_config(entry.data)
+            # with the changes known only those values are rewritten in the file
+            jobs.append(SaveJob(path, data, entry.digest, entry.edits, entry.content, changes))
+            self._saves_pending[path] = self._saves_pending.get(path, 0) + 1
+        if not jobs:
+            self.save_status_label.setText("no unsaved changes")
+            return None
+        self.save_status_label.setText("saving " + str(len(jobs)) + " file(s)...")
+        self.save_status_label.setToolTip("")
+        self._save_errors = []
+        return self._writer.save(jobs)
+
+    def on_config_saved(self, path, content, edits):
+        self._config_cache.mark_saved(path, content, edits)
+        overrides = self._live_overrides.pop(path, {})
+        # the unsaved edits won
+        conflicts = self._disk_conflicts.pop(path, {})
+        if path == self._shown_config_path:
+            # the file now holds what the node has
+            for key_path in list(overrides) + list(conflicts):
+                self._config_model.set_highlighted(key_path, None)
+        self.on_save_done(path)
+
+    def on_config_save_failed(self, path, error):
+        self._node.get_logger().error("Couldnt save " + path + ": " + error)
+        self._save_errors.append(ntpath.basename(path) + ": " + error)
+        self.on_save_done(path)
+
+    def on_save_done(self, path):
+        pending = self._saves_pending.get(path, 0) - 1
+        if pending > 0:
+            self._saves_pending[path] = pending
+            return
+        self._saves_pending.pop(path, None)
+        new_entry = self._deferred_disk_changes.pop(path, None)
+        if new_entry is not None:
+            # diffed again against what the save left, our own write is dropped by its digest
+            self.on_config_file_changed(path, new_entry, None, None)
+
+    def on_save_batch_finished(self, written, up_to_date, failed):
+        text = "saved " + str(written) + " file(s)"
+        if up_to_date:
+            text += ", " + str(up_to_date) + " already up to date"
+        if failed:
+            text += ", " + str(failed) + " failed"
+        self.save_status_label.setText(text)
+        self.save_status_label.setToolTip("\n".join(self._save_errors))
+
     @QtCore.pyqtSlot()
     def save_config_pressed(self):
+        path = self.current_config_path()
+        changes = self.config_changes(path)
         dialog_str = "Really save parameters?"
-        dlg = ConfirmDialog(dialog_str, self)
+        details = None
+        if changes is not None:
+            dialog_str += "\n" + summarize_changes(changes)
+            details = format_changes(changes, self._change_list_limit)
+        dlg = ConfirmDialog(dialog_str, self, details)
+        if dlg.exec():
+            self.save_config_files([path], {path: changes})
+
+    @QtCore.pyqtSlot()
+    def save_all_pressed(self):
+        paths = [entry.path for entry in self._config_cache.dirty_entries()]
+        if not paths:
+            self.save_status_label.setText("no unsaved changes")
+            return
+        changes_by_path = {}
+        details = []
+        for path in paths:
+            changes = self.config_changes(path)
+            changes_by_path[path] = changes
+            details.append(ntpath.basename(path) + ": " + (
+                "changes unknown" if changes is None else summarize_changes(changes)))
+            details.extend("  " + line for line in
+                           format_changes(changes or [], self._change_list_limit))
+        dialog_str = "Really save " + str(len(paths)) + " modified file(s)?"
+        dlg = ConfirmDialog(dialog_str, self, details)
         if dlg.exec():
-            config_file = self.config_file_combo_box.currentText()
-            fname = self._config_file_map[config_file]
-            self._node.get_logger().info('saving to: ' + fname)
-            try:
-                with open(fname, "w") as outfile:
-                    yaml.dump(self._config_dict, outfile, default_flow_style=False)
-            except FileNotFoundError:
-                pass
+            self.save_config_files(paths, changes_by_path)
+
+    @QtCore.pyqtSlot()
+    def read_back_pressed(self):
+        self.read_back_parameters(force=True)
 
     @QtCore.pyqtSlot()
     def reload_config_pressed(self):
         dialog_str = "Really reload parameters from disk?"
         dlg = ConfirmDialog(dialog_str, self)
         if dlg.exec():
-            self.parse_config_file(str(self.config_file_combo_box.currentText()))
+            self.parse_config_file(str(self.config_file_combo_box.currentText()), force=True)
 
     @QtCore.pyqtSlot()
     def send_config_pressed(self):
-        dialog_str = "Really send parameters to node?"
+        flat_dict, changes = self.parameter_changes()
+        if flat_dict is None:
+            return
+        if not changes:
+            self.push_status_label.setText("nothing to send, " + str(len(flat_dict)) +
+                                           " unchanged")
+            return
+        # against what the node is known to hold, parameters it was never read for count as added
+        dialog_str = "Really send parameters to node?\n" + summarize_changes(changes)
+        dlg = ConfirmDialog(dialog_str, self, format_changes(changes, self._change_list_limit))
+        if dlg.exec():
+            self.send_parameters_set_request(flat_dict, changes)
+
+    @QtCore.pyqtSlot(object)
+    def send_fleet_pressed(self, node_names):
+        dialog_str = "Really send parameters to " + str(len(node_names)) + " bridge(s)?"
         dlg = ConfirmDialog(dialog_str, self)
         if dlg.exec():
-            self.send_parameters_set_request()
+            self.send_fleet_parameters(node_names)
+
+    def cancel_all_requests(self, reason='cancelled'):
+        # transfers and queued requests first, or cancelling one in flight would start the next
+        for transfer in list(self._transfers):
+            transfer.cancel(reason)
+        self._fleet.cancel(reason)
+        self._scheduler.cancel_queued(reason)
+        self._service_caller.cancel_all(reason)
+
+    @QtCore.pyqtSlot()
+    def cancel_requests_pressed(self):
+        self.cancel_all_requests()
+
+    @QtCore.pyqtSlot(int)
+    def on_requests_in_flight_changed(self, count):
+        self.cancel_requests_button.setEnabled(count > 0)
+        if count == 0:
+            self.request_status_label.setText("idle")
+            self.request_status_label.setToolTip("")
+        else:
+            self.request_status_label.setText(str(count) + " request(s) in flight")
+            self.request_status_label.setToolTip(
+                "\n".join(self._service_caller.pending_descriptions()))
+
+    @QtCore.pyqtSlot(int)
+    def batch_window_changed(self, window_ms):
+        self._param_batcher.set_window(window_ms)
+
+    @QtCore.pyqtSlot(int)
+    def push_chunk_size_changed(self, chunk_size):
+        # for the next push, one already going on keeps its chunks
+        self._push_chunk_size = chunk_size
+        self._fleet.set_chunk_size(chunk_size)
+
+    @QtCore.pyqtSlot(int)
+    def on_pending_edits_changed(self, count):
+        self.flush_edits_button.setEnabled(count > 0)
+        if count:
+            self.batch_status_label.setText(str(count) + " edit(s) pending")
+
+    def on_edit_batch_finished(self, results):
+        failed = [r for r in results if not r.successful]
+        for r in failed:
+            self._logger.error("failed to set '" + r.name + "': " + r.reason)
+        for r in results:
+            if r.successful:
+                self._param_shadow.commit(r.name, r.value)
+        self.batch_status_label.setText(
+            "last batch: " + str(len(results) - len(failed)) + " set, " +
+            str(len(failed)) + " failed")
+        self.batch_status_label.setToolTip(
+            "\n".join(r.name + ": " + ("ok" if r.successful else r.reason) for r in results))
 
     @QtCore.pyqtSlot(int)
     def update_checkbox_changed(self, s):
         if s == 2:
-            self._node.get_logger().info("Hey! we're sending everything when you check this!")
+            self._node.get_logger().info("live updates on, sending the parameters that differ "
+                                         "from the node")
             self.send_parameters_set_request()
+        else:
+            # edits made while live updates were on still go out
+            self._param_batcher.flush()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+import collections
+import time
+
+from python_qt_binding.QtCore import QObject, Signal
+
+from rcl_interfaces.srv import SetParameters
+
+from .parameter_conversion import to_parameters, without_nulls
+from .parameter_transfer import ParameterTransfer
+
+
+# counts for one node of a fleet push, reason names the first parameter that failed
+NodePushResult = collections.namedtuple('NodePushResult',
+                                        ['node_name', 'sent', 'failed', 'reason', 'elapsed_ms'])
+
+
+class BridgeInfo:
+    def __init__(self, info_service, info_client):
+        self.info_service = info_service
+        self.info_client = info_client
+        self.node_name = None
+        self.plugin_name = ''
+
+
+class BridgeFleet(QObject):
+    """
+    Every FSW bridge on the graph, found through its ``get_plugin_info`` service.
+
+    ``push()`` sends parameters to several bridge nodes at once, one chunked
+    ParameterTransfer per node sharing the RequestScheduler, and reports one
+    NodePushResult per node when all of them have answered, so the push takes
+    about as long as the slowest node.
+    """
+
+    bridges_changed = Signal()
+    # nodes done, nodes in the push
+    push_progress = Signal(int, int)
+    # {node_name: NodePushResult}, wall time of the whole push in ms
+    push_finished = Signal(object, float)
+
+    _info_service_suffix = '/get_plugin_info'
+    _info_service_type = 'fsw_ros2_bridge_msgs/srv/GetPluginInfo'
+
+    def __init__(self, node, scheduler, parent=None, chunk_size=500, window=4, max_retries=2):
+        super(BridgeFleet, self).__init__(parent)
+        self._node = node
+        self._scheduler = scheduler
+        self._chunk_size = chunk_size
+        self._window = window
+        self._max_retries = max_retries
+        # info service name -> BridgeInfo
+        self._bridges = {}
+        self._params_clients = {}
+        self._push_started = None
+        self._push_total = 0
+        self._push_results = {}
+        self._transfers = {}
+
+    def set_chunk_size(self, chunk_size):
+        self._chunk_size = chunk_size
+
+    def bridges(self):
+        # only bridges that already told us their node name
+        return sorted((b for b in self._bridges.values() if b.node_name is not None),
+                      key=lambda b: b.node_name)
+
+    def is_pushing(self):
+        return self._push_started is not None
+
+    def refresh(self):
+        # only needed once the fleet panel is in use
+        from fsw_ros2_bridge_msgs.srv import GetPluginInfo
+
+        # reads the local graph cache, does not wait on the network
+        found = {name for name, types in self._node.get_service_names_and_types()
+                 if name.endswith(self._info_service_suffix) and
+                 self._info_service_type in types}
+        removed = set(self._bridges) - found
+        for name in removed:
+            self._node.destroy_client(self._bridges.pop(name).info_client)
+        for name in found - set(self._bridges):
+            bridge = BridgeInfo(name, self._node.create_client(GetPluginInfo, name))
+            self._bridges[name] = bridge
+            self._scheduler.submit(
+                bridge.info_client, GetPluginInfo.Request(),
+                callback=lambda info, b=bridge: self._on_plugin_info(b, info),
+                errback=lambda reason, b=bridge: self._on_plugin_info_failed(b, reason),
+                description='get_plugin_info from ' + name, metric='get_plugin_info')
+        if removed:
+            self.bridges_changed.emit()
+
+    def push(self, values_by_node, types_by_node=None):
+        """Send {node_name: {name: value}}, returns False if a push is still running."""
+        if self.is_pushing() or not values_by_node:
+            return False
+        types_by_node = types_by_node or {}
+        self._push_started = time.perf_counter()
+        self._push_total = len(values_by_node)
+        self._push_results = {}
+        self.push_progress.emit(0, self._push_total)
+
+        # nodes sharing one values dict share the converted messages too
+        converted = {}
+        for node_name, values in values_by_node.items():
+            types = types_by_node.get(node_name)
+            key = (id(values), id(types))
+            if key not in converted:
+                kept, nulls = without_nulls(values)
+                if nulls:
+                    self._node.get_logger().warn(
+                        'not sending ' + str(len(nulls)) + ' null parameter(s) to ' + node_name)
+                converted[key] = to_parameters(kept, types)
+            transfer = ParameterTransfer(
+                self._scheduler, self._params_client(node_name), converted[key], self,
+                chunk_size=self._chunk_size, window=self._window,
+                max_retries=self._max_retries, description='parameters on ' + node_name,
+                metric='fleet_push')
+            transfer.finished.connect(
+                lambda summary, n=node_name: self._on_transfer_finished(n, summary))
+            self._transfers[node_name] = transfer
+        for transfer in list(self._transfers.values()):
+            transfer.start()
+        return True
+
+    def cancel(self, reason='cancelled'):
+        for transfer in list(self._transfers.values()):
+            transfer.cancel(reason)
+
+    def shutdown(self):
+        for bridge in self._bridges.values():
+            self._node.destroy_client(bridge.info_client)
+        for client in self._params_clients.values():
+            self._node.destroy_client(client)
+        self._bridges.clear()
+        self._params_clients.clear()
+
+    def _params_client(self, node_name):
+        client = self._params_clients.get(node_name)
+        if client is None:
+            client = self._node.create_client(
+                SetParameters, '/' + node_name.lstrip('/') + '/set_parameters')
+            self._params_clients[node_name] = client
+        return client
+
+    def _on_plugin_info(self, bridge, info):
+        if self._bridges.get(bridge.info_service) is not bridge:
+            return
+        bridge.node_name = info.node_name
+        bridge.plugin_name = info.plugin_name
+        self.bridges_changed.emit()
+
+    def _on_plugin_info_failed(self, bridge, reason):
+        self._node.get_logger().warn(
+            "get_plugin_info from " + bridge.info_service + " failed: " + reason)
+        # forget it so the next refresh asks again
+        if self._bridges.get(bridge.info_service) is bridge:
+            del self._bridges[bridge.info_service]
+            self._node.destroy_client(bridge.info_client)
+
+    def _on_transfer_finished(self, node_name, summary):
+        transfer = self._transfers.pop(node_name, None)
+        if transfer is not None:
+            transfer.deleteLater()
+        if self._push_started is None:
+            return
+        reasons = sorted(summary.failures.items())
+        self._push_results[node_name] = NodePushResult(
+            node_name, summary.succeeded, len(reasons),
+            reasons[0][0] + ': ' + reasons[0][1] if reasons else '', summary.elapsed_ms)
+        self.push_progress.emit(len(self._push_results), self._push_total)
+        if len(self._push_results) == self._push_total:
+            results = self._push_results
+            wall_ms = (time.perf_counter() - self._push_started) * 1000.0
+            self._push_started = None
+            self._push_results = {}
+            self.push_finished.emit(results, wall_ms)
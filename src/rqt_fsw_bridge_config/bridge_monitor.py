@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+from python_qt_binding.QtCore import QObject, QTimer, Signal, Slot
+
+from rcl_interfaces.msg import ParameterEvent
+from rclpy.qos import qos_profile_parameter_events
+
+
+class BridgeMonitor(QObject):
+    """
+    Track whether the FSW bridge service is reachable without blocking the GUI.
+
+    Availability is probed with ``service_is_ready()``, a read of the local graph
+    cache. While nothing is there the probe interval backs off exponentially, and
+    any activity on ``/parameter_events`` (every node announces its parameters
+    there on startup) brings the next probe forward. Once connected the bridge
+    node's ``/parameter_events`` publisher is watched, so a restart shows up as a
+    new endpoint even when the service never appeared to go away.
+    """
+
+    connected = Signal()
+    disconnected = Signal()
+    restarted = Signal()
+
+    # emitted from the executor thread
+    _graph_activity = Signal()
+
+    def __init__(self, node, client, parent=None, min_interval_ms=20, max_interval_ms=2000,
+                 liveness_interval_ms=1000):
+        super(BridgeMonitor, self).__init__(parent)
+        self._node = node
+        self._client = client
+        self._min_interval_ms = min_interval_ms
+        self._max_interval_ms = max_interval_ms
+        self._liveness_interval_ms = liveness_interval_ms
+        self._interval_ms = min_interval_ms
+        self._available = False
+        self._watched_node = None
+        self._watched_gids = None
+        self._subscription = None
+
+        self._probe_timer = QTimer(self)
+        self._probe_timer.setSingleShot(True)
+        self._probe_timer.timeout.connect(self.probe)
+        self._graph_activity.connect(self._on_graph_activity)
+
+    def is_connected(self):
+        return self._available
+
+    def start(self):
+        if self._subscription is None:
+            self._subscription = self._node.create_subscription(
+                ParameterEvent, '/parameter_events',
+                lambda msg: self._graph_activity.emit(), qos_profile_parameter_events)
+        self._interval_ms = self._min_interval_ms
+        self.probe()
+
+    def stop(self):
+        self._probe_timer.stop()
+        if self._subscription is not None:
+            self._node.destroy_subscription(self._subscription)
+            self._subscription = None
+
+    def watch_node(self, node_name):
+        # fully qualified name of the node whose restarts should be reported
+        self._watched_node = node_name.lstrip('/')
+        self._watched_gids = self._endpoint_gids()
+
+    @Slot()
+    def probe(self):
+        ready = self._client.service_is_ready()
+        if ready and not self._available:
+            self._available = True
+            self._interval_ms = self._min_interval_ms
+            self.connected.emit()
+        elif not ready and self._available:
+            self._available = False
+            self._watched_gids = None
+            self._interval_ms = self._min_interval_ms
+            self.disconnected.emit()
+        elif ready and self._check_restart():
+            self.restarted.emit()
+
+        if self._available:
+            self._probe_timer.start(self._liveness_interval_ms)
+        else:
+            self._probe_timer.start(self._interval_ms)
+            self._interval_ms = min(self._interval_ms * 2, self._max_interval_ms)
+
+    @Slot()
+    def _on_graph_activity(self):
+        if self._available:
+            # the liveness timer covers a connected bridge, a busy graph must not add probes
+            return
+        self._interval_ms = self._min_interval_ms
+        # a burst of events is coalesced into one probe shortly after the first
+        if not self._probe_timer.isActive() or \
+                self._probe_timer.remainingTime() > self._min_interval_ms:
+            self._probe_timer.start(self._min_interval_ms)
+
+    def _endpoint_gids(self):
+        if self._watched_node is None:
+            return None
+        gids = set()
+        for info in self._node.get_publishers_info_by_topic('/parameter_events'):
+            name = (info.node_namespace.rstrip('/') + '/' + info.node_name).lstrip('/')
+            if name == self._watched_node:
+                gids.add(bytes(info.endpoint_gid))
+        return gids
+
+    def _check_restart(self):
+        gids = self._endpoint_gids()
+        if not gids:
+            # not visible (yet), nothing to compare against
+            return False
+        if not self._watched_gids:
+            self._watched_gids = gids
+            return False
+        if gids.isdisjoint(self._watched_gids):
+            self._watched_gids = gids
+            return True
+        return False
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+
+"""
+Push, diff or verify a FSW bridge config file against its node without starting rqt.
+
+Exit codes: 0 on success (or no differences), 1 if parameters failed to set or
+differ from the file, 2 for usage and file errors, 3 if the node did not answer.
+"""
+
+import argparse
+import os
+import sys
+
+from rcl_interfaces.srv import GetParameters, SetParameters, SetParametersAtomically
+import yaml
+
+from .config_cache import load_config_entry
+from .config_diff import diff_configs, format_changes, same_text
+from .config_utils import node_parameters
+from .parameter_conversion import from_parameter_value, to_parameters, without_nulls
+from .parameter_shadow import ParameterShadow
+
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_UNAVAILABLE = 3
+
+
+class NodeUnavailable(Exception):
+    pass
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog='fsw_bridge_config', description=__doc__.strip())
+    parser.add_argument('mode', choices=['push', 'diff', 'verify'],
+                        help='push the file, print the differences, or only check them')
+    parser.add_argument('config_file', help='ros__parameters yaml file')
+    parser.add_argument('--node', default=None,
+                        help='node to target, defaults to every node section in the file; '
+                             '/** parameters go to each target')
+    parser.add_argument('--only-changed', action='store_true',
+                        help='push: read the node first and only send differing parameters')
+    parser.add_argument('--atomic', action='store_true',
+                        help='push: use set_parameters_atomically')
+    parser.add_argument('--timeout', type=float, default=5.0,
+                        help='seconds to wait for each service (default: %(default)s)')
+    parser.add_argument('-q', '--quiet', action='store_true', help='only report errors')
+    return parser.parse_args(argv)
+
+
+def service_name(node_name, service):
+    return '/' + node_name.lstrip('/') + '/' + service
+
+
+def call_service(node, srv_type, name, request, timeout):
+    import rclpy
+
+    client = node.create_client(srv_type, name)
+    try:
+        if not client.wait_for_service(timeout_sec=timeout):
+            raise NodeUnavailable(name + ' is not available')
+        future = client.call_async(request)
+        rclpy.spin_until_future_complete(node, future, timeout_sec=timeout)
+        if not future.done():
+            raise NodeUnavailable(name + ' did not answer within ' + str(timeout) + 's')
+        if future.exception() is not None:
+            raise NodeUnavailable(name + ' failed: ' + str(future.exception()))
+        return future.result()
+    finally:
+        node.destroy_client(client)
+
+
+def get_parameters(node, target, names, timeout):
+    req = GetParameters.Request()
+    req.names = list(names)
+    result = call_service(node, GetParameters, service_name(target, 'get_parameters'), req,
+                          timeout)
+    return {name: from_parameter_value(v) for name, v in zip(req.names, result.values)}
+
+
+def set_parameters(node, target, values, atomic, timeout):
+    srv_type = SetParametersAtomically if atomic else SetParameters
+    req = srv_type.Request()
+    # values come straight from yaml, so their python types are the parameter types
+    req.parameters = to_parameters(values)
+    result = call_service(
+        node, srv_type,
+        service_name(target, 'set_parameters_atomically' if atomic else 'set_parameters'),
+        req, timeout)
+    if atomic:
+        return {name: result.result for name in values}
+    return dict(zip(values.keys(), result.results))
+
+
+def differences(flat, live):
+    shadow = ParameterShadow()
+    shadow.seed(live)
+    return shadow.delta(flat).changed
+
+
+def run_push(node, target, flat, args, out):
+    flat, nulls = without_nulls(flat)
+    for name in nulls:
+        sys.stderr.write('not setting ' + name + ': null in ' + args.config_file + '\n')
+    values = flat
+    if args.only_changed:
+        values = differences(flat, get_parameters(node, target, flat.keys(), args.timeout))
+        if not values:
+            out('/' + target.lstrip('/') + ': up to date, ' + str(len(flat)) + ' unchanged')
+            return EXIT_OK
+    results = set_parameters(node, target, values, args.atomic, args.timeout)
+    failed = {name: r.reason for name, r in results.items() if not r.successful}
+    for name, reason in sorted(failed.items()):
+        sys.stderr.write('failed to set ' + name + ': ' + reason + '\n')
+    out('/' + target.lstrip('/') + ': set ' + str(len(values) - len(failed)) + '/' +
+        str(len(values)) + ' parameters, skipped ' + str(len(flat) - len(values)) +
+        ' unchanged')
+    return EXIT_FAILED if failed else EXIT_OK
+
+
+def run_diff(node, target, flat, args, out):
+    live = get_parameters(node, target, flat.keys(), args.timeout)
+    changes = diff_configs({name: value for name, value in live.items() if value is not None},
+                           flat, same_text)
+    if args.mode == 'diff':
+        for line in format_changes(changes):
+            out(line)
+    out('/' + target.lstrip('/') + ': ' + str(len(changes)) + ' of ' + str(len(flat)) +
+        ' parameters differ from ' + os.path.basename(args.config_file))
+    return EXIT_FAILED if changes else EXIT_OK
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    def out(line):
+        if not args.quiet:
+            print(line)
+
+    try:
+        entry = load_config_entry(args.config_file)
+    except (OSError, yaml.YAMLError, ValueError) as e:
+        sys.stderr.write('could not load ' + args.config_file + ': ' + str(e) + '\n')
+        return EXIT_USAGE
+
+    targets = node_parameters(entry.data, args.node)
+    if not targets:
+        sys.stderr.write('no ros__parameters for ' + (args.node or 'any node') + ' in ' +
+                         args.config_file + '\n')
+        if args.node is None and any(str(k).lstrip('/') == '**' for k in entry.data):
+            sys.stderr.write('/** parameters apply to every node, name one with --node\n')
+        return EXIT_USAGE
+
+    # rclpy is only needed once the file is known to be usable
+    import rclpy
+
+    rclpy.init()
+    node = rclpy.create_node('fsw_bridge_config_cli_' + str(os.getpid()))
+    status = EXIT_OK
+    try:
+        for target, flat in targets.items():
+            try:
+                if args.mode == 'push':
+                    rc = run_push(node, target, flat, args, out)
+                else:
+                    rc = run_diff(node, target, flat, args, out)
+            except NodeUnavailable as e:
+                sys.stderr.write(str(e) + '\n')
+                rc = EXIT_UNAVAILABLE
+            status = max(status, rc)
+    finally:
+        node.destroy_node()
+        rclpy.shutdown()
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+
+import collections
+import hashlib
+import os
+
+from . import yaml_backend
+
+
+def load_config_entry(path, loader=yaml_backend.load):
+    with open(path, 'rb') as infile:
+        st = os.fstat(infile.fileno())
+        content = infile.read()
+    data = loader(content) or {}
+    if not isinstance(data, dict):
+        raise ValueError(path + ' does not contain a mapping at the top level')
+    return ConfigCacheEntry(path, data, st.st_mtime_ns, st.st_size,
+                            hashlib.sha1(content).hexdigest(), content, loader)
+
+
+class ConfigCacheEntry:
+    def __init__(self, path, data, mtime_ns, size, digest, content=None,
+                 loader=yaml_backend.load):
+        self.path = path
+        self.data = data
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = digest
+        # the bytes on disk, data is edited in place so this is what diffs compare against
+        self.content = content
+        self._loader = loader
+        self._baseline = None
+        # parameter types as loaded, see parameter_conversion.build_schema
+        self.schema = None
+        # data holds edits that are not on disk yet
+        self.dirty = False
+        # counts mark_dirty calls, so a save can tell whether edits came in meanwhile
+        self.edits = 0
+        # the file changed on disk while the entry was dirty
+        self.stale = False
+
+    def baseline(self):
+        """Parse the file as it is on disk on first use; None if the content is unknown."""
+        if self._baseline is None and self.content is not None:
+            self._baseline = self._loader(self.content) or {}
+        return self._baseline
+
+    def set_content(self, content, baseline=None):
+        # baseline, if given, is content already parsed and must never be edited
+        self.content = content
+        self.digest = hashlib.sha1(content).hexdigest()
+        self._baseline = baseline
+
+
+class ConfigCache:
+    """
+    Parsed config files keyed by path, least recently used evicted first.
+
+    An entry is re-parsed when the file's mtime or size changed and its content
+    hash no longer matches. Dirty entries are never evicted or re-parsed behind the
+    caller's back, so unsaved edits survive switching between files.
+    """
+
+    def __init__(self, max_entries=8, loader=yaml_backend.load):
+        self._max_entries = max_entries
+        self._loader = loader
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def set_max_entries(self, max_entries):
+        self._max_entries = max_entries
+        self._evict()
+
+    def __contains__(self, path):
+        return path in self._entries
+
+    def get(self, path, force=False):
+        entry = self._entries.get(path)
+        if entry is not None and not force:
+            self._entries.move_to_end(path)
+            if entry.dirty:
+                entry.stale = entry.stale or self._changed_on_disk(entry)
+                return entry
+            if not self._changed_on_disk(entry):
+                return entry
+        entry = load_config_entry(path, self._loader)
+        self._entries[path] = entry
+        self._entries.move_to_end(path)
+        self._evict()
+        return entry
+
+    def put(self, entry):
+        # entries loaded elsewhere (e.g. preloaded) never replace edited ones
+        current = self._entries.get(entry.path)
+        if current is not None and (current.dirty or current.digest == entry.digest):
+            return current
+        self._entries[entry.path] = entry
+        self._evict()
+        return entry
+
+    def peek(self, path):
+        return self._entries.get(path)
+
+    def dirty_entries(self):
+        return [e for e in self._entries.values() if e.dirty]
+
+    def mark_dirty(self, path):
+        entry = self._entries.get(path)
+        if entry is not None:
+            entry.dirty = True
+            entry.edits += 1
+
+    def mark_saved(self, path, content=None, edits=None):
+        # content None means the file already held this data, edits is entry.edits
+        # when the save was queued
+        entry = self._entries.get(path)
+        if entry is None:
+            return
+        st = os.stat(path)
+        entry.mtime_ns = st.st_mtime_ns
+        entry.size = st.st_size
+        if content is not None:
+            entry.set_content(content)
+        entry.stale = False
+        if edits is None or edits == entry.edits:
+            entry.dirty = False
+
+    def invalidate(self, path):
+        self._entries.pop(path, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def _changed_on_disk(self, entry):
+        try:
+            st = os.stat(entry.path)
+        except OSError:
+            return True
+        if st.st_mtime_ns == entry.mtime_ns and st.st_size == entry.size:
+            return False
+        if st.st_size == entry.size:
+            # touched but possibly unchanged, only the content hash can tell
+            with open(entry.path, 'rb') as infile:
+                if hashlib.sha1(infile.read()).hexdigest() == entry.digest:
+                    entry.mtime_ns = st.st_mtime_ns
+                    return False
+        return True
+
+    def _evict(self):
+        if len(self._entries) <= self._max_entries:
+            return
+        for path in list(self._entries.keys()):
+            if len(self._entries) <= self._max_entries:
+                break
+            if not self._entries[path].dirty:
+                del self._entries[path]
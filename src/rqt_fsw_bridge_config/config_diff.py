@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+import collections
+import copy
+
+from .config_search import display_name
+
+
+ADDED = 'added'
+REMOVED = 'removed'
+CHANGED = 'changed'
+
+# path is the key path from the top of the config, old is None when added, new when removed
+ConfigChange = collections.namedtuple('ConfigChange', ['kind', 'path', 'old', 'new'])
+
+_MARKERS = {ADDED: '+', REMOVED: '-', CHANGED: '~'}
+
+
+def same_value(old, new):
+    # True == 1 and 1 == 1.0, but the file and the node tell those apart
+    return type(old) is type(new) and old == new
+
+
+def same_text(old, new):
+    # how the tree and the parameter shadow compare values
+    return str(old) == str(new)
+
+
+def diff_configs(old, new, equal=same_value):
+    """
+    Return the changes that turn the nested dict old into new, in document order.
+
+    Every key of both sides is looked at once, so this is linear in the size of
+    the configs. Dicts on both sides are compared key by key, anything else
+    (including lists) is a leaf compared with ``equal(old, new)``.
+    """
+    changes = []
+    _diff_dicts((), old, new, equal, changes)
+    return changes
+
+
+def _diff_dicts(path, old, new, equal, changes):
+    for key, old_value in old.items():
+        key_path = path + (key,)
+        if key not in new:
+            changes.append(ConfigChange(REMOVED, key_path, old_value, None))
+            continue
+        new_value = new[key]
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            _diff_dicts(key_path, old_value, new_value, equal, changes)
+        elif isinstance(old_value, dict) or isinstance(new_value, dict) or \
+                not equal(old_value, new_value):
+            changes.append(ConfigChange(CHANGED, key_path, old_value, new_value))
+    for key, new_value in new.items():
+        if key not in old:
+            changes.append(ConfigChange(ADDED, path + (key,), None, new_value))
+
+
+def apply_change(data, change):
+    """Make change in the nested dict data, False if its parent is not there."""
+    container = data
+    for key in change.path[:-1]:
+        container = container.get(key) if isinstance(container, dict) else None
+    if not isinstance(container, dict):
+        return False
+    if change.kind == REMOVED:
+        container.pop(change.path[-1], None)
+    else:
+        # data gets edited in place, it must not share anything with the other side
+        container[change.path[-1]] = copy.deepcopy(change.new)
+    return True
+
+
+def agrees(data, change):
+    """Tell whether data already holds what change would leave there."""
+    container = data
+    for key in change.path[:-1]:
+        container = container.get(key) if isinstance(container, dict) else None
+    if not isinstance(container, dict) or change.path[-1] not in container:
+        return change.kind == REMOVED
+    if change.kind == REMOVED:
+        return False
+    return not diff_configs({0: container[change.path[-1]]}, {0: change.new})
+
+
+def path_conflicts(changes, paths):
+    """Pick the changes whose path is, contains or is inside one of paths."""
+    inside = set()
+    for path in paths:
+        inside.update(path[:depth] for depth in range(1, len(path) + 1))
+    paths = set(paths)
+    return [change for change in changes
+            if change.path in inside or
+            any(change.path[:depth] in paths for depth in range(1, len(change.path)))]
+
+
+def count_changes(changes):
+    counts = {ADDED: 0, REMOVED: 0, CHANGED: 0}
+    for change in changes:
+        counts[change.kind] += 1
+    return counts
+
+
+def summarize_changes(changes):
+    if not changes:
+        return 'no changes'
+    counts = count_changes(changes)
+    return ', '.join(str(counts[kind]) + ' ' + kind for kind in (CHANGED, ADDED, REMOVED)
+                     if counts[kind])
+
+
+def _short(value, width=40):
+    if isinstance(value, dict):
+        return '{' + str(len(value)) + ' keys}'
+    text = str(value)
+    return text if len(text) <= width else text[:width - 3] + '...'
+
+
+def format_change(change):
+    line = _MARKERS[change.kind] + ' ' + display_name(change.path)
+    if change.kind == CHANGED:
+        return line + ': ' + _short(change.old) + ' -> ' + _short(change.new)
+    if change.kind == ADDED:
+        return line + ': ' + _short(change.new)
+    return line
+
+
+def format_changes(changes, limit=None):
+    """One line per change, cut off after limit lines."""
+    shown = changes if limit is None else changes[:limit]
+    lines = [format_change(change) for change in shown]
+    if len(changes) > len(shown):
+        lines.append('... and ' + str(len(changes) - len(shown)) + ' more')
+    return lines
@@ -1,15 +1,37 @@
 #!/usr/bin/env python3
 
-from fsw_ros2_bridge_msgs.msg import MessageInfo
+import json
+
+
+class MessageEntry:
+    __slots__ = ('name', 'category', 'json', 'info', '_struct')
+
+    def __init__(self, name, category, json_str, info):
+        self.name = name
+        self.category = category
+        self.json = json_str
+        self.info = info
+        self._struct = None
+
+    def struct(self):
+        # decoded on first use, most messages are never looked at
+        if self._struct is None:
+            try:
+                self._struct = json.loads(self.json) if self.json else {}
+            except ValueError:
+                self._struct = {}
+        return self._struct
 
 
 class ConfigInfo:
+    _categories = {"telemetry": "TELEMETRY", "commands": "COMMAND", "helper": "HELPER"}
+
     def __init__(self, node):
         self._node = node
         self._message_info_list = []
-        self._msg_dict = {"commands": [], "telemetry": [], "helper": []}
-        self._msg_struct = {}
-        self._msg_info = {}
+        # msg_name -> MessageEntry
+        self._catalog = {}
+        self._counts = {"commands": 0, "telemetry": 0, "helper": 0}
         self._msg_pkg = ""
         self._plugin_pkg = ""
 
@@ -20,44 +42,78 @@ class ConfigInfo:
         return self.set_message_info()
 
     def set_message_info(self):
+        self.clear()
         for m in self._message_info_list:
-            if m.msg_type is MessageInfo.TELEMETRY:
-                self._msg_dict["telemetry"].append(m.msg_name)
-            elif m.msg_type is MessageInfo.COMMAND:
-                self._msg_dict["commands"].append(m.msg_name)
-            else:
-                self._msg_dict["helper"].append(m.msg_name)
-            self._msg_struct[m.msg_name] = m.json
-            self._msg_info[m.msg_name] = m.info
-
-        n_cmd = len(self._msg_dict["commands"])
-        n_tlm = len(self._msg_dict["telemetry"])
-        n_hlp = len(self._msg_dict["helper"])
+            self.add_message(m)
 
         self._node.get_logger().info("Message Config:")
-        self._node.get_logger().info("  found " + str(n_cmd) + " command msgs")
-        self._node.get_logger().info("  found " + str(n_tlm) + " telemetry msgs")
-        self._node.get_logger().info("  found " + str(n_hlp) + " helper msgs")
-        return self._msg_dict
+        self._node.get_logger().info("  found " + str(self._counts["commands"]) +
+                                     " command msgs")
+        self._node.get_logger().info("  found " + str(self._counts["telemetry"]) +
+                                     " telemetry msgs")
+        self._node.get_logger().info("  found " + str(self._counts["helper"]) +
+                                     " helper msgs")
+        return self.get_message_dict()
+
+    def clear(self):
+        self._catalog.clear()
+        for category in self._counts:
+            self._counts[category] = 0
+
+    def add_message(self, m):
+        # adding a known name updates it in place
+        self.remove_message(m.msg_name)
+        # m is a fsw_ros2_bridge_msgs MessageInfo, its constants come with it
+        if m.msg_type == type(m).TELEMETRY:
+            category = "telemetry"
+        elif m.msg_type == type(m).COMMAND:
+            category = "commands"
+        else:
+            category = "helper"
+        self._catalog[m.msg_name] = MessageEntry(m.msg_name, category, m.json, m.info)
+        self._counts[category] += 1
+
+    def remove_message(self, msg_name):
+        entry = self._catalog.pop(msg_name, None)
+        if entry is None:
+            return False
+        self._counts[entry.category] -= 1
+        return True
+
+    def __len__(self):
+        return len(self._catalog)
+
+    def __contains__(self, msg_name):
+        return msg_name in self._catalog
+
+    def get_message_dict(self):
+        msg_dict = {"commands": [], "telemetry": [], "helper": []}
+        for entry in self._catalog.values():
+            msg_dict[entry.category].append(entry.name)
+        return msg_dict
+
+    def get_message_count(self, category):
+        return self._counts.get(category, 0)
 
     def get_message_type(self, msg_name):
-        if msg_name in self._msg_dict["telemetry"]:
-            return "TELEMETRY"
-        if msg_name in self._msg_dict["commands"]:
-            return "COMMAND"
-        if msg_name in self._msg_dict["helper"]:
-            return "HELPER"
-        return "UNKNOWN"
+        entry = self._catalog.get(msg_name)
+        if entry is None:
+            return "UNKNOWN"
+        return self._categories[entry.category]
 
     def get_message_struct(self, msg_name):
-        if msg_name in self._msg_struct.keys():
-            return self._msg_struct[msg_name]
-        return {}
+        entry = self._catalog.get(msg_name)
+        if entry is None:
+            return {}
+        return entry.struct()
 
     def get_message_info(self, msg_name):
-        if msg_name in self._msg_struct.keys():
-            return self._msg_info[msg_name]
-        return ""
+        entry = self._catalog.get(msg_name)
+        if entry is None:
+            return ""
+        return entry.info
 
     def save_message_info(self, msg_name, info):
-        self._msg_info[msg_name] = info
+        entry = self._catalog.get(msg_name)
+        if entry is not None:
+            entry.info = info
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+from . import yaml_backend
+from .config_diff import CHANGED, diff_configs
+
+
+def _value_node(root, path):
+    import yaml
+
+    node = root
+    for key in path:
+        if not isinstance(node, yaml.MappingNode):
+            return None
+        found = None
+        for key_node, value_node in node.value:
+            # the last one wins, as when loading
+            if isinstance(key_node, yaml.ScalarNode) and key_node.value == str(key):
+                found = value_node
+        if found is None:
+            return None
+        node = found
+    return node
+
+
+def patch_changed_values(content, data, changes):
+    """
+    Replace just the changed values in content, None if that cannot be done.
+
+    Comments, key order and formatting of everything else stay as they are. Only
+    changes of one leaf value to another can be patched, and the result must load
+    back to exactly data, otherwise the caller dumps the whole file instead.
+    """
+    if not changes or any(c.kind != CHANGED or isinstance(c.old, dict) or
+                          isinstance(c.new, dict) for c in changes):
+        return None
+    import yaml
+
+    try:
+        text = content.decode('utf-8')
+        # libyaml marks may count bytes, the pure python composer counts characters
+        root = yaml_backend.compose(text, None if content.isascii() else 'python')
+        spans = []
+        for change in changes:
+            node = _value_node(root, change.path)
+            if node is None:
+                return None
+            replacement = yaml_backend.dump_inline(change.new)
+            if '\n' in replacement:
+                return None
+            start = node.start_mark.index
+            end = node.end_mark.index
+            while end > start and text[end - 1] in ' \t\r\n':
+                end -= 1
+            spans.append((start, end, replacement))
+        spans.sort()
+        pieces = []
+        pos = 0
+        for start, end, replacement in spans:
+            if start < pos:
+                # an alias shares its anchor's node
+                return None
+            pieces.append(text[pos:start])
+            pieces.append(replacement)
+            pos = end
+        pieces.append(text[pos:])
+        patched = ''.join(pieces)
+        if diff_configs(yaml_backend.load(patched) or {}, data):
+            return None
+    except yaml.YAMLError:
+        return None
+    return patched.encode()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+import concurrent.futures
+
+from python_qt_binding.QtCore import QObject, Signal, Slot
+
+from .config_cache import load_config_entry
+from .parameter_conversion import build_schema
+
+
+def _load_with_schema(path, perf):
+    with perf.span('parse_config_file') as counters:
+        entry = load_config_entry(path)
+        counters['bytes'] = entry.size
+    with perf.span('build_schema'):
+        entry.schema = build_schema(entry.data)
+    # a second copy to diff edits against, parsed here rather than when Save is pressed
+    with perf.span('parse_baseline'):
+        entry.baseline()
+    return entry
+
+
+class ConfigPreloader(QObject):
+    """
+    Parse and validate config files on a thread pool.
+
+    Results are handed back to the GUI thread through signals, the caller decides
+    what to do with them (normally putting them into the ConfigCache).
+    """
+
+    # path, ConfigCacheEntry
+    loaded = Signal(str, object)
+    # path, error message
+    failed = Signal(str, str)
+    # files done, files requested
+    progress = Signal(int, int)
+
+    # emitted from the worker threads
+    _done = Signal(int, str, object, str)
+
+    def __init__(self, perf, parent=None, max_workers=4):
+        super(ConfigPreloader, self).__init__(parent)
+        self._perf = perf
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='config_preload')
+        self._generation = 0
+        self._total = 0
+        self._finished = 0
+        self._done.connect(self._on_done)
+
+    def preload(self, paths):
+        # results of an earlier preload that are still running are dropped
+        self._generation += 1
+        self._total = len(paths)
+        self._finished = 0
+        self.progress.emit(0, self._total)
+        for path in paths:
+            future = self._executor.submit(_load_with_schema, path, self._perf)
+            future.add_done_callback(
+                lambda f, path=path, gen=self._generation: self._report(gen, path, f))
+
+    def is_running(self):
+        return self._finished < self._total
+
+    def shutdown(self):
+        self._generation += 1
+        self._executor.shutdown(wait=False)
+
+    def _report(self, generation, path, future):
+        try:
+            self._done.emit(generation, path, future.result(), '')
+        except Exception as e:
+            self._done.emit(generation, path, None, str(e) or type(e).__name__)
+
+    @Slot(int, str, object, str)
+    def _on_done(self, generation, path, entry, error):
+        if generation != self._generation:
+            return
+        self._finished += 1
+        if entry is None:
+            self.failed.emit(path, error)
+        else:
+            self.loaded.emit(path, entry)
+        self.progress.emit(self._finished, self._total)
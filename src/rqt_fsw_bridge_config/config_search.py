@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+import bisect
+import re
+
+
+SEARCH_MODES = ('substring', 'prefix', 'regex')
+
+
+def display_name(path):
+    # parameters are known by their dotted name below ros__parameters
+    if len(path) > 2 and path[1] == 'ros__parameters':
+        path = path[2:]
+    return '.'.join(str(k) for k in path)
+
+
+class ConfigSearchIndex:
+    """
+    Names and values of every leaf of a config, for the search box.
+
+    Entries are sorted by parameter name, so a prefix query is a bisect. Substring
+    and regex queries run over one ``name<TAB>value`` line per entry, all joined
+    into a single lowercased string so the scan stays in C; a regex hit that runs
+    past its line is checked again against that line alone. Edited values go into
+    a small overlay instead of rebuilding that string on every edit.
+    """
+
+    _rebuild_after = 1000
+
+    def __init__(self):
+        self.clear()
+
+    def __len__(self):
+        return len(self._paths)
+
+    def clear(self):
+        self._names = []
+        self._values = []
+        self._paths = []
+        self._row_of = {}
+        self._text = ''
+        self._line_starts = []
+        # row -> current line, for rows edited since the text was joined
+        self._edited = {}
+
+    def build(self, config_dict):
+        entries = []
+        stack = [((), config_dict)]
+        while stack:
+            path, value = stack.pop()
+            if isinstance(value, dict):
+                stack.extend((path + (k,), v) for k, v in value.items())
+            elif path:
+                entries.append((display_name(path).lower(), str(value).lower(), path))
+        entries.sort(key=lambda e: e[0])
+        self._names = [e[0] for e in entries]
+        self._values = [e[1] for e in entries]
+        self._paths = [e[2] for e in entries]
+        self._row_of = {path: row for row, path in enumerate(self._paths)}
+        self._join()
+
+    def update(self, path, value):
+        row = self._row_of.get(tuple(path))
+        if row is None:
+            return False
+        self._values[row] = str(value).lower()
+        self._edited[row] = self._line(row)
+        if len(self._edited) > self._rebuild_after:
+            self._join()
+        return True
+
+    def search(self, query, mode='substring', limit=None):
+        """
+        Key paths matching query in name order, and whether there were more than limit.
+
+        Raises re.error for a bad regex.
+        """
+        if mode == 'prefix':
+            rows = self._prefix_rows(query.lower(), limit)
+        else:
+            if mode == 'regex':
+                # the text is lowercased already, IGNORECASE makes the scan several times slower
+                flags = re.MULTILINE if query == query.lower() else re.MULTILINE | re.IGNORECASE
+                pattern = re.compile(query, flags)
+                match = pattern.search
+            else:
+                needle = query.lower()
+
+                def match(text, pos=0, needle=needle):
+                    found = text.find(needle, pos)
+                    return found if found >= 0 else None
+            rows = self._scan_rows(match, limit)
+        truncated = limit is not None and len(rows) > limit
+        if truncated:
+            rows = rows[:limit]
+        return [self._paths[row] for row in rows], truncated
+
+    def _line(self, row):
+        return self._names[row] + '\t' + self._values[row]
+
+    def _join(self):
+        lines = [self._line(row) for row in range(len(self._paths))]
+        starts = []
+        pos = 0
+        for line in lines:
+            starts.append(pos)
+            pos += len(line) + 1
+        self._text = '\n'.join(lines)
+        self._line_starts = starts
+        self._edited = {}
+
+    def _prefix_rows(self, prefix, limit):
+        rows = []
+        row = bisect.bisect_left(self._names, prefix)
+        while row < len(self._names) and self._names[row].startswith(prefix):
+            rows.append(row)
+            if limit is not None and len(rows) > limit:
+                break
+            row += 1
+        return rows
+
+    def _scan_rows(self, match, limit):
+        # match(text, pos) returns the offset of the next hit (or a match object) or None
+        rows = []
+        text = self._text
+        starts = self._line_starts
+        pos = 0
+        while starts:
+            found = match(text, pos)
+            if found is None:
+                break
+            offset = found if isinstance(found, int) else found.start()
+            row = bisect.bisect_right(starts, offset) - 1
+            end = starts[row + 1] - 1 if row + 1 < len(starts) else len(text)
+            if not isinstance(found, int) and found.end() > end:
+                # a regex hit running into the next entries, only this entry's line counts
+                found = found.re.search(text, starts[row], end)
+            if found is not None and row not in self._edited:
+                rows.append(row)
+                if limit is not None and len(rows) > limit:
+                    break
+            # continue on the next line, one hit per entry is enough
+            if row + 1 >= len(starts):
+                break
+            pos = starts[row + 1]
+        for row, line in self._edited.items():
+            found = match(line)
+            if found is not None:
+                bisect.insort(rows, row)
+        return rows
@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+
+from python_qt_binding.QtCore import QAbstractItemModel, QModelIndex, Qt, Signal
+from python_qt_binding.QtGui import QBrush, QColor
+
+
+class ConfigTreeNode:
+    __slots__ = ('key', 'path', 'parent', 'row', 'container', 'children', 'keys')
+
+    def __init__(self, key, parent, row, container):
+        self.key = key
+        self.path = parent.path + (key,) if parent is not None else ()
+        self.parent = parent
+        self.row = row
+        # the dict holding this node's value, so lookups never walk the tree
+        self.container = container
+        self.children = []
+        self.keys = None
+
+
+class ConfigTreeModel(QAbstractItemModel):
+    """
+    Item model reading straight from the parsed config dict.
+
+    Rows are only created when the view asks for them through ``fetchMore``, so a
+    large config costs nothing until it is expanded, and replacing the config is a
+    single model reset. A filter limits the rows to a set of key paths and their
+    parents, the same way.
+    """
+
+    _column_names = ['key', 'val', 'live']
+    _fetch_batch_size = 1000
+    _highlight_brush = QBrush(QColor('darkorange'))
+    _mismatch_brush = QBrush(QColor('red'))
+
+    # key path of the edited value as a list, new value after conversion
+    value_edited = Signal(object, object)
+    # key path, reason the entered text was refused
+    edit_rejected = Signal(object, str)
+
+    def __init__(self, parent=None):
+        super(ConfigTreeModel, self).__init__(parent)
+        self._data = {}
+        self._root = ConfigTreeNode(None, None, 0, None)
+        # key path tuple -> node, for every node created so far
+        self._path_index = {}
+        # key path tuple -> tooltip of values shown highlighted
+        self._highlights = {}
+        # key paths allowed by the filter, None shows everything
+        self._visible = None
+        # key path tuple -> value read back from the node, shown in the live column
+        self._live = {}
+        self._value_converter = None
+        # set between begin and end of any row insert or removal, rows are never fetched then
+        self._changing_rows = False
+
+    def set_value_converter(self, converter):
+        # converter(key_path, text) returns the value to store or raises ValueError
+        self._value_converter = converter
+
+    def set_config(self, data):
+        self.beginResetModel()
+        self._data = data if data is not None else {}
+        self._root = ConfigTreeNode(None, None, 0, None)
+        self._path_index = {}
+        self._highlights = {}
+        self._visible = None
+        self._live = {}
+        self.endResetModel()
+
+    def set_filter(self, paths):
+        """Only show these key paths and their parents, None shows everything again."""
+        visible = None
+        if paths is not None:
+            visible = set()
+            for path in paths:
+                path = tuple(path)
+                for depth in range(len(path), 0, -1):
+                    if path[:depth] in visible:
+                        break
+                    visible.add(path[:depth])
+        self.beginResetModel()
+        self._visible = visible
+        self._root = ConfigTreeNode(None, None, 0, None)
+        self._path_index = {}
+        self.endResetModel()
+
+    def is_filtered(self):
+        return self._visible is not None
+
+    def config(self):
+        return self._data
+
+    def key_path(self, index):
+        return list(self._node(index).path)
+
+    def container(self, index):
+        node = self._node(index)
+        return node.container, node.key
+
+    def index_for_path(self, path):
+        path = tuple(path)
+        node = self._path_index.get(path)
+        if node is None:
+            node = self._materialize(path)
+            if node is None:
+                return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def set_value(self, index, value):
+        node = self._node(index)
+        if node is self._root:
+            return False
+        node.container[node.key] = value
+        index = self.createIndex(node.row, 1, node)
+        self.dataChanged.emit(index, index)
+        return True
+
+    def set_value_at(self, path, value):
+        path = tuple(path)
+        node = self._path_index.get(path)
+        if node is not None:
+            return self.set_value(self.createIndex(node.row, 0, node), value)
+        # rows not created yet read the dict when they are, so only the dict is written
+        container = self._data
+        for key in path[:-1]:
+            container = container.get(key) if isinstance(container, dict) else None
+        if not path or not isinstance(container, dict) or path[-1] not in container:
+            return False
+        container[path[-1]] = value
+        return True
+
+    def insert_value(self, path, value):
+        """Add a key that is not in the config yet, with a row if its siblings have theirs."""
+        path = tuple(path)
+        container = self._container_at(path)
+        if container is None or path[-1] in container:
+            return False
+        key = path[-1]
+        parent = self._root if len(path) == 1 else self._path_index.get(path[:-1])
+        if parent is None or parent.keys is None or \
+                (self._visible is not None and path not in self._visible):
+            # rows not created yet read the dict when they are
+            container[key] = value
+            return True
+        row = next((i for i, k in enumerate(parent.keys) if str(k) > str(key)),
+                   len(parent.keys))
+        if row > len(parent.children) or \
+                (row == len(parent.children) and len(parent.children) < len(parent.keys)):
+            # among the rows not fetched yet
+            container[key] = value
+            parent.keys.insert(row, key)
+            return True
+        self._changing_rows = True
+        try:
+            self.beginInsertRows(self._index_of(parent), row, row)
+            container[key] = value
+            parent.keys.insert(row, key)
+            child = ConfigTreeNode(key, parent, row, container)
+            parent.children.insert(row, child)
+            for sibling in parent.children[row + 1:]:
+                sibling.row += 1
+            self._path_index[path] = child
+            self.endInsertRows()
+        finally:
+            self._changing_rows = False
+        return True
+
+    def remove_value(self, path):
+        path = tuple(path)
+        container = self._container_at(path)
+        if container is None or path[-1] not in container:
+            return False
+        node = self._path_index.get(path)
+        if node is None:
+            parent = self._root if len(path) == 1 else self._path_index.get(path[:-1])
+            if parent is not None and parent.keys is not None and path[-1] in parent.keys:
+                parent.keys.remove(path[-1])
+            del container[path[-1]]
+            return True
+        parent = node.parent
+        self._changing_rows = True
+        try:
+            self.beginRemoveRows(self._index_of(parent), node.row, node.row)
+            del parent.children[node.row]
+            for sibling in parent.children[node.row:]:
+                sibling.row -= 1
+            parent.keys.remove(node.key)
+            stack = [node]
+            while stack:
+                gone = stack.pop()
+                self._path_index.pop(gone.path, None)
+                self._highlights.pop(gone.path, None)
+                self._live.pop(gone.path, None)
+                stack.extend(gone.children)
+            del container[path[-1]]
+            self.endRemoveRows()
+        finally:
+            self._changing_rows = False
+        return True
+
+    def replace_value(self, path, value):
+        # a leaf keeps its row, a subtree or a change between the two is rebuilt
+        path = tuple(path)
+        container = self._container_at(path)
+        if container is None or path[-1] not in container:
+            return self.insert_value(path, value)
+        if not isinstance(container[path[-1]], dict) and not isinstance(value, dict):
+            return self.set_value_at(path, value)
+        self.remove_value(path)
+        return self.insert_value(path, value)
+
+    def set_highlighted(self, path, tooltip=None):
+        # tooltip None removes the highlight
+        path = tuple(path)
+        if tooltip is None:
+            if self._highlights.pop(path, None) is None:
+                return
+        else:
+            self._highlights[path] = tooltip
+        node = self._path_index.get(path)
+        if node is not None:
+            index = self.createIndex(node.row, 1, node)
+            self.dataChanged.emit(index, index)
+
+    def highlighted(self):
+        return dict(self._highlights)
+
+    def set_live_values(self, values):
+        self._live = dict(values)
+        # one range per parent of rows created so far
+        for node in [self._root] + list(self._path_index.values()):
+            if node.children:
+                first = self.createIndex(0, 2, node.children[0])
+                last = self.createIndex(len(node.children) - 1, 2, node.children[-1])
+                self.dataChanged.emit(first, last)
+
+    def set_live_value(self, path, value):
+        path = tuple(path)
+        self._live[path] = value
+        node = self._path_index.get(path)
+        if node is not None:
+            index = self.createIndex(node.row, 2, node)
+            self.dataChanged.emit(index, index)
+
+    def _materialize(self, path):
+        # create the rows leading to path, only needed for rows not yet shown
+        node = self._root
+        for depth in range(len(path)):
+            child = self._path_index.get(path[:depth + 1])
+            if child is None:
+                value = self._value(node)
+                if not isinstance(value, dict) or path[depth] not in value:
+                    return None
+                parent = self.createIndex(node.row, 0, node) if node is not self._root \
+                    else QModelIndex()
+                while self.canFetchMore(parent) and path[:depth + 1] not in self._path_index:
+                    self.fetchMore(parent)
+                child = self._path_index.get(path[:depth + 1])
+                if child is None:
+                    return None
+            node = child
+        return node
+
+    def _container_at(self, path):
+        # the dict that holds path[-1], or None
+        container = self._data
+        for key in path[:-1]:
+            container = container.get(key) if isinstance(container, dict) else None
+        return container if path and isinstance(container, dict) else None
+
+    def _index_of(self, node):
+        return QModelIndex() if node is self._root else self.createIndex(node.row, 0, node)
+
+    def _node(self, index):
+        if index.isValid():
+            return index.internalPointer()
+        return self._root
+
+    def _value(self, node):
+        if node is self._root:
+            return self._data
+        return node.container[node.key]
+
+    def _child_keys(self, node):
+        if node.keys is None:
+            value = self._value(node)
+            node.keys = sorted(value.keys(), key=str) if isinstance(value, dict) else []
+            if self._visible is not None:
+                node.keys = [k for k in node.keys if node.path + (k,) in self._visible]
+        return node.keys
+
+    def index(self, row, column, parent=QModelIndex()):
+        node = self._node(parent)
+        if row < 0 or row >= len(node.children) or column < 0 or \
+                column >= len(self._column_names):
+            return QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self._node(parent).children)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self._column_names)
+
+    def hasChildren(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return False
+        node = self._node(parent)
+        if self._visible is not None:
+            return len(self._child_keys(node)) > 0
+        value = self._value(node)
+        return isinstance(value, dict) and len(value) > 0
+
+    def canFetchMore(self, parent):
+        if parent.column() > 0 or self._changing_rows:
+            return False
+        node = self._node(parent)
+        if self._visible is not None:
+            return len(node.children) < len(self._child_keys(node))
+        value = self._value(node)
+        return isinstance(value, dict) and len(node.children) < len(value)
+
+    def fetchMore(self, parent):
+        if self._changing_rows:
+            # called from a rowsAboutToBeInserted or -Removed handler, rows change one step
+            # at a time
+            return
+        node = self._node(parent)
+        keys = self._child_keys(node)
+        start = len(node.children)
+        end = min(start + self._fetch_batch_size, len(keys))
+        if start >= end:
+            return
+        container = self._value(node)
+        self._changing_rows = True
+        try:
+            self.beginInsertRows(parent, start, end - 1)
+            for row in range(start, end):
+                child = ConfigTreeNode(keys[row], node, row, container)
+                node.children.append(child)
+                self._path_index[child.path] = child
+            self.endInsertRows()
+        finally:
+            self._changing_rows = False
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._column_names[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if index.column() == 2:
+            return self._live_data(node, role)
+        if role in (Qt.ForegroundRole, Qt.ToolTipRole):
+            if index.column() != 1 or node.path not in self._highlights:
+                return None
+            if role == Qt.ForegroundRole:
+                return self._highlight_brush
+            return self._highlights[node.path]
+        if role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        if index.column() == 0:
+            return str(node.key)
+        value = node.container[node.key]
+        if isinstance(value, dict):
+            return None
+        return str(value)
+
+    def _live_data(self, node, role):
+        if node.path not in self._live:
+            return None
+        live = str(self._live[node.path])
+        if role == Qt.DisplayRole:
+            return live
+        if role == Qt.ForegroundRole and live != str(node.container[node.key]):
+            return self._mismatch_brush
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == 1:
+            node = index.internalPointer()
+            if not isinstance(node.container[node.key], dict):
+                flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or index.column() != 1 or role != Qt.EditRole:
+            return False
+        node = index.internalPointer()
+        current = node.container[node.key]
+        if isinstance(current, dict):
+            # mappings are not edited as text, flags() says so too
+            return False
+        text = str(value)
+        if text == self.data(index, Qt.EditRole):
+            return False
+        path = self.key_path(index)
+        if self._value_converter is not None:
+            try:
+                value = self._value_converter(path, text)
+            except ValueError as e:
+                self.edit_rejected.emit(path, str(e))
+                return False
+        else:
+            value = text
+        if isinstance(current, list) and not isinstance(value, list):
+            # a list is edited as a whole, never replaced by a scalar
+            self.edit_rejected.emit(path, "'" + text + "' is not a list")
+            return False
+        self.set_value(index, value)
+        self.value_edited.emit(path, value)
+        return True
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+import collections.abc
+
+
+def flatten(d, parent_key='', sep='.'):
+    items = []
+    for k, v in d.items():
+        new_key = parent_key + sep + str(k) if parent_key else str(k)
+        if isinstance(v, collections.abc.MutableMapping):
+            items.extend(flatten(v, new_key, sep=sep).items())
+        else:
+            items.append((new_key, v))
+    return dict(items)
+
+
+def copy_config(value):
+    """Copy of the dicts and lists in a parsed config, scalars are shared as they are immutable."""
+    if isinstance(value, dict):
+        return {k: copy_config(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_config(v) for v in value]
+    return value
+
+
+def node_parameters(config_dict, node=None):
+    """
+    Flattened ros__parameters per node name, optionally limited to one node.
+
+    A '/**' section applies to every node, so its parameters are merged into each
+    node's set; without a node that is each node with a section of its own.
+    Sections later in the file win, as when ROS loads it.
+    """
+    sections = []
+    for section_name, section in config_dict.items():
+        if isinstance(section, dict) and isinstance(section.get('ros__parameters'), dict):
+            sections.append((str(section_name), section['ros__parameters']))
+    names = [node] if node is not None else []
+    if node is None:
+        # 'n' and '/n' are the same node, the first spelling names it
+        seen = {'**'}
+        for name, _ in sections:
+            if name.lstrip('/') not in seen:
+                seen.add(name.lstrip('/'))
+                names.append(name)
+    targets = {}
+    for section_name, params in sections:
+        if section_name.lstrip('/') == '**':
+            applies_to = names
+        else:
+            applies_to = [name for name in names
+                          if name.lstrip('/') == section_name.lstrip('/')]
+        if applies_to:
+            flat = flatten(params)
+            for name in applies_to:
+                targets.setdefault(name, {}).update(flat)
+    return targets
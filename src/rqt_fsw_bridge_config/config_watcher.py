@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+import concurrent.futures
+import os
+
+from python_qt_binding.QtCore import QFileSystemWatcher, QObject, QTimer, Signal, Slot
+
+from .config_cache import load_config_entry
+from .config_diff import diff_configs
+from .parameter_conversion import build_schema
+
+
+def _reparse(path, baseline, perf):
+    with perf.span('reparse_config_file') as counters:
+        entry = load_config_entry(path)
+        counters['bytes'] = entry.size
+    with perf.span('build_schema'):
+        entry.schema = build_schema(entry.data)
+    with perf.span('diff_config'):
+        changes = diff_configs(baseline, entry.data) if baseline is not None else None
+    return entry, changes
+
+
+class ConfigWatcher(QObject):
+    """
+    Watch config files and re-parse them in the background when they change.
+
+    Bursts of change notifications (editors and generators often write a file in
+    several steps) are collected for ``debounce_ms`` before a file is parsed. The
+    new entry is diffed on the worker thread against ``baseline_of(path)``, the
+    file as the caller last knew it, so the GUI thread only patches the changes.
+    """
+
+    # path, new ConfigCacheEntry, config_diff changes or None, the baseline they are from
+    changed = Signal(str, object, object, object)
+    # path, error message
+    failed = Signal(str, str)
+
+    # emitted from the worker thread
+    _done = Signal(int, str, object, object, object, str)
+
+    def __init__(self, perf, baseline_of, parent=None, debounce_ms=200):
+        super(ConfigWatcher, self).__init__(parent)
+        self._perf = perf
+        self._baseline_of = baseline_of
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='config_watch')
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._paths = set()
+        self._pending = set()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._reparse_pending)
+        # bumped for every parse, a file's older parses are dropped
+        self._generation = 0
+        self._latest = {}
+        self._done.connect(self._on_done)
+
+    def watch(self, paths):
+        """Watch exactly these paths from now on."""
+        paths = set(paths)
+        gone = [p for p in self._watcher.files() if p not in paths]
+        if gone:
+            self._watcher.removePaths(gone)
+        self._paths = paths
+        self._pending &= paths
+        self._add_existing(paths)
+
+    def watched(self):
+        return set(self._paths)
+
+    def shutdown(self):
+        self._timer.stop()
+        self._paths = set()
+        self._executor.shutdown(wait=False)
+
+    def _add_existing(self, paths):
+        # a file replaced by rename drops out of the watch and has to be added again
+        missing = [p for p in paths if p not in self._watcher.files() and os.path.exists(p)]
+        if missing:
+            self._watcher.addPaths(missing)
+
+    @Slot(str)
+    def _on_file_changed(self, path):
+        if path not in self._paths:
+            return
+        self._pending.add(path)
+        self._timer.start()
+
+    @Slot()
+    def _reparse_pending(self):
+        pending = self._pending
+        self._pending = set()
+        self._add_existing(pending)
+        for path in sorted(pending):
+            if not os.path.exists(path):
+                self.failed.emit(path, 'file was removed')
+                continue
+            self._generation += 1
+            self._latest[path] = self._generation
+            baseline = self._baseline_of(path)
+            future = self._executor.submit(_reparse, path, baseline, self._perf)
+            future.add_done_callback(
+                lambda f, path=path, gen=self._generation, baseline=baseline:
+                    self._report(gen, path, baseline, f))
+
+    def _report(self, generation, path, baseline, future):
+        try:
+            entry, changes = future.result()
+            self._done.emit(generation, path, entry, changes, baseline, '')
+        except Exception as e:
+            self._done.emit(generation, path, None, None, None, str(e) or type(e).__name__)
+
+    @Slot(int, str, object, object, object, str)
+    def _on_done(self, generation, path, entry, changes, baseline, error):
+        if self._latest.get(path) != generation or path not in self._paths:
+            return
+        del self._latest[path]
+        if entry is None:
+            self.failed.emit(path, error)
+        else:
+            self.changed.emit(path, entry, changes, baseline)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+import collections
+import concurrent.futures
+import hashlib
+import os
+import tempfile
+
+from python_qt_binding.QtCore import QObject, Signal, Slot
+
+from . import yaml_backend
+from .config_patch import patch_changed_values
+
+
+# content and changes are optional: the bytes the file was loaded from and the
+# config_diff changes since, which lets a save rewrite only the changed values
+SaveJob = collections.namedtuple('SaveJob', ['path', 'data', 'digest', 'token', 'content',
+                                             'changes'], defaults=(None, None))
+
+
+def write_atomically(path, content):
+    """Replace path with content so that a crash leaves either the old or the new file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.',
+                                    suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as outfile:
+            outfile.write(content)
+            outfile.flush()
+            os.fsync(outfile.fileno())
+        try:
+            # keep the permissions of the file being replaced, mkstemp creates it 0600
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    # make the rename itself durable
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def _dump_and_write(job, perf):
+    with perf.span('save_config') as counters:
+        content = None
+        if job.content is not None and job.changes:
+            content = patch_changed_values(job.content, job.data, job.changes)
+            counters['patched'] = len(job.changes) if content is not None else 0
+        if content is None:
+            content = yaml_backend.dump(job.data).encode()
+        counters['bytes'] = len(content)
+        if hashlib.sha1(content).hexdigest() == job.digest and os.path.exists(job.path):
+            return None
+        write_atomically(job.path, content)
+    return content
+
+
+class ConfigWriter(QObject):
+    """
+    Dump and write config files on a background thread.
+
+    Files are written one at a time in the order they were queued. When a job
+    carries its changes, only those values are rewritten in the file's text and
+    the rest of the file is left alone; otherwise the whole config is dumped. A
+    file whose new content matches the digest it was loaded with is not written.
+    Every file is reported through ``saved`` or ``failed`` and every call to
+    ``save()`` ends with one ``batch_finished``.
+    """
+
+    # path, content written or None if the file already had it, token given to save()
+    saved = Signal(str, object, object)
+    # path, error message
+    failed = Signal(str, str)
+    # written, already up to date, failed
+    batch_finished = Signal(int, int, int)
+
+    # emitted from the writer thread
+    _done = Signal(int, str, object, object, str)
+
+    def __init__(self, perf, parent=None):
+        super(ConfigWriter, self).__init__(parent)
+        self._perf = perf
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='config_writer')
+        self._next_batch = 1
+        # batch -> [files left, written, up to date, failed]
+        self._batches = {}
+        self._done.connect(self._on_done)
+
+    def is_busy(self):
+        return bool(self._batches)
+
+    def save(self, jobs):
+        """Save SaveJob tuples; data is read on another thread and must not change after."""
+        batch = self._next_batch
+        self._next_batch += 1
+        if not jobs:
+            self.batch_finished.emit(0, 0, 0)
+            return batch
+        self._batches[batch] = [len(jobs), 0, 0, 0]
+        for job in jobs:
+            job = SaveJob(*job)
+            future = self._executor.submit(_dump_and_write, job, self._perf)
+            future.add_done_callback(
+                lambda f, batch=batch, path=job.path, token=job.token:
+                    self._report(batch, path, token, f))
+        return batch
+
+    def shutdown(self):
+        # queued writes still finish, a half written file is never left behind either way
+        self._executor.shutdown(wait=True)
+
+    def _report(self, batch, path, token, future):
+        try:
+            self._done.emit(batch, path, future.result(), token, '')
+        except Exception as e:
+            self._done.emit(batch, path, None, token, str(e) or type(e).__name__)
+
+    @Slot(int, str, object, object, str)
+    def _on_done(self, batch, path, content, token, error):
+        counts = self._batches[batch]
+        counts[0] -= 1
+        if error:
+            counts[3] += 1
+            self.failed.emit(path, error)
+        else:
+            counts[1 if content is not None else 2] += 1
+            self.saved.emit(path, content, token)
+        if counts[0] == 0:
+            del self._batches[batch]
+            self.batch_finished.emit(counts[1], counts[2], counts[3])
@@ -1,9 +1,10 @@
+from python_qt_binding.QtGui import QFontDatabase
 from python_qt_binding.QtWidgets import QDialog, QDialogButtonBox
-from python_qt_binding.QtWidgets import QVBoxLayout, QLabel
+from python_qt_binding.QtWidgets import QLabel, QPlainTextEdit, QVBoxLayout
 
 
 class ConfirmDialog(QDialog):
-    def __init__(self, confirm_msg, parent=None):
+    def __init__(self, confirm_msg, parent=None, details=None):
         super().__init__(parent)
 
         self.setWindowTitle("ROS2-FSW Bridge Confirmation")
@@ -17,5 +18,13 @@ class ConfirmDialog(QDialog):
         self.layout = QVBoxLayout()
         message = QLabel(confirm_msg)
         self.layout.addWidget(message)
+        if details:
+            # e.g. the change list, one line per entry
+            self.details = QPlainTextEdit("\n".join(details))
+            self.details.setReadOnly(True)
+            self.details.setLineWrapMode(QPlainTextEdit.NoWrap)
+            self.details.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+            self.details.setMinimumWidth(480)
+            self.layout.addWidget(self.details)
         self.layout.addWidget(self.buttonBox)
         self.setLayout(self.layout)
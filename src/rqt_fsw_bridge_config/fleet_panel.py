@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+from python_qt_binding.QtCore import Qt, Signal, Slot
+from python_qt_binding.QtGui import QBrush, QColor
+from python_qt_binding.QtWidgets import QHBoxLayout, QLabel, QListWidget, QListWidgetItem
+from python_qt_binding.QtWidgets import QPushButton, QVBoxLayout, QWidget
+
+
+class FleetPanel(QWidget):
+
+    # node names of the checked bridges
+    send_requested = Signal(object)
+
+    def __init__(self, fleet, parent=None):
+        super(FleetPanel, self).__init__(parent)
+        self._fleet = fleet
+
+        self.bridge_list = QListWidget(self)
+        self.status_label = QLabel(self)
+        self.refresh_button = QPushButton("Refresh", self)
+        self.send_button = QPushButton("Send Config to Checked", self)
+        self.refresh_button.clicked.connect(self._fleet.refresh)
+        self.send_button.clicked.connect(self.send_pressed)
+        self._fleet.bridges_changed.connect(self.update_bridges)
+        self._fleet.push_progress.connect(self.on_push_progress)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.status_label)
+        buttons.addStretch()
+        buttons.addWidget(self.refresh_button)
+        buttons.addWidget(self.send_button)
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.bridge_list)
+        layout.addLayout(buttons)
+        self.setLayout(layout)
+
+    def showEvent(self, event):
+        self._fleet.refresh()
+        super(FleetPanel, self).showEvent(event)
+
+    def checked_nodes(self):
+        items = (self.bridge_list.item(row) for row in range(self.bridge_list.count()))
+        return [item.data(Qt.UserRole) for item in items if item.checkState() == Qt.Checked]
+
+    @Slot()
+    def update_bridges(self):
+        # keep the check marks of bridges that are still there
+        checked = set(self.checked_nodes())
+        self.bridge_list.clear()
+        for bridge in self._fleet.bridges():
+            item = QListWidgetItem(bridge.node_name + " (" + bridge.plugin_name + ")")
+            item.setData(Qt.UserRole, bridge.node_name)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked if bridge.node_name in checked else Qt.Unchecked)
+            self.bridge_list.addItem(item)
+        self.status_label.setText(str(self.bridge_list.count()) + " bridge(s)")
+
+    @Slot()
+    def send_pressed(self):
+        nodes = self.checked_nodes()
+        if nodes:
+            self.send_requested.emit(nodes)
+
+    @Slot(int, int)
+    def on_push_progress(self, done, total):
+        self.send_button.setEnabled(done == total)
+        self.status_label.setText("pushed to " + str(done) + "/" + str(total) + " bridge(s)")
+
+    def show_results(self, results, wall_ms):
+        failed_nodes = 0
+        for row in range(self.bridge_list.count()):
+            item = self.bridge_list.item(row)
+            r = results.get(item.data(Qt.UserRole))
+            if r is None:
+                continue
+            ok = r.failed == 0
+            failed_nodes += 0 if ok else 1
+            item.setForeground(QBrush(QColor('darkgreen' if ok else 'red')))
+            item.setToolTip(str(r.sent) + " set, " + str(r.failed) + " failed in " +
+                            '%.0f' % r.elapsed_ms + " ms" + ("" if ok else ": " + r.reason))
+        self.status_label.setText(
+            str(len(results) - failed_nodes) + "/" + str(len(results)) +
+            " bridge(s) ok in " + '%.0f' % wall_ms + " ms")
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+import collections
+
+from python_qt_binding.QtCore import QObject, QTimer, Signal, Slot
+
+from rcl_interfaces.msg import Parameter
+from rcl_interfaces.srv import SetParameters, SetParametersAtomically
+
+
+ParameterResult = collections.namedtuple('ParameterResult',
+                                         ['name', 'value', 'successful', 'reason'])
+
+
+class ParameterBatcher(QObject):
+    """
+    Coalesce live parameter edits into a single set request.
+
+    Edits are collected until no new edit arrived for ``window_ms`` (bounded by
+    ``max_delay_ms`` during a continuous burst) or until ``flush()`` is called.
+    Repeated edits to the same parameter keep only the latest value.
+    """
+
+    pending_changed = Signal(int)
+    # list of ParameterResult, one per parameter in the batch
+    batch_finished = Signal(object)
+
+    def __init__(self, service_caller, to_parameter_value, parent=None, window_ms=250,
+                 max_delay_ms=1000, atomic=False):
+        super(ParameterBatcher, self).__init__(parent)
+        self._service_caller = service_caller
+        self._to_parameter_value = to_parameter_value
+        self._params_client = None
+        self._atomic_client = None
+        self._atomic = atomic
+        self._pending = collections.OrderedDict()
+
+        self._window_timer = QTimer(self)
+        self._window_timer.setSingleShot(True)
+        self._window_timer.timeout.connect(self.flush)
+        self._max_delay_timer = QTimer(self)
+        self._max_delay_timer.setSingleShot(True)
+        self._max_delay_timer.timeout.connect(self.flush)
+        self.set_window(window_ms, max_delay_ms)
+
+    def set_clients(self, params_client, atomic_client):
+        self._params_client = params_client
+        self._atomic_client = atomic_client
+
+    def set_window(self, window_ms, max_delay_ms=None):
+        self._window_ms = max(0, int(window_ms))
+        if max_delay_ms is None:
+            max_delay_ms = 4 * self._window_ms
+        self._max_delay_ms = max(self._window_ms, int(max_delay_ms))
+
+    def window(self):
+        return self._window_ms
+
+    def set_atomic(self, atomic):
+        self._atomic = atomic
+
+    def pending(self):
+        return len(self._pending)
+
+    def is_pending(self, name):
+        return name in self._pending
+
+    def queue(self, name, value):
+        # move re-edited keys to the back so the request keeps edit order
+        self._pending.pop(name, None)
+        self._pending[name] = value
+        self.pending_changed.emit(len(self._pending))
+
+        if self._window_ms == 0:
+            self.flush()
+            return
+        self._window_timer.start(self._window_ms)
+        if not self._max_delay_timer.isActive():
+            self._max_delay_timer.start(self._max_delay_ms)
+
+    def discard(self):
+        self._window_timer.stop()
+        self._max_delay_timer.stop()
+        self._pending.clear()
+        self.pending_changed.emit(0)
+
+    @Slot()
+    def flush(self):
+        self._window_timer.stop()
+        self._max_delay_timer.stop()
+        if not self._pending:
+            return None
+
+        batch = self._pending
+        self._pending = collections.OrderedDict()
+        self.pending_changed.emit(0)
+
+        atomic = self._atomic
+        if atomic:
+            req = SetParametersAtomically.Request()
+            client = self._atomic_client
+        else:
+            req = SetParameters.Request()
+            client = self._params_client
+        for name, value in batch.items():
+            param = Parameter()
+            param.name = name
+            param.value = self._to_parameter_value(name, value)
+            req.parameters.append(param)
+
+        return self._service_caller.call(
+            client, req,
+            callback=lambda result: self._on_result(batch, atomic, result),
+            errback=lambda reason: self._on_failure(batch, reason),
+            description='set ' + str(len(batch)) + ' edited parameter(s)',
+            metric='send_parameter_set_request', counters={'params': len(batch)})
+
+    def _on_result(self, batch, atomic, result):
+        if atomic:
+            r = result.result
+            results = [ParameterResult(n, v, r.successful, r.reason) for n, v in batch.items()]
+        else:
+            results = [ParameterResult(n, v, r.successful, r.reason)
+                       for (n, v), r in zip(batch.items(), result.results)]
+        self.batch_finished.emit(results)
+
+    def _on_failure(self, batch, reason):
+        self.batch_finished.emit([ParameterResult(n, v, False, reason) for n, v in batch.items()])
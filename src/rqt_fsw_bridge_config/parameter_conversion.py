@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+
+from rcl_interfaces.msg import Parameter, ParameterType, ParameterValue
+
+from . import yaml_backend
+from .config_utils import flatten
+
+
+# ParameterValue field holding each parameter type
+_value_fields = {
+    ParameterType.PARAMETER_BOOL: 'bool_value',
+    ParameterType.PARAMETER_INTEGER: 'integer_value',
+    ParameterType.PARAMETER_DOUBLE: 'double_value',
+    ParameterType.PARAMETER_STRING: 'string_value',
+    ParameterType.PARAMETER_BYTE_ARRAY: 'byte_array_value',
+    ParameterType.PARAMETER_BOOL_ARRAY: 'bool_array_value',
+    ParameterType.PARAMETER_INTEGER_ARRAY: 'integer_array_value',
+    ParameterType.PARAMETER_DOUBLE_ARRAY: 'double_array_value',
+    ParameterType.PARAMETER_STRING_ARRAY: 'string_array_value',
+}
+
+# python value -> field value for each parameter type
+_field_converters = {
+    ParameterType.PARAMETER_BOOL: bool,
+    ParameterType.PARAMETER_INTEGER: int,
+    ParameterType.PARAMETER_DOUBLE: float,
+    ParameterType.PARAMETER_STRING: str,
+    ParameterType.PARAMETER_BYTE_ARRAY: lambda v: [bytes((b,)) for b in bytes(v)],
+    ParameterType.PARAMETER_BOOL_ARRAY: lambda v: [bool(x) for x in v],
+    ParameterType.PARAMETER_INTEGER_ARRAY: lambda v: [int(x) for x in v],
+    ParameterType.PARAMETER_DOUBLE_ARRAY: lambda v: [float(x) for x in v],
+    ParameterType.PARAMETER_STRING_ARRAY: lambda v: [str(x) for x in v],
+}
+
+_array_fields = (
+    ParameterType.PARAMETER_BOOL_ARRAY,
+    ParameterType.PARAMETER_INTEGER_ARRAY,
+    ParameterType.PARAMETER_DOUBLE_ARRAY,
+    ParameterType.PARAMETER_STRING_ARRAY,
+)
+
+_scalar_types = {
+    bool: ParameterType.PARAMETER_BOOL,
+    int: ParameterType.PARAMETER_INTEGER,
+    float: ParameterType.PARAMETER_DOUBLE,
+    str: ParameterType.PARAMETER_STRING,
+    bytes: ParameterType.PARAMETER_BYTE_ARRAY,
+    bytearray: ParameterType.PARAMETER_BYTE_ARRAY,
+}
+
+_array_types = {
+    frozenset((bool,)): ParameterType.PARAMETER_BOOL_ARRAY,
+    frozenset((int,)): ParameterType.PARAMETER_INTEGER_ARRAY,
+    frozenset((float,)): ParameterType.PARAMETER_DOUBLE_ARRAY,
+    frozenset((int, float)): ParameterType.PARAMETER_DOUBLE_ARRAY,
+    frozenset((str,)): ParameterType.PARAMETER_STRING_ARRAY,
+    # an empty list gives no hint, strings are the most forgiving choice
+    frozenset(): ParameterType.PARAMETER_STRING_ARRAY,
+}
+
+
+def parameter_type_of(value):
+    ptype = _scalar_types.get(type(value))
+    if ptype is not None:
+        return ptype
+    if isinstance(value, (list, tuple)):
+        # anything mixed is sent as its string form
+        return _array_types.get(frozenset(map(type, value)), ParameterType.PARAMETER_STRING)
+    if value is None:
+        return ParameterType.PARAMETER_NOT_SET
+    return ParameterType.PARAMETER_STRING
+
+
+def build_schema(config_dict):
+    """Parameter types of every node's ros__parameters, as {node: {name: type}}."""
+    schema = {}
+    for node_name, section in config_dict.items():
+        if isinstance(section, dict) and isinstance(section.get('ros__parameters'), dict):
+            flat = flatten(section['ros__parameters'])
+            schema[str(node_name)] = {name: parameter_type_of(v) for name, v in flat.items()}
+    return schema
+
+
+def parse_parameter_text(text, ptype=None):
+    """Turn text entered in the tree into a value of ptype, raise ValueError if it can't."""
+    if ptype is None:
+        return _guess_parameter_text(text)
+    if ptype == ParameterType.PARAMETER_STRING:
+        return text
+    if ptype == ParameterType.PARAMETER_BOOL:
+        lowered = text.strip().lower()
+        if lowered not in ('true', 'false'):
+            raise ValueError("'" + text + "' is not a bool")
+        return lowered == 'true'
+    if ptype == ParameterType.PARAMETER_INTEGER:
+        return int(text)
+    if ptype == ParameterType.PARAMETER_DOUBLE:
+        return float(text)
+
+    value = _load_text(text)
+    if ptype == ParameterType.PARAMETER_BYTE_ARRAY:
+        if isinstance(value, (bytes, list)):
+            try:
+                return bytes(value)
+            except (TypeError, ValueError):
+                pass
+        raise ValueError("'" + text + "' is not a byte array")
+    if not isinstance(value, list):
+        raise ValueError("'" + text + "' is not a list")
+    element = _field_converters[ptype]
+    try:
+        return element(value)
+    except (TypeError, ValueError):
+        raise ValueError("'" + text + "' does not match the expected element type")
+
+
+def parse_list_text(text):
+    """
+    Turn text entered for a list of mixed types into that list, raise ValueError if it isn't one.
+
+    Such lists are typed PARAMETER_STRING, since they are sent as their string
+    form, but in the file they stay lists.
+    """
+    value = _load_text(text)
+    if not isinstance(value, list):
+        raise ValueError("'" + text + "' is not a list")
+    return value
+
+
+def _load_text(text):
+    # loaded with the file by now, see yaml_backend
+    import yaml
+
+    try:
+        return yaml_backend.load(text)
+    except yaml.YAMLError as e:
+        raise ValueError("'" + text + "' is not valid yaml: " +
+                         (getattr(e, 'problem', None) or str(e)))
+
+
+def _guess_parameter_text(text):
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    lowered = text.lower()
+    if lowered in ('true', 'false'):
+        return lowered == 'true'
+    return text
+
+
+def to_parameter_value(value, ptype=None):
+    actual = parameter_type_of(value)
+    if ptype is None or ptype == ParameterType.PARAMETER_NOT_SET:
+        ptype = actual
+    elif actual == ParameterType.PARAMETER_STRING and ptype != actual:
+        value = parse_parameter_text(value, ptype)
+    if ptype == ParameterType.PARAMETER_NOT_SET:
+        return ParameterValue(type=ptype)
+    field = _value_fields[ptype]
+    return ParameterValue(**{'type': ptype, field: _field_converters[ptype](value)})
+
+
+def without_nulls(values):
+    """
+    Split the null leaves off values, return the rest and their names.
+
+    A null in the file leaves the parameter alone, sending it as NOT_SET would
+    undeclare it on the node.
+    """
+    nulls = [name for name, value in values.items() if value is None]
+    if not nulls:
+        return values, nulls
+    return {name: value for name, value in values.items() if value is not None}, nulls
+
+
+def to_parameters(values, schema=None):
+    """Convert a flat {name: value} dict to Parameter messages in one pass, nulls are left out."""
+    types = schema or {}
+    return [Parameter(name=name, value=to_parameter_value(value, types.get(name)))
+            for name, value in values.items() if value is not None]
+
+
+def from_parameter_value(pval):
+    field = _value_fields.get(pval.type)
+    if field is None:
+        return None
+    value = getattr(pval, field)
+    if pval.type == ParameterType.PARAMETER_BYTE_ARRAY:
+        return b''.join(value)
+    if pval.type in _array_fields:
+        return list(value)
+    return value
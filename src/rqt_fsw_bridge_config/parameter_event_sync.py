@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+from python_qt_binding.QtCore import QObject, Signal, Slot
+
+from rcl_interfaces.msg import ParameterEvent
+from rclpy.qos import qos_profile_parameter_events
+
+from .parameter_conversion import from_parameter_value
+
+
+class ParameterEventSync(QObject):
+    """
+    Follow one node's parameter changes on ``/parameter_events``.
+
+    Events of other nodes are dropped on the executor thread. The rest reach the
+    GUI thread as one {name: value} dict per event, with None for parameters
+    the node deleted.
+    """
+
+    parameters_changed = Signal(object)
+
+    # emitted from the executor thread
+    _event = Signal(object)
+
+    def __init__(self, node, parent=None):
+        super(ParameterEventSync, self).__init__(parent)
+        self._node = node
+        self._node_name = None
+        self._subscription = None
+        self._event.connect(self._on_event)
+
+    def watch_node(self, node_name):
+        self._node_name = '/' + node_name.lstrip('/')
+        if self._subscription is None:
+            self._subscription = self._node.create_subscription(
+                ParameterEvent, '/parameter_events', self._on_message,
+                qos_profile_parameter_events)
+
+    def stop(self):
+        self._node_name = None
+        if self._subscription is not None:
+            self._node.destroy_subscription(self._subscription)
+            self._subscription = None
+
+    def _on_message(self, msg):
+        if msg.node == self._node_name:
+            self._event.emit(msg)
+
+    @Slot(object)
+    def _on_event(self, msg):
+        # the watched node may have changed while the event was queued
+        if msg.node != self._node_name:
+            return
+        changes = {}
+        for param in list(msg.new_parameters) + list(msg.changed_parameters):
+            changes[param.name] = from_parameter_value(param.value)
+        for param in msg.deleted_parameters:
+            changes[param.name] = None
+        if changes:
+            self.parameters_changed.emit(changes)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+
+import time
+
+from python_qt_binding.QtCore import QObject, Signal
+
+from rcl_interfaces.srv import GetParameters, ListParameters
+
+from .parameter_conversion import from_parameter_value
+
+
+class ParameterReader(QObject):
+    """
+    Read back every parameter a node holds without a round trip per key.
+
+    Names are listed one page per prefix: a shallow listing of the whole node
+    finds the top level and second level groups, which are merged with the
+    groups the caller expects (normally those of the config file), and each
+    group is then listed recursively. Values are fetched in GetParameters
+    batches of ``batch_size`` names. All calls go through the RequestScheduler.
+    The result is cached for ``ttl_sec`` and kept current with ``update()``.
+    """
+
+    # values fetched, names listed
+    progress = Signal(int, int)
+    # {name: value}
+    finished = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, scheduler, parent=None, ttl_sec=5.0, batch_size=1000):
+        super(ParameterReader, self).__init__(parent)
+        self._scheduler = scheduler
+        self._ttl_sec = ttl_sec
+        self._batch_size = max(1, batch_size)
+        self._list_client = None
+        self._get_client = None
+        self._values = None
+        self._read_at = None
+        # bumped to drop the answers of a read that was abandoned
+        self._generation = 0
+        self._reading = False
+        self._names = set()
+        self._lists_pending = 0
+        self._gets_pending = 0
+        self._answered = 0
+        self._fetched = {}
+
+    def set_clients(self, list_client, get_client):
+        self._list_client = list_client
+        self._get_client = get_client
+
+    def is_reading(self):
+        return self._reading
+
+    def age_sec(self):
+        return None if self._read_at is None else time.monotonic() - self._read_at
+
+    def cached(self):
+        # values of the last read, None once they are older than the ttl
+        age = self.age_sec()
+        if age is None or age > self._ttl_sec:
+            return None
+        return self._values
+
+    def invalidate(self):
+        self._generation += 1
+        self._reading = False
+        self._values = None
+        self._read_at = None
+
+    def update(self, changes):
+        # changes seen on /parameter_events, None for deleted parameters
+        if self._values is None:
+            return
+        for name, value in changes.items():
+            if value is None:
+                self._values.pop(name, None)
+            else:
+                self._values[name] = value
+
+    def read(self, prefixes=(), force=False):
+        """Start a read, or report the cached values if they are fresh; False if busy."""
+        if self._reading:
+            return False
+        if not force and self.cached() is not None:
+            self.finished.emit(self._values)
+            return True
+        self._generation += 1
+        self._reading = True
+        self._names = set()
+        self._fetched = {}
+        self._lists_pending = 0
+        self._gets_pending = 0
+        self._answered = 0
+        self._list([], 2, self._generation, set(prefixes))
+        return True
+
+    def _list(self, prefixes, depth, generation, expected=None):
+        req = ListParameters.Request()
+        req.prefixes = prefixes
+        req.depth = depth
+        self._lists_pending += 1
+        self._scheduler.submit(
+            self._list_client, req,
+            callback=lambda result: self._on_list(generation, expected, result),
+            errback=lambda reason: self._fail(generation, reason),
+            description='list parameters' + (' under ' + prefixes[0] if prefixes else ''),
+            metric='list_parameters')
+
+    def _on_list(self, generation, expected, result):
+        if generation != self._generation:
+            return
+        self._lists_pending -= 1
+        self._names.update(result.result.names)
+        if expected is not None:
+            # the shallow listing of the whole node, now list each group on its own
+            groups = {p.split('.')[0] for p in result.result.prefixes} | expected
+            for group in sorted(groups):
+                self._list([group], ListParameters.Request.DEPTH_RECURSIVE, generation)
+        if self._lists_pending == 0:
+            self._get_values(generation)
+
+    def _get_values(self, generation):
+        names = sorted(self._names)
+        self.progress.emit(0, len(names))
+        if not names:
+            self._finish()
+            return
+        for i in range(0, len(names), self._batch_size):
+            batch = names[i:i + self._batch_size]
+            req = GetParameters.Request()
+            req.names = batch
+            self._gets_pending += 1
+            self._scheduler.submit(
+                self._get_client, req,
+                callback=lambda result, batch=batch: self._on_values(generation, batch, result),
+                errback=lambda reason: self._fail(generation, reason),
+                description='get ' + str(len(batch)) + ' parameters',
+                metric='get_parameters', counters={'params': len(batch)})
+
+    def _on_values(self, generation, names, result):
+        if generation != self._generation:
+            return
+        self._gets_pending -= 1
+        self._answered += len(names)
+        for name, pval in zip(names, result.values):
+            value = from_parameter_value(pval)
+            # undeclared between listing and reading
+            if value is not None:
+                self._fetched[name] = value
+        self.progress.emit(self._answered, len(self._names))
+        if self._gets_pending == 0:
+            self._finish()
+
+    def _finish(self):
+        self._reading = False
+        self._values = self._fetched
+        self._fetched = {}
+        self._read_at = time.monotonic()
+        self.finished.emit(self._values)
+
+    def _fail(self, generation, reason):
+        if generation != self._generation:
+            return
+        # the rest of this read is of no use any more
+        self._generation += 1
+        self._reading = False
+        self.failed.emit(reason)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+import collections
+
+from .config_diff import diff_configs, REMOVED
+
+
+ParameterDelta = collections.namedtuple('ParameterDelta', ['changed', 'removed', 'skipped'])
+
+
+class ParameterShadow:
+    """
+    Last parameter values known to be applied on the plugin node.
+
+    Both sides hold typed values: the file's as loaded, edits as converted by
+    ``parameter_conversion.parse_parameter_text`` and the node's as read back by
+    ``from_parameter_value``. Only the ``str()`` of the applied value is kept, and
+    a value counts as unchanged when its ``str()`` matches it, so a list read back
+    from the node equals the same list in the file, while 1 and 1.0 differ.
+
+    Values seeded from the node only tell what the node holds. Names missing from
+    the file are removed from the node only if they were committed, that is
+    pushed from the file before, so parameters the file never had, such as
+    ``use_sim_time``, are left alone.
+    """
+
+    def __init__(self):
+        self._applied = {}
+        self._pushed = set()
+
+    def __len__(self):
+        return len(self._applied)
+
+    def __contains__(self, name):
+        return name in self._applied
+
+    def clear(self):
+        self._applied.clear()
+        self._pushed.clear()
+
+    def names(self):
+        return list(self._applied.keys())
+
+    def seed(self, values):
+        for name, value in values.items():
+            if value is not None:
+                self._applied[name] = self._canonical(value)
+
+    def commit(self, name, value):
+        self._applied[name] = self._canonical(value)
+        self._pushed.add(name)
+
+    def forget(self, name):
+        self._applied.pop(name, None)
+        self._pushed.discard(name)
+
+    def changes(self, flat_dict):
+        # config_diff changes from what the node holds to flat_dict, paths are (name,)
+        applied = {name: value for name, value in self._applied.items()
+                   if name in flat_dict or name in self._pushed}
+        return diff_configs(applied, flat_dict,
+                            lambda applied, value: applied == self._canonical(value))
+
+    def delta(self, flat_dict, changes=None):
+        changed = {}
+        removed = []
+        for change in self.changes(flat_dict) if changes is None else changes:
+            if change.kind == REMOVED:
+                if change.path[0] not in self._pushed:
+                    continue
+                removed.append(change.path[0])
+            else:
+                changed[change.path[0]] = change.new
+        return ParameterDelta(changed, removed, len(flat_dict) - len(changed))
+
+    def _canonical(self, value):
+        return str(value)
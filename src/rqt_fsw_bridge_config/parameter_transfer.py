@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+
+import collections
+import time
+
+from python_qt_binding.QtCore import QObject, Signal
+
+from rcl_interfaces.srv import SetParameters
+
+
+# failures maps each parameter that could not be set to its last reason
+TransferSummary = collections.namedtuple(
+    'TransferSummary', ['total', 'succeeded', 'failures', 'chunks', 'retried', 'elapsed_ms'])
+
+
+class ParameterTransfer(QObject):
+    """
+    Send a large list of Parameter messages as a series of SetParameters chunks.
+
+    At most ``window`` chunks of this transfer are in flight at once, and all of
+    them go through the RequestScheduler, so a big push shares the service
+    bounds with everything else. Parameters the node rejected, or whose chunk
+    was lost, are sent again in new chunks up to ``max_retries`` times. The
+    outcome is reported once, as a TransferSummary.
+    """
+
+    # parameters answered (successfully or finally failed), total
+    progress = Signal(int, int)
+    # TransferSummary
+    finished = Signal(object)
+
+    def __init__(self, scheduler, client, parameters, parent=None, chunk_size=500, window=4,
+                 max_retries=2, description='', metric=None):
+        super(ParameterTransfer, self).__init__(parent)
+        self._scheduler = scheduler
+        self._client = client
+        self._total = len(parameters)
+        self._chunk_size = max(1, chunk_size)
+        self._window = max(1, window)
+        self._max_retries = max(0, max_retries)
+        self._description = description or 'parameters'
+        self._metric = metric
+        # (attempt, [Parameter]) waiting for a slot in the window
+        self._chunks = collections.deque(
+            (0, parameters[i:i + self._chunk_size])
+            for i in range(0, len(parameters), self._chunk_size))
+        self._in_flight = 0
+        self._sent_chunks = 0
+        self._retried = 0
+        self._succeeded = 0
+        self._failures = {}
+        self._started = None
+        self._cancelled = False
+
+    def start(self):
+        self._started = time.perf_counter()
+        self.progress.emit(0, self._total)
+        self._fill_window()
+        if not self._in_flight:
+            self._finish()
+
+    def cancel(self, reason='cancelled'):
+        # chunks already in flight are left to the service caller
+        if self._cancelled or self.is_finished():
+            return
+        self._cancelled = True
+        while self._chunks:
+            _, chunk = self._chunks.popleft()
+            for param in chunk:
+                self._failures[param.name] = reason
+        if self._started is not None and not self._in_flight:
+            self._finish()
+
+    def is_finished(self):
+        return self._started is not None and not self._in_flight and not self._chunks
+
+    def _answered(self):
+        return self._succeeded + len(self._failures)
+
+    def _fill_window(self):
+        while self._chunks and self._in_flight < self._window and not self._cancelled:
+            attempt, chunk = self._chunks.popleft()
+            req = SetParameters.Request()
+            req.parameters = chunk
+            self._in_flight += 1
+            self._sent_chunks += 1
+            self._scheduler.submit(
+                self._client, req,
+                callback=lambda result, c=chunk, a=attempt: self._on_result(c, a, result),
+                errback=lambda reason, c=chunk, a=attempt: self._on_failure(c, a, reason),
+                description='set ' + str(len(chunk)) + ' ' + self._description +
+                ('' if attempt == 0 else ' (retry ' + str(attempt) + ')'),
+                metric=self._metric, counters={'params': len(chunk)})
+
+    def _on_result(self, chunk, attempt, result):
+        retry = []
+        for param, r in zip(chunk, result.results):
+            if r.successful:
+                self._succeeded += 1
+                self._failures.pop(param.name, None)
+            else:
+                retry.append(param)
+                self._failures[param.name] = r.reason
+        self._chunk_done(retry, attempt)
+
+    def _on_failure(self, chunk, attempt, reason):
+        for param in chunk:
+            self._failures[param.name] = reason
+        self._chunk_done(chunk, attempt)
+
+    def _chunk_done(self, retry, attempt):
+        self._in_flight -= 1
+        if retry and attempt < self._max_retries and not self._cancelled:
+            # not final yet, take them out of the failures until they are answered again
+            for param in retry:
+                del self._failures[param.name]
+            self._retried += len(retry)
+            self._chunks.append((attempt + 1, retry))
+        self.progress.emit(self._answered(), self._total)
+        self._fill_window()
+        if not self._in_flight and not self._chunks:
+            self._finish()
+
+    def _finish(self):
+        elapsed_ms = (time.perf_counter() - self._started) * 1000.0
+        self.finished.emit(TransferSummary(self._total, self._succeeded, dict(self._failures),
+                                           self._sent_chunks, self._retried, elapsed_ms))
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+
+import bisect
+import collections
+import contextlib
+import json
+import os
+import threading
+import time
+
+
+# upper bounds of the latency histogram buckets in ms, the last bucket is open ended
+HISTOGRAM_BOUNDS_MS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+
+class SpanStats:
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.failures = 0
+        self.total_ms = 0.0
+        self.min_ms = None
+        self.max_ms = 0.0
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.counters = collections.Counter()
+
+    def add(self, duration_ms, failed, counters):
+        self.count += 1
+        if failed:
+            self.failures += 1
+        self.total_ms += duration_ms
+        self.min_ms = duration_ms if self.min_ms is None else min(self.min_ms, duration_ms)
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.histogram[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, duration_ms)] += 1
+        self.counters.update(counters)
+
+    def mean_ms(self):
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile_ms(self, p):
+        # upper bound of the bucket holding the p-th percentile
+        if not self.count:
+            return 0.0
+        target = p / 100.0 * self.count
+        seen = 0
+        for idx, n in enumerate(self.histogram):
+            seen += n
+            if seen >= target:
+                return HISTOGRAM_BOUNDS_MS[idx] if idx < len(HISTOGRAM_BOUNDS_MS) \
+                    else self.max_ms
+        return self.max_ms
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'failures': self.failures,
+            'total_ms': self.total_ms,
+            'mean_ms': self.mean_ms(),
+            'min_ms': self.min_ms or 0.0,
+            'max_ms': self.max_ms,
+            'p50_ms': self.percentile_ms(50),
+            'p90_ms': self.percentile_ms(90),
+            'p99_ms': self.percentile_ms(99),
+            # counts per bucket, bucket i holds durations up to HISTOGRAM_BOUNDS_MS[i]
+            'histogram_bounds_ms': HISTOGRAM_BOUNDS_MS,
+            'histogram': list(self.histogram),
+            'counters': dict(self.counters),
+        }
+
+
+class PerfRecorder:
+    """
+    Timings and counters for the widget's hot paths.
+
+    Synchronous work is wrapped in ``span()``, asynchronous round trips use
+    ``start()``/``finish()``. Recording is thread safe so the preload workers can
+    report too. The last ``max_events`` spans are kept for a Chrome trace export.
+    """
+
+    def __init__(self, max_events=20000):
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._events = collections.deque(maxlen=max_events)
+        self._epoch = time.perf_counter()
+
+    @contextlib.contextmanager
+    def span(self, name, **counters):
+        # callers may add counters (bytes, params, ...) to the yielded dict
+        token = self.start(name)
+        failed = False
+        try:
+            yield counters
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.finish(token, failed, **counters)
+
+    def start(self, name):
+        return (name, time.perf_counter())
+
+    def finish(self, token, failed=False, **counters):
+        name, start = token
+        end = time.perf_counter()
+        duration_ms = (end - start) * 1000.0
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = SpanStats(name)
+            stats.add(duration_ms, failed, counters)
+            self._events.append((name, start - self._epoch, end - start,
+                                 threading.get_ident(), failed, counters))
+        return duration_ms
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self._events.clear()
+
+    def stats(self):
+        with self._lock:
+            return sorted(self._stats.values(), key=lambda s: s.name)
+
+    def to_json(self):
+        with self._lock:
+            return json.dumps({name: s.to_dict() for name, s in self._stats.items()},
+                              indent=2, sort_keys=True)
+
+    def to_chrome_trace(self):
+        pid = os.getpid()
+        with self._lock:
+            events = [{
+                'name': name,
+                'cat': 'failed' if failed else 'ok',
+                'ph': 'X',
+                'ts': start * 1e6,
+                'dur': duration * 1e6,
+                'pid': pid,
+                'tid': tid,
+                'args': counters,
+            } for name, start, duration, tid, failed, counters in self._events]
+        return json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'})
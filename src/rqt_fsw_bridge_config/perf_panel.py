@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+from python_qt_binding.QtCore import QTimer, Slot
+from python_qt_binding.QtWidgets import QFileDialog, QHBoxLayout, QPushButton
+from python_qt_binding.QtWidgets import QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget
+
+
+class PerfPanel(QWidget):
+
+    _column_names = ['span', 'count', 'failed', 'mean ms', 'p50 ms', 'p90 ms', 'p99 ms',
+                     'max ms', 'params', 'bytes']
+
+    def __init__(self, recorder, parent=None, refresh_ms=1000):
+        super(PerfPanel, self).__init__(parent)
+        self._recorder = recorder
+
+        self.table = QTableWidget(0, len(self._column_names), self)
+        self.table.setHorizontalHeaderLabels(self._column_names)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+
+        self.export_json_button = QPushButton("Export JSON", self)
+        self.export_trace_button = QPushButton("Export Chrome Trace", self)
+        self.reset_button = QPushButton("Reset", self)
+        self.export_json_button.clicked.connect(self.export_json_pressed)
+        self.export_trace_button.clicked.connect(self.export_trace_pressed)
+        self.reset_button.clicked.connect(self.reset_pressed)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.export_json_button)
+        buttons.addWidget(self.export_trace_button)
+        buttons.addStretch()
+        buttons.addWidget(self.reset_button)
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.table)
+        layout.addLayout(buttons)
+        self.setLayout(layout)
+
+        # only refresh while someone is looking
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(refresh_ms)
+        self._refresh_timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self._refresh_timer.start()
+        super(PerfPanel, self).showEvent(event)
+
+    def hideEvent(self, event):
+        self._refresh_timer.stop()
+        super(PerfPanel, self).hideEvent(event)
+
+    @Slot()
+    def refresh(self):
+        stats = self._recorder.stats()
+        self.table.setRowCount(len(stats))
+        for row, s in enumerate(stats):
+            values = [s.name, str(s.count), str(s.failures),
+                      '%.2f' % s.mean_ms(), '%.2f' % s.percentile_ms(50),
+                      '%.2f' % s.percentile_ms(90), '%.2f' % s.percentile_ms(99),
+                      '%.2f' % s.max_ms, str(s.counters.get('params', '')),
+                      str(s.counters.get('bytes', ''))]
+            for col, value in enumerate(values):
+                self.table.setItem(row, col, QTableWidgetItem(value))
+
+    @Slot()
+    def export_json_pressed(self):
+        self._export("Export performance counters", "JSON (*.json)", self._recorder.to_json)
+
+    @Slot()
+    def export_trace_pressed(self):
+        self._export("Export Chrome trace", "Chrome trace (*.json)",
+                     self._recorder.to_chrome_trace)
+
+    @Slot()
+    def reset_pressed(self):
+        self._recorder.reset()
+        self.refresh()
+
+    def _export(self, title, file_filter, content):
+        fname, _ = QFileDialog.getSaveFileName(self, title, '', file_filter)
+        if not fname:
+            return
+        with open(fname, 'w') as outfile:
+            outfile.write(content())
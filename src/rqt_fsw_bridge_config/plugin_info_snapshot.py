@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+import collections
+import json
+
+
+# the parts of a GetPluginInfo response the widget needs to show a bridge
+PluginInfoSnapshot = collections.namedtuple('PluginInfoSnapshot',
+                                            ['node_name', 'plugin_name', 'config_files'])
+
+
+def snapshot_of(plugin_info):
+    return PluginInfoSnapshot(str(plugin_info.node_name), str(plugin_info.plugin_name),
+                              tuple(str(f) for f in plugin_info.config_files))
+
+
+def snapshot_differences(old, new):
+    differences = []
+    if old.node_name != new.node_name:
+        differences.append('node: ' + old.node_name + ' -> ' + new.node_name)
+    if old.plugin_name != new.plugin_name:
+        differences.append('plugin: ' + old.plugin_name + ' -> ' + new.plugin_name)
+    old_files = set(old.config_files)
+    new_files = set(new.config_files)
+    differences.extend('config file added: ' + f for f in new.config_files if f not in old_files)
+    differences.extend('config file removed: ' + f for f in old.config_files
+                       if f not in new_files)
+    return differences
+
+
+def load_snapshots(text):
+    """{info service name: PluginInfoSnapshot} from dump_snapshots() output, {} if unusable."""
+    try:
+        raw = json.loads(text)
+        return {str(service): PluginInfoSnapshot(str(s['node_name']), str(s['plugin_name']),
+                                                 tuple(str(f) for f in s['config_files']))
+                for service, s in raw.items()}
+    except (TypeError, ValueError, KeyError, AttributeError):
+        return {}
+
+
+def dump_snapshots(snapshots):
+    return json.dumps({service: s._asdict() for service, s in snapshots.items()},
+                      sort_keys=True)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import collections
+
+from python_qt_binding.QtCore import QObject
+
+
+class RequestScheduler(QObject):
+    """
+    Bound the number of service calls in flight.
+
+    Calls beyond ``max_in_flight`` wait in a FIFO queue and are handed to the
+    AsyncServiceCaller as earlier ones complete, so fanning out to many nodes
+    neither floods the executor nor waits for one node before asking the next.
+    """
+
+    def __init__(self, service_caller, max_in_flight=8, parent=None):
+        super(RequestScheduler, self).__init__(parent)
+        self._service_caller = service_caller
+        self._max_in_flight = max(1, max_in_flight)
+        self._queue = collections.deque()
+        self._active = 0
+
+    def set_max_in_flight(self, max_in_flight):
+        self._max_in_flight = max(1, max_in_flight)
+        self._pump()
+
+    def max_in_flight(self):
+        return self._max_in_flight
+
+    def queued(self):
+        return len(self._queue)
+
+    def active(self):
+        return self._active
+
+    def submit(self, client, request, callback=None, errback=None, **kwargs):
+        # kwargs are passed on to AsyncServiceCaller.call
+        self._queue.append((client, request, callback, errback, kwargs))
+        self._pump()
+
+    def cancel_queued(self, reason='cancelled'):
+        # requests already in flight are cancelled through the service caller
+        queue = self._queue
+        self._queue = collections.deque()
+        for _, _, _, errback, _ in queue:
+            if errback is not None:
+                errback(reason)
+
+    def _pump(self):
+        while self._queue and self._active < self._max_in_flight:
+            client, request, callback, errback, kwargs = self._queue.popleft()
+            self._active += 1
+            self._service_caller.call(
+                client, request,
+                callback=lambda result, fn=callback: self._on_done(fn, result),
+                errback=lambda reason, fn=errback: self._on_done(fn, reason),
+                **kwargs)
+
+    def _on_done(self, fn, arg):
+        self._active -= 1
+        if fn is not None:
+            fn(arg)
+        self._pump()
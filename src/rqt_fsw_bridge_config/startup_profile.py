@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+"""
+Where the plugin's startup time goes.
+
+``python3 -m rqt_fsw_bridge_config.startup_profile`` imports the widget module in
+a fresh interpreter with ``-X importtime``, after the modules rqt has loaded
+before any plugin, and prints the slowest imports it adds. Setting
+RQT_FSW_BRIDGE_CONFIG_PROFILE_STARTUP=1 makes the plugin log how long importing,
+building and starting the widget took.
+"""
+
+import argparse
+import collections
+import os
+import subprocess
+import sys
+
+
+PROFILE_ENV_VAR = 'RQT_FSW_BRIDGE_CONFIG_PROFILE_STARTUP'
+WIDGET_MODULE = 'rqt_fsw_bridge_config.bridge_config_widget'
+# loaded by rqt and its python plugin host before this plugin is
+RQT_PRELOADED = ('python_qt_binding.QtWidgets', 'rclpy.node', 'rqt_gui_py.plugin')
+
+_MARKER = '-- preloaded --'
+
+# times in ms, depth is how deep in the import chain the module was reached
+ImportTime = collections.namedtuple('ImportTime', ['module', 'self_ms', 'cumulative_ms',
+                                                   'depth'])
+
+
+def enabled():
+    return os.environ.get(PROFILE_ENV_VAR, '') not in ('', '0')
+
+
+def parse_import_times(text):
+    """Parse ``-X importtime`` output into ImportTimes, only those after the marker if any."""
+    lines = text.splitlines()
+    if _MARKER in lines:
+        lines = lines[lines.index(_MARKER) + 1:]
+    times = []
+    for line in lines:
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # the header line
+            continue
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        times.append(ImportTime(module, int(fields[0]) / 1000.0, int(fields[1]) / 1000.0,
+                                (len(name) - len(module) - 1) // 2))
+    return times
+
+
+def import_times(module=WIDGET_MODULE, preload=RQT_PRELOADED, python=sys.executable):
+    """Time the imports module adds in a fresh interpreter that already has preload imported."""
+    code = ''.join('import ' + m + '\n' for m in preload)
+    code += 'import sys\nsys.stderr.write(' + repr(_MARKER + '\n') + ')\n'
+    code += 'import ' + module + '\n'
+    result = subprocess.run([python, '-X', 'importtime', '-c', code],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            universal_newlines=True)
+    if result.returncode != 0:
+        raise RuntimeError('importing ' + module + ' failed:\n' + result.stderr[-2000:])
+    return parse_import_times(result.stderr)
+
+
+def total_ms(times):
+    return sum(t.self_ms for t in times)
+
+
+def slowest(times, count=20):
+    return sorted(times, key=lambda t: t.self_ms, reverse=True)[:count]
+
+
+def format_times(times, count=20):
+    lines = ['%8.1f ms  %s' % (t.self_ms, t.module) for t in slowest(times, count)]
+    lines.append('%8.1f ms  total for %d module(s)' % (total_ms(times), len(times)))
+    return lines
+
+
+def format_phases(phases):
+    # [(name, ms)] as logged by the plugin in profile mode
+    return 'startup: ' + ', '.join(name + ' ' + '%.1f' % ms + ' ms' for name, ms in phases) + \
+        ', total ' + '%.1f' % sum(ms for _, ms in phases) + ' ms'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python3 -m rqt_fsw_bridge_config.startup_profile',
+        description='Show which imports the plugin widget adds to an rqt that is already '
+                    'running.')
+    parser.add_argument('module', nargs='?', default=WIDGET_MODULE)
+    parser.add_argument('--preload', nargs='*', default=list(RQT_PRELOADED),
+                        help='modules imported before timing starts')
+    parser.add_argument('--top', type=int, default=20, help='how many modules to list')
+    parser.add_argument('--budget-ms', type=float,
+                        help='exit with 1 if the imports take longer than this')
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    try:
+        times = import_times(args.module, args.preload)
+    except RuntimeError as e:
+        sys.stderr.write(str(e) + '\n')
+        return 2
+    for line in format_times(times, args.top):
+        print(line)
+    if args.budget_ms is not None and total_ms(times) > args.budget_ms:
+        print('over the budget of %.1f ms' % args.budget_ms)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+import os
+
+
+BACKEND_ENV_VAR = 'RQT_FSW_BRIDGE_CONFIG_YAML_BACKEND'
+
+# name -> (loader, dumper), fastest first; yaml is only imported on first use so
+# that loading the plugin does not pay for it
+_backends = None
+_backend = None
+
+
+def backends():
+    global _backends
+    if _backends is None:
+        import yaml
+
+        found = {}
+        try:
+            found['libyaml'] = (yaml.CSafeLoader, yaml.CSafeDumper)
+        except AttributeError:
+            # PyYAML built without libyaml
+            pass
+        found['python'] = (yaml.SafeLoader, yaml.SafeDumper)
+        _backends = found
+    return _backends
+
+
+def available_backends():
+    return list(backends().keys())
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        requested = os.environ.get(BACKEND_ENV_VAR, '')
+        _backend = requested if requested in backends() else available_backends()[0]
+    return _backend
+
+
+def set_backend(name):
+    global _backend
+    if name not in backends():
+        raise ValueError("unknown yaml backend '" + name + "', available: " +
+                         ', '.join(available_backends()))
+    _backend = name
+
+
+def _yaml():
+    import yaml
+    return yaml
+
+
+def load(stream, backend=None):
+    loader, _ = backends()[backend or get_backend()]
+    return _yaml().load(stream, Loader=loader)
+
+
+def compose(stream, backend=None):
+    # the node graph with source positions, nothing is constructed
+    loader, _ = backends()[backend or get_backend()]
+    return _yaml().compose(stream, Loader=loader)
+
+
+def dump(data, stream=None, backend=None):
+    _, dumper = backends()[backend or get_backend()]
+    return _yaml().dump(data, stream, Dumper=dumper, default_flow_style=False)
+
+
+def dump_inline(data, backend=None):
+    # flow style on a single line, for replacing one value in a file's text
+    _, dumper = backends()[backend or get_backend()]
+    text = _yaml().dump(data, Dumper=dumper, default_flow_style=True, width=1 << 30,
+                        allow_unicode=True)
+    if text.endswith('\n...\n'):
+        text = text[:-len('\n...\n')]
+    return text.rstrip('\n')
@@ -0,0 +1,7 @@
+# Lets the tests import the package from a checkout as well as from a built
+# workspace, where the installed package comes first anyway.
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
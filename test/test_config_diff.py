@@ -0,0 +1,73 @@
+# Structural diff of configs.
+
+from rqt_fsw_bridge_config.config_diff import ADDED, agrees, apply_change, CHANGED, \
+    ConfigChange, diff_configs, format_changes, path_conflicts, REMOVED, same_text, \
+    summarize_changes
+
+
+def test_identical_configs_have_no_changes():
+    config = {'a': 1, 'b': {'c': [1, 2], 'd': 'x'}}
+    assert diff_configs(config, {'a': 1, 'b': {'c': [1, 2], 'd': 'x'}}) == []
+
+
+def test_changes_come_in_document_order():
+    old = {'a': 1, 'b': {'c': 2, 'd': 3}, 'e': 4}
+    new = {'a': 1, 'b': {'c': 5, 'f': 6}, 'g': 7}
+    assert diff_configs(old, new) == [
+        ConfigChange(CHANGED, ('b', 'c'), 2, 5),
+        ConfigChange(REMOVED, ('b', 'd'), 3, None),
+        ConfigChange(ADDED, ('b', 'f'), None, 6),
+        ConfigChange(REMOVED, ('e',), 4, None),
+        ConfigChange(ADDED, ('g',), None, 7),
+    ]
+
+
+def test_types_tell_values_apart():
+    assert diff_configs({'a': 1}, {'a': 1.0}) == [ConfigChange(CHANGED, ('a',), 1, 1.0)]
+    assert diff_configs({'a': True}, {'a': 1}) == [ConfigChange(CHANGED, ('a',), True, 1)]
+    assert diff_configs({'a': 1}, {'a': '1'}, equal=same_text) == []
+
+
+def test_lists_are_leaves_and_dicts_replacing_leaves_are_changes():
+    assert diff_configs({'a': [1, 2]}, {'a': [1, 3]}) == \
+        [ConfigChange(CHANGED, ('a',), [1, 2], [1, 3])]
+    assert diff_configs({'a': 1}, {'a': {'b': 1}}) == \
+        [ConfigChange(CHANGED, ('a',), 1, {'b': 1})]
+
+
+def test_applying_the_changes_turns_old_into_new():
+    old = {'a': 1, 'b': {'c': 2, 'd': [3]}, 'e': 4}
+    new = {'a': 1, 'b': {'c': 5, 'f': {'g': 6}}, 'h': 7}
+    data = {'a': 1, 'b': {'c': 2, 'd': [3]}, 'e': 4}
+    for change in diff_configs(old, new):
+        assert not agrees(data, change)
+        assert apply_change(data, change)
+        assert agrees(data, change)
+    assert diff_configs(data, new) == []
+    data['b']['f']['g'] = 0
+    assert new['b']['f']['g'] == 6
+
+
+def test_apply_change_needs_the_parent():
+    assert not apply_change({'a': 1}, ConfigChange(ADDED, ('a', 'b'), None, 2))
+    assert not apply_change({}, ConfigChange(CHANGED, ('x', 'y'), 1, 2))
+
+
+def test_path_conflicts_looks_up_and_down():
+    changes = [ConfigChange(CHANGED, ('a', 'b'), 1, 2),
+               ConfigChange(CHANGED, ('a', 'c', 'd'), 1, 2),
+               ConfigChange(ADDED, ('e',), None, 1)]
+    assert path_conflicts(changes, [('a', 'b')]) == changes[:1]
+    assert path_conflicts(changes, [('a',)]) == changes[:2]
+    assert path_conflicts(changes, [('a', 'c', 'd', 'f')]) == changes[1:2]
+    assert path_conflicts(changes, [('a', 'x')]) == []
+
+
+def test_summaries_and_lines():
+    changes = [ConfigChange(CHANGED, ('node', 'ros__parameters', 'rate'), 1, 2),
+               ConfigChange(ADDED, ('node', 'ros__parameters', 'gain'), None, {'k': 1}),
+               ConfigChange(REMOVED, ('node', 'ros__parameters', 'mode'), 'x', None)]
+    assert summarize_changes([]) == 'no changes'
+    assert summarize_changes(changes) == '1 changed, 1 added, 1 removed'
+    assert format_changes(changes) == ['~ rate: 1 -> 2', '+ gain: {1 keys}', '- mode']
+    assert format_changes(changes, limit=1) == ['~ rate: 1 -> 2', '... and 2 more']
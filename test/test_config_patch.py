@@ -0,0 +1,84 @@
+# Rewriting only the changed values of a config file.
+
+from rqt_fsw_bridge_config import yaml_backend
+from rqt_fsw_bridge_config.config_diff import diff_configs
+from rqt_fsw_bridge_config.config_patch import patch_changed_values
+
+CONTENT = b"""\
+# bridge settings
+node:
+  ros__parameters:
+    rate: 10   # Hz
+    name: "camera"
+    gains: [1, 2]
+    motor:
+      enabled: true
+"""
+
+
+def patch(content, edit):
+    old = yaml_backend.load(content)
+    new = yaml_backend.load(content)
+    edit(new['node']['ros__parameters'])
+    return patch_changed_values(content, new, diff_configs(old, new)), new
+
+
+def test_changed_values_are_replaced_in_place():
+    def edit(params):
+        params['rate'] = 20
+        params['gains'] = [3, 4, 5]
+        params['motor']['enabled'] = False
+    patched, new = patch(CONTENT, edit)
+    assert patched == CONTENT.replace(b'10', b'20').replace(b'[1, 2]', b'[3, 4, 5]') \
+        .replace(b'true', b'false')
+    assert yaml_backend.load(patched) == new
+
+
+def test_strings_are_quoted_as_needed():
+    def edit(params):
+        params['name'] = 'a: b'
+    patched, new = patch(CONTENT, edit)
+    assert b'# Hz' in patched
+    assert yaml_backend.load(patched) == new
+
+
+def test_non_ascii_content():
+    content = CONTENT.replace(b'# bridge settings', '# réglages'.encode())
+
+    def edit(params):
+        params['rate'] = 5
+    patched, new = patch(content, edit)
+    assert patched == content.replace(b'10', b'5')
+
+
+def test_added_or_removed_keys_are_not_patched():
+    def add(params):
+        params['extra'] = 1
+
+    def remove(params):
+        del params['rate']
+    assert patch(CONTENT, add)[0] is None
+    assert patch(CONTENT, remove)[0] is None
+
+
+def test_dicts_are_not_patched():
+    def edit(params):
+        params['rate'] = {'hz': 10}
+    assert patch(CONTENT, edit)[0] is None
+
+
+def test_no_changes_means_no_patch():
+    assert patch_changed_values(CONTENT, yaml_backend.load(CONTENT), []) is None
+
+
+def test_aliases_fall_back_to_a_full_dump():
+    content = b'a: &v 1\nb: *v\n'
+    old = yaml_backend.load(content)
+    new = {'a': 1, 'b': 2}
+    assert patch_changed_values(content, new, diff_configs(old, new)) is None
+
+
+def test_broken_yaml_falls_back_to_a_full_dump():
+    old = {'a': 1}
+    new = {'a': 2}
+    assert patch_changed_values(b'a: [1\n', new, diff_configs(old, new)) is None
@@ -0,0 +1,82 @@
+# Search modes of ConfigSearchIndex.
+
+import re
+
+import pytest
+
+from rqt_fsw_bridge_config.config_search import ConfigSearchIndex, display_name
+
+CONFIG = {
+    'node': {
+        'ros__parameters': {
+            'camera': {'rate': 10, 'mode': 'Fast'},
+            'cam_gain': 2.5,
+            'motor': {'rate': 100, 'enabled': True},
+        },
+    },
+}
+
+
+@pytest.fixture
+def index():
+    index = ConfigSearchIndex()
+    index.build(CONFIG)
+    return index
+
+
+def names(result):
+    paths, _ = result
+    return [display_name(path) for path in paths]
+
+
+def test_display_name_drops_the_node_and_ros_parameters():
+    assert display_name(('node', 'ros__parameters', 'camera', 'rate')) == 'camera.rate'
+    assert display_name(('top', 'key')) == 'top.key'
+
+
+def test_leaves_are_indexed(index):
+    assert len(index) == 5
+
+
+def test_substring_matches_names_and_values_ignoring_case(index):
+    assert names(index.search('RATE')) == ['camera.rate', 'motor.rate']
+    assert names(index.search('fast')) == ['camera.mode']
+    assert names(index.search('true')) == ['motor.enabled']
+
+
+def test_prefix_matches_names_only(index):
+    assert names(index.search('cam', 'prefix')) == ['cam_gain', 'camera.mode', 'camera.rate']
+    assert names(index.search('fast', 'prefix')) == []
+
+
+def test_regex(index):
+    assert names(index.search(r'^motor\.', 'regex')) == ['motor.enabled', 'motor.rate']
+    assert names(index.search(r'\t10+$', 'regex')) == ['camera.rate', 'motor.rate']
+    with pytest.raises(re.error):
+        index.search('(', 'regex')
+
+
+def test_regex_matches_each_entry_on_its_own(index):
+    assert names(index.search(r'fast\s+c', 'regex')) == []
+    assert names(index.search(r'[^q]{17,}', 'regex')) == ['motor.enabled']
+    assert names(index.search(r'rate\s+1', 'regex')) == ['camera.rate', 'motor.rate']
+
+
+def test_limit_reports_truncation(index):
+    assert index.search('a', limit=2) == (index.search('a')[0][:2], True)
+    assert index.search('gain', limit=2)[1] is False
+
+
+def test_updated_values_are_found(index):
+    path = ('node', 'ros__parameters', 'camera', 'mode')
+    assert index.update(path, 'Slow')
+    assert names(index.search('slow')) == ['camera.mode']
+    assert names(index.search('fast')) == []
+    assert not index.update(('node', 'missing'), 1)
+
+
+def test_updates_survive_a_rejoin(index):
+    index._rebuild_after = 0
+    index.update(('node', 'ros__parameters', 'cam_gain'), 7.25)
+    assert names(index.search('7.25')) == ['cam_gain']
+    assert names(index.search('2.5')) == []
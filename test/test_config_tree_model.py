@@ -0,0 +1,63 @@
+# Row bookkeeping of ConfigTreeModel, checked by QAbstractItemModelTester.
+# Needs python_qt_binding, but no running ROS graph.
+
+import pytest
+
+pytest.importorskip('python_qt_binding')
+
+from python_qt_binding.QtCore import QCoreApplication, QModelIndex  # noqa: E402
+from python_qt_binding.QtTest import QAbstractItemModelTester  # noqa: E402
+
+from rqt_fsw_bridge_config.config_tree_model import ConfigTreeModel  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def model(app):
+    model = ConfigTreeModel()
+    model.set_config({'n': {'k' + str(i): i for i in range(5)}})
+    # fails the test on any inconsistency between signals, rowCount and index
+    model.tester = QAbstractItemModelTester(
+        model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+    # like a view or proxy that fetches whatever it is told is there
+    model.rowsAboutToBeInserted.connect(lambda parent, first, last: fetch_all(model, parent))
+    fetch_all(model, QModelIndex())
+    fetch_all(model, model.index_for_path(('n',)))
+    return model
+
+
+def fetch_all(model, parent):
+    while model.canFetchMore(parent):
+        model.fetchMore(parent)
+
+
+def keys(model, path=('n',)):
+    parent = model.index_for_path(path)
+    return [model.data(model.index(row, 0, parent)) for row in range(model.rowCount(parent))]
+
+
+def test_insert_value_adds_one_row_in_order(model):
+    assert model.insert_value(('n', 'k10'), 10)
+    assert keys(model) == ['k0', 'k1', 'k10', 'k2', 'k3', 'k4']
+    assert model.config()['n']['k10'] == 10
+
+
+def test_remove_value_drops_the_row(model):
+    assert model.remove_value(('n', 'k2'))
+    assert keys(model) == ['k0', 'k1', 'k3', 'k4']
+    assert 'k2' not in model.config()['n']
+
+
+def test_replace_value_keeps_leaves_and_rebuilds_subtrees(model):
+    assert model.replace_value(('n', 'k1'), 7)
+    assert model.replace_value(('n', 'k3'), {'a': 1, 'b': 2})
+    assert keys(model) == ['k0', 'k1', 'k2', 'k3', 'k4']
+    assert model.config()['n']['k1'] == 7
+    fetch_all(model, model.index_for_path(('n', 'k3')))
+    assert keys(model, ('n', 'k3')) == ['a', 'b']
+    assert model.replace_value(('n', 'k5'), 5)
+    assert keys(model) == ['k0', 'k1', 'k2', 'k3', 'k4', 'k5']
@@ -0,0 +1,38 @@
+# Per-node parameter sets of a config file.
+
+from rqt_fsw_bridge_config.config_utils import node_parameters
+
+CONFIG = {
+    '/**': {'ros__parameters': {'rate': 1, 'log': {'level': 'info'}}},
+    'camera': {'ros__parameters': {'rate': 5}},
+    '/motor': {'ros__parameters': {'gain': 2}},
+    'notes': 'not a node section',
+}
+
+
+def test_wildcard_parameters_go_to_every_node_section():
+    assert node_parameters(CONFIG) == {
+        'camera': {'rate': 5, 'log.level': 'info'},
+        '/motor': {'rate': 1, 'log.level': 'info', 'gain': 2},
+    }
+
+
+def test_one_node_gets_its_section_and_the_wildcard():
+    assert node_parameters(CONFIG, '/camera') == {'/camera': {'rate': 5, 'log.level': 'info'}}
+    assert node_parameters(CONFIG, 'other') == {'other': {'rate': 1, 'log.level': 'info'}}
+
+
+def test_later_sections_win():
+    config = {'camera': {'ros__parameters': {'rate': 5}},
+              '/**': {'ros__parameters': {'rate': 1}}}
+    assert node_parameters(config) == {'camera': {'rate': 1}}
+
+
+def test_a_node_spelled_twice_is_one_target():
+    config = {'camera': {'ros__parameters': {'a': 1}},
+              '/camera': {'ros__parameters': {'b': 2}}}
+    assert node_parameters(config) == {'camera': {'a': 1, 'b': 2}}
+
+
+def test_a_wildcard_alone_names_no_node():
+    assert node_parameters({'/**': {'ros__parameters': {'a': 1}}}) == {}
@@ -0,0 +1,43 @@
+# Conversion of config values to parameter messages. Needs rcl_interfaces.
+
+import pytest
+
+pytest.importorskip('rcl_interfaces')
+
+from rcl_interfaces.msg import ParameterType  # noqa: E402
+
+from rqt_fsw_bridge_config.parameter_conversion import parse_list_text  # noqa: E402
+from rqt_fsw_bridge_config.parameter_conversion import parse_parameter_text  # noqa: E402
+from rqt_fsw_bridge_config.parameter_conversion import to_parameters  # noqa: E402
+from rqt_fsw_bridge_config.parameter_conversion import without_nulls  # noqa: E402
+
+
+def test_null_values_are_not_sent():
+    params = to_parameters({'a': 1, 'b': None, 'c': 'x'})
+    assert [p.name for p in params] == ['a', 'c']
+    assert all(p.value.type != ParameterType.PARAMETER_NOT_SET for p in params)
+
+
+def test_without_nulls_names_them():
+    values, nulls = without_nulls({'a': 1, 'b': None, 'c': [None]})
+    assert values == {'a': 1, 'c': [None]}
+    assert nulls == ['b']
+
+
+def test_without_nulls_keeps_the_dict_when_there_are_none():
+    values = {'a': 1}
+    assert without_nulls(values) == (values, [])
+    assert without_nulls(values)[0] is values
+
+
+def test_malformed_list_text_is_a_value_error():
+    with pytest.raises(ValueError):
+        parse_parameter_text('[1, 2', ParameterType.PARAMETER_INTEGER_ARRAY)
+    with pytest.raises(ValueError):
+        parse_list_text('{a: [1')
+
+
+def test_mixed_list_text_stays_a_list():
+    assert parse_list_text('[1, a, true]') == [1, 'a', True]
+    with pytest.raises(ValueError):
+        parse_list_text('a')
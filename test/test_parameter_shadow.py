@@ -0,0 +1,65 @@
+# Delta against the parameters known to be applied on the node.
+
+from rqt_fsw_bridge_config.config_diff import ADDED, CHANGED, REMOVED
+from rqt_fsw_bridge_config.parameter_shadow import ParameterShadow
+
+
+def seeded(values):
+    shadow = ParameterShadow()
+    shadow.seed(values)
+    return shadow
+
+
+def test_everything_is_new_to_an_empty_shadow():
+    delta = ParameterShadow().delta({'a': 1, 'b': 'x'})
+    assert delta.changed == {'a': 1, 'b': 'x'}
+    assert delta.removed == []
+    assert delta.skipped == 0
+
+
+def test_only_differing_values_are_sent():
+    shadow = seeded({'a': 1, 'b': [1, 2], 'c': 'x'})
+    delta = shadow.delta({'a': 1, 'b': [1, 3], 'c': 'x', 'd': True})
+    assert delta.changed == {'b': [1, 3], 'd': True}
+    assert delta.removed == []
+    assert delta.skipped == 2
+
+
+def test_values_are_compared_by_their_text():
+    shadow = seeded({'a': 1, 'b': [1, 2]})
+    assert shadow.delta({'a': 1.0, 'b': [1, 2]}).changed == {'a': 1.0}
+
+
+def test_pushed_names_missing_from_the_config_are_removed():
+    shadow = seeded({'a': 1})
+    shadow.commit('b', 2)
+    delta = shadow.delta({'a': 1})
+    assert delta.changed == {}
+    assert delta.removed == ['b']
+
+
+def test_node_only_names_are_not_removed():
+    shadow = seeded({'a': 1, 'use_sim_time': False, 'qos_overrides./x.depth': 10})
+    delta = shadow.delta({'a': 2})
+    assert delta.changed == {'a': 2}
+    assert delta.removed == []
+    assert [c.path for c in shadow.changes({'a': 2})] == [('a',)]
+
+
+def test_changes_are_config_diff_changes():
+    shadow = seeded({'a': 1})
+    shadow.commit('b', 2)
+    kinds = {c.path: c.kind for c in shadow.changes({'a': 3, 'c': 4})}
+    assert kinds == {('a',): CHANGED, ('b',): REMOVED, ('c',): ADDED}
+
+
+def test_commit_and_forget_move_the_baseline():
+    shadow = seeded({'a': 1, 'n': None})
+    assert 'n' not in shadow
+    shadow.commit('a', 2)
+    shadow.commit('b', 'y')
+    assert shadow.delta({'a': 2, 'b': 'y'}).changed == {}
+    shadow.forget('b')
+    assert shadow.delta({'a': 2, 'b': 'y'}).changed == {'b': 'y'}
+    shadow.clear()
+    assert len(shadow) == 0
@@ -0,0 +1,103 @@
+# Chunking and retries of ParameterTransfer, against a fake scheduler.
+# Needs python_qt_binding and rcl_interfaces, but no running ROS graph.
+
+import collections
+
+import pytest
+
+pytest.importorskip('python_qt_binding')
+pytest.importorskip('rcl_interfaces')
+
+from rcl_interfaces.msg import Parameter  # noqa: E402
+
+from rqt_fsw_bridge_config.parameter_transfer import ParameterTransfer  # noqa: E402
+
+Result = collections.namedtuple('Result', ['successful', 'reason'])
+Response = collections.namedtuple('Response', ['results'])
+
+
+class FakeScheduler:
+
+    def __init__(self):
+        # (request, callback, errback) in the order they were submitted
+        self.calls = []
+
+    def submit(self, client, request, callback=None, errback=None, **kwargs):
+        self.calls.append((request, callback, errback))
+
+    def answer(self, index, rejected=()):
+        request, callback, _ = self.calls[index]
+        callback(Response([Result(p.name not in rejected, 'rejected' if p.name in rejected else '')
+                           for p in request.parameters]))
+
+    def fail(self, index, reason='timed out'):
+        self.calls[index][2](reason)
+
+
+def parameters(count):
+    return [Parameter(name='p' + str(i)) for i in range(count)]
+
+
+def run_transfer(scheduler, count, **kwargs):
+    summaries = []
+    transfer = ParameterTransfer(scheduler, None, parameters(count), **kwargs)
+    transfer.finished.connect(summaries.append)
+    transfer.start()
+    return transfer, summaries
+
+
+def test_chunks_are_sent_within_the_window():
+    scheduler = FakeScheduler()
+    _, summaries = run_transfer(scheduler, 10, chunk_size=3, window=2)
+    assert [len(c[0].parameters) for c in scheduler.calls] == [3, 3]
+    scheduler.answer(0)
+    assert [len(c[0].parameters) for c in scheduler.calls] == [3, 3, 3]
+    for index in (1, 2):
+        scheduler.answer(index)
+    assert [len(c[0].parameters) for c in scheduler.calls] == [3, 3, 3, 1]
+    assert not summaries
+    scheduler.answer(3)
+    assert len(summaries) == 1
+    assert summaries[0].succeeded == 10
+    assert summaries[0].failures == {}
+    assert summaries[0].chunks == 4
+
+
+def test_rejected_parameters_are_retried_alone():
+    scheduler = FakeScheduler()
+    _, summaries = run_transfer(scheduler, 4, chunk_size=4)
+    scheduler.answer(0, rejected={'p1', 'p3'})
+    assert [p.name for p in scheduler.calls[1][0].parameters] == ['p1', 'p3']
+    scheduler.answer(1)
+    assert summaries[0].succeeded == 4
+    assert summaries[0].retried == 2
+    assert summaries[0].failures == {}
+
+
+def test_failures_are_final_after_the_last_retry():
+    scheduler = FakeScheduler()
+    _, summaries = run_transfer(scheduler, 2, chunk_size=2, max_retries=1)
+    scheduler.fail(0)
+    assert not summaries
+    scheduler.answer(1, rejected={'p0'})
+    assert len(scheduler.calls) == 2
+    assert summaries[0].succeeded == 1
+    assert summaries[0].failures == {'p0': 'rejected'}
+
+
+def test_cancel_fails_the_chunks_not_sent_yet():
+    scheduler = FakeScheduler()
+    transfer, summaries = run_transfer(scheduler, 6, chunk_size=2, window=1)
+    transfer.cancel('stopped')
+    scheduler.answer(0)
+    assert len(scheduler.calls) == 1
+    assert summaries[0].succeeded == 2
+    assert summaries[0].failures == {'p2': 'stopped', 'p3': 'stopped', 'p4': 'stopped',
+                                     'p5': 'stopped'}
+
+
+def test_an_empty_transfer_finishes_at_once():
+    scheduler = FakeScheduler()
+    _, summaries = run_transfer(scheduler, 0)
+    assert not scheduler.calls
+    assert summaries[0].total == 0
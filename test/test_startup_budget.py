@@ -0,0 +1,53 @@
+# Startup budget of the rqt plugin.
+#
+# Imports the widget module in a fresh interpreter, after the modules rqt has
+# loaded before any plugin, and checks what that adds. Needs a sourced ROS 2
+# workspace with fsw_ros2_bridge_msgs built, and is skipped otherwise.
+#
+# Import time depends on the machine, so the default budget is generous enough
+# for a loaded CI machine and only catches gross regressions. A quiet benchmark
+# machine can ask for a tighter one, and 0 turns the time check off:
+#
+#     RQT_FSW_BRIDGE_CONFIG_STARTUP_BUDGET_MS=200 python3 -m pytest test/test_startup_budget.py
+#
+# To see where the time goes:
+#
+#     python3 -m rqt_fsw_bridge_config.startup_profile
+
+import importlib.util
+import os
+
+import pytest
+
+_required = ['rclpy', 'python_qt_binding', 'rqt_gui_py', 'fsw_ros2_bridge_msgs',
+             'rqt_fsw_bridge_config']
+pytestmark = pytest.mark.skipif(any(importlib.util.find_spec(m) is None for m in _required),
+                                reason='needs a sourced ROS 2 workspace')
+
+# only needed once a config file is loaded or a bridge answers
+DEFERRED_MODULES = ['yaml', 'fsw_ros2_bridge_msgs']
+# ms importing the widget may add to an rqt that already runs
+DEFAULT_BUDGET_MS = 1000.0
+BUDGET_ENV_VAR = 'RQT_FSW_BRIDGE_CONFIG_STARTUP_BUDGET_MS'
+BUDGET_MS = float(os.environ.get(BUDGET_ENV_VAR) or DEFAULT_BUDGET_MS)
+
+
+@pytest.fixture(scope='module')
+def widget_import_times():
+    from rqt_fsw_bridge_config import startup_profile
+    return startup_profile.import_times()
+
+
+def test_widget_import_defers_modules(widget_import_times):
+    imported = {t.module.split('.')[0] for t in widget_import_times}
+    assert not imported & set(DEFERRED_MODULES), \
+        'imported when the widget is: ' + ', '.join(sorted(imported & set(DEFERRED_MODULES)))
+
+
+@pytest.mark.skipif(BUDGET_MS <= 0, reason=BUDGET_ENV_VAR + ' is 0')
+def test_widget_import_budget(widget_import_times):
+    from rqt_fsw_bridge_config import startup_profile
+    total = startup_profile.total_ms(widget_import_times)
+    assert total < BUDGET_MS, \
+        'importing the widget took %.1f ms:\n' % total + \
+        '\n'.join(startup_profile.format_times(widget_import_times, 10))